@@ -7,12 +7,17 @@ source_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source')
 if source_path not in sys.path:
     sys.path.append(source_path)
 
-# Direkt source paketinden ColorVisionAid sınıfını import et
-from source import ColorVisionAid
-from PyQt5.QtWidgets import QApplication
-
 def main():
     """Ana uygulamayı başlatan fonksiyon"""
+    # Ekransız sunucular için Qt yüklemeden toplu işleme modu
+    if len(sys.argv) > 1 and sys.argv[1] == "--headless":
+        from headless import main as headless_main
+        sys.exit(headless_main(sys.argv[2:]))
+
+    # Direkt source paketinden ColorVisionAid sınıfını import et
+    from source import ColorVisionAid
+    from PyQt5.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
     window = ColorVisionAid()
     window.show()
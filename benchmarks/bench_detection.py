@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+ColorDetector.process_frame ve draw_text_with_utf8 için tekrarlanabilir performans ölçümü
+
+Bilinen renkli şekiller içeren sentetik sahneler (sabit tohumla) üretilir;
+çözünürlük, etkin renk sayısı, blob sayısı ve etiket sayısı değiştirilerek her
+yapılandırma için işlem hızı (FPS) ve gecikme yüzdelikleri raporlanır.
+Sonuçlar JSON olarak kaydedilip daha önce kaydedilmiş bir temel (baseline)
+çalıştırmayla karşılaştırılabilir.
+
+Örnek:
+    python benchmarks/bench_detection.py --quick --output results.json
+    python benchmarks/bench_detection.py --baseline results.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import cv2
+import numpy as np
+
+# Source klasörünü import path'ine ekle
+source_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'source')
+if source_path not in sys.path:
+    sys.path.append(source_path)
+
+from color_detection import ColorDetector, COLOR_CLASSES
+from utils import draw_text_with_utf8, label_sprite_cache
+
+RESOLUTIONS = {
+    'vga': (640, 480),
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '4k': (3840, 2160)
+}
+
+# Renk aralıklarının içinde kalan BGR değerleri
+SCENE_COLORS = {
+    'red': (0, 0, 220),
+    'green': (0, 200, 0),
+    'blue': (220, 0, 0),
+    'yellow': (0, 220, 220)
+}
+
+def make_scene(width, height, colors, blob_count, label_count, seed=0):
+    """
+    Bilinen renkli şekiller içeren sentetik bir sahne üretir
+
+    Args:
+        width, height: Kare boyutu
+        colors: Şekillerde kullanılacak renk adları
+        blob_count: Toplam şekil sayısı
+        label_count: Bunlardan en küçük alan eşiğini aşan (etiketlenen) şekil sayısı
+        seed: Rastgele sayı tohumu
+
+    Returns:
+        OpenCV BGR formatında kare
+    """
+    rng = np.random.default_rng(seed)
+
+    # Düşük doygunluklu, dokulu arka plan (hiçbir renk aralığına girmez)
+    background = rng.integers(60, 120, (max(height // 16, 1), max(width // 16, 1)), dtype=np.uint8)
+    frame = cv2.cvtColor(cv2.resize(background, (width, height), interpolation=cv2.INTER_CUBIC),
+                         cv2.COLOR_GRAY2BGR)
+
+    # Etiketlenecek büyük şekiller kare alanının ~%0.5'i, diğerleri eşiğin altında kalır
+    large_radius = max(int(np.sqrt(0.005 * width * height / np.pi)), 4)
+    small_radius = max(int(np.sqrt(0.0005 * width * height / np.pi)), 1)
+    for index in range(blob_count):
+        color = SCENE_COLORS[colors[index % len(colors)]]
+        radius = large_radius if index < label_count else small_radius
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        if index % 2:
+            cv2.circle(frame, center, radius, color, -1)
+        else:
+            cv2.rectangle(frame, (center[0] - radius, center[1] - radius),
+                          (center[0] + radius, center[1] + radius), color, -1)
+    return frame
+
+def summarize(latencies):
+    """Gecikme listesinden FPS ve yüzdelikleri hesaplar (milisaniye)"""
+    latencies = np.asarray(latencies) * 1000.0
+    return {
+        'frames': int(latencies.size),
+        'fps': round(1000.0 / latencies.mean(), 2),
+        'mean_ms': round(float(latencies.mean()), 3),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+        'p90_ms': round(float(np.percentile(latencies, 90)), 3),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+        'max_ms': round(float(latencies.max()), 3)
+    }
+
+def time_calls(function, frames, warmup):
+    """function'ı warmup kez ısındırır, sonra frames kez ölçer"""
+    for _ in range(warmup):
+        function()
+    latencies = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def bench_process_frame(resolution, color_count, blob_count, label_count, args):
+    width, height = RESOLUTIONS[resolution]
+    colors = list(COLOR_CLASSES[:color_count])
+    frame = make_scene(width, height, colors, blob_count, label_count, seed=args.seed)
+    selected_colors = {color_name: color_name in colors for color_name in COLOR_CLASSES}
+
+    detector = ColorDetector()
+    detector.analysis_scale = args.analysis_scale
+    detector.parallel_strips = args.strips
+    detector.classification_mode = args.mode
+
+    latencies = time_calls(lambda: detector.process_frame(frame, selected_colors), args.frames, args.warmup)
+    labels = sum(len(detection['boxes']) for detection in detector.last_detections.values())
+    return {
+        'name': f"process_frame/{resolution}/colors={color_count}/blobs={blob_count}/labels={label_count}",
+        'config': {
+            'benchmark': 'process_frame',
+            'resolution': resolution,
+            'colors': color_count,
+            'blobs': blob_count,
+            'labels': label_count,
+            'detected_labels': labels,
+            'analysis_scale': args.analysis_scale,
+            'strips': args.strips,
+            'mode': args.mode
+        },
+        **summarize(latencies)
+    }
+
+def bench_draw_text(resolution, label_count, args):
+    width, height = RESOLUTIONS[resolution]
+    frame = make_scene(width, height, ['red'], 0, 0, seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    positions = [(int(rng.integers(0, width - 100)), int(rng.integers(25, height))) for _ in range(label_count)]
+    texts = [f"Green ({rng.uniform(50, 100):.1f}%)" for _ in range(label_count)]
+
+    def draw_labels():
+        for text, position in zip(texts, positions):
+            draw_text_with_utf8(frame, text, position, text_color=(0, 255, 0),
+                                font_size=16, stroke_color=(0, 0, 0), stroke_width=1)
+
+    label_sprite_cache.clear()
+    latencies = time_calls(draw_labels, args.frames, args.warmup)
+    return {
+        'name': f"draw_text/{resolution}/labels={label_count}",
+        'config': {
+            'benchmark': 'draw_text',
+            'resolution': resolution,
+            'labels': label_count
+        },
+        **summarize(latencies)
+    }
+
+def check_motion_gating(args, frames=30, radius=45, step=15):
+    """
+    Hareket kapısının küçük hareketli nesneleri kaçırmadığını doğrular
+
+    Durağan, dokulu bir arka planda küçük kırmızı bir top her karede step
+    piksel kaydırılır; kapı açık ve kapalıyken bulunan kutular aynı olmalıdır.
+
+    Returns:
+        Kutuların farklı olduğu kare sayısı
+    """
+    width, height = RESOLUTIONS['720p']
+    background = make_scene(width, height, ['red'], 0, 0, seed=args.seed)
+    selected_colors = {color_name: color_name == 'red' for color_name in COLOR_CLASSES}
+
+    gated, ungated = ColorDetector(), ColorDetector()
+    gated.motion_gating = True
+    mismatches = 0
+    for index in range(frames):
+        frame = background.copy()
+        cv2.circle(frame, (radius * 3 + step * index, height // 2), radius, SCENE_COLORS['red'], -1)
+        gated.process_frame(frame, selected_colors)
+        ungated.process_frame(frame, selected_colors)
+        if not np.array_equal(gated.last_detections['red']['boxes'], ungated.last_detections['red']['boxes']):
+            mismatches += 1
+    return mismatches
+
+def environment():
+    """Sonuçları karşılaştırırken gereken ortam bilgisi"""
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'opencv': cv2.__version__,
+        'opencv_threads': cv2.getNumThreads(),
+        'numpy': np.__version__
+    }
+
+def compare(results, baseline, threshold):
+    """
+    Sonuçları temel çalıştırmayla karşılaştırır ve tabloyu yazdırır
+
+    Returns:
+        p50 gecikmesi threshold oranından fazla kötüleşen yapılandırma sayısı
+    """
+    baseline_results = {result['name']: result for result in baseline.get('results', [])}
+    regressions = 0
+    print(f"\n{'benchmark':<60} {'base p50':>10} {'p50':>10} {'change':>8}")
+    for result in results:
+        base = baseline_results.get(result['name'])
+        if base is None:
+            print(f"{result['name']:<60} {'-':>10} {result['p50_ms']:>10.2f} {'new':>8}")
+            continue
+        change = result['p50_ms'] / base['p50_ms'] - 1.0
+        marker = ''
+        if change > threshold:
+            regressions += 1
+            marker = '  REGRESSION'
+        print(f"{result['name']:<60} {base['p50_ms']:>10.2f} {result['p50_ms']:>10.2f} {change:>+7.1%}{marker}")
+    return regressions
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the ColorVisionAid detection pipeline.")
+    parser.add_argument('--resolutions', default=','.join(RESOLUTIONS),
+                        help=f"comma separated subset of {', '.join(RESOLUTIONS)}")
+    parser.add_argument('--colors', default='1,2,4', help="numbers of enabled colors (default: 1,2,4)")
+    parser.add_argument('--blobs', default='10,200', help="numbers of blobs per scene (default: 10,200)")
+    parser.add_argument('--labels', default='5,40', help="numbers of labeled blobs per scene (default: 5,40)")
+    parser.add_argument('--frames', type=int, default=30, help="measured frames per configuration")
+    parser.add_argument('--warmup', type=int, default=3, help="unmeasured warm-up frames per configuration")
+    parser.add_argument('--seed', type=int, default=0, help="scene random seed")
+    parser.add_argument('--analysis-scale', type=float, default=1.0, help="ColorDetector.analysis_scale")
+    parser.add_argument('--strips', type=int, default=0, help="ColorDetector.parallel_strips")
+    parser.add_argument('--mode', default='hsv', choices=['hsv', 'bgr'], help="ColorDetector.classification_mode")
+    parser.add_argument('--quick', action='store_true', help="small matrix for a fast smoke run")
+    parser.add_argument('--check', action='store_true',
+                        help="run the correctness checks instead of benchmarking (exit status 1 on failure)")
+    parser.add_argument('--output', help="save results as JSON")
+    parser.add_argument('--baseline', help="compare against a previously saved JSON result")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="p50 slowdown counted as a regression (default: 0.10)")
+    return parser
+
+def parse_counts(text):
+    return [int(value) for value in text.split(',') if value.strip()]
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.quick:
+        args.resolutions, args.colors, args.blobs, args.labels = 'vga,1080p', '2', '20', '10'
+        args.frames = min(args.frames, 10)
+
+    resolutions = [name for name in args.resolutions.split(',') if name]
+    unknown = [name for name in resolutions if name not in RESOLUTIONS]
+    if unknown:
+        print(f"error: unknown resolutions: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    if args.check:
+        mismatches = check_motion_gating(args)
+        if mismatches:
+            print(f"error: motion gating kept stale detections for a moving object in {mismatches} frame(s)",
+                  file=sys.stderr)
+            return 1
+        print("motion gating check passed")
+        return 0
+
+    results = []
+    print(f"{'benchmark':<60} {'fps':>8} {'p50':>8} {'p90':>8} {'p99':>8}")
+    configurations = itertools.product(resolutions, parse_counts(args.colors),
+                                       parse_counts(args.blobs), parse_counts(args.labels))
+    for resolution, color_count, blob_count, label_count in configurations:
+        if label_count > blob_count:
+            continue
+        results.append(bench_process_frame(resolution, min(color_count, len(COLOR_CLASSES)),
+                                           blob_count, label_count, args))
+        result = results[-1]
+        print(f"{result['name']:<60} {result['fps']:>8.1f} {result['p50_ms']:>8.2f} "
+              f"{result['p90_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+
+    for resolution, label_count in itertools.product(resolutions, parse_counts(args.labels)):
+        results.append(bench_draw_text(resolution, label_count, args))
+        result = results[-1]
+        print(f"{result['name']:<60} {result['fps']:>8.1f} {result['p50_ms']:>8.2f} "
+              f"{result['p90_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+
+    report = {'environment': environment(), 'arguments': vars(args), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"\nresults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,16 @@ Modüller:
 - main: Ana uygulama ve UI mantığı
 - camera: Kamera yönetimi ve ilgili UI özellikleri
 - color_detection: Renk algılama algoritmaları
+- pipeline: Yakalama/işleme/görüntüleme iş parçacığı hattı
+- performance: Hız (FPS) ve uçtan uca gecikme ölçümü
+- headless: Qt gerektirmeyen toplu işleme komut satırı arayüzü
+- video_display: Kamera görüntüsünü çizen kalıcı widget
+- snapshots: Ekran görüntülerini arka planda yazan kuyruk
+- manifest: Ekran görüntülerinin kalıcı dizini (SQLite)
+- thumbnails: Galeri küçük resimlerinin disk önbelleği
+- exporter: Ekran görüntülerini paralel dışa aktarma (kopyalama veya dönüştürme)
+- burst: Seri çekim için önceden ayrılmış halka tampon
+- recorder: İşlenmiş görüntünün arka planda video kaydı
 - gallery: Ekran görüntüleri galerisi
 - translations: Çoklu dil desteği
 - utils: Yardımcı fonksiyonlar
@@ -0,0 +1,216 @@
+import threading
+import time
+import numpy as np
+
+# Varsayılan seri çekim uzunluğu (kare)
+BURST_FRAMES = 60
+
+# Halka tamponun varsayılan bellek sınırı (MB)
+BURST_MEMORY_MB = 256
+
+class FrameRingBuffer:
+    """
+    Son N kareyi önceden ayrılmış tek bir dizide tutan halka tampon
+
+    Tampon ilk karede (kare boyutu belli olunca) bir kez ayrılır; sonraki
+    her kare yalnızca sıradaki yuvaya kopyalanır, kare başına bellek
+    ayrılmaz. Yuva sayısı hem kare sınırına hem bellek sınırına göre
+    belirlenir. freeze() tamponu dondurur ve kareleri kopyalamadan (dizinin
+    görünümleri olarak) eskiden yeniye döndürür; release() çağrılana kadar
+    yeni kareler kaydedilmez.
+    """
+
+    def __init__(self, max_frames=BURST_FRAMES, memory_limit_mb=BURST_MEMORY_MB):
+        """
+        Args:
+            max_frames: Tutulacak en fazla kare sayısı
+            memory_limit_mb: Tamponun kullanabileceği en fazla bellek (MB)
+        """
+        self.max_frames = max_frames
+        self.memory_limit_mb = memory_limit_mb
+        self.enabled = False
+
+        self._lock = threading.Lock()
+        self._frames = None
+        self._times = None
+        self._head = 0
+        self._count = 0
+        self._frozen = False
+        self._release_pending = False
+
+    def configure(self, max_frames=None, memory_limit_mb=None):
+        """
+        Sınırları değiştir; tampon bir sonraki karede yeni boyutla ayrılır
+
+        Tampon donmuşken (seri çekim yazılırken) değişiklik release()'te uygulanır.
+        """
+        with self._lock:
+            if max_frames is not None:
+                self.max_frames = max(1, int(max_frames))
+            if memory_limit_mb is not None:
+                self.memory_limit_mb = max(1, int(memory_limit_mb))
+            self._release_memory()
+
+    def capacity(self, frame):
+        """Verilen boyuttaki kareler için sınırlara sığan yuva sayısı"""
+        limit = self.memory_limit_mb * 1024 * 1024 // max(frame.nbytes, 1)
+        return max(1, min(self.max_frames, limit))
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    @property
+    def count(self):
+        """Tampondaki kare sayısı"""
+        return self._count
+
+    @property
+    def nbytes(self):
+        """Tampon için ayrılmış bellek (bayt)"""
+        frames = self._frames
+        return frames.nbytes if frames is not None else 0
+
+    def record(self, frame, timestamp):
+        """
+        Kareyi tampona kopyala (yakalama iş parçacığından çağrılır)
+
+        Args:
+            frame: OpenCV BGR formatında kare
+            timestamp: Karenin yakalandığı an (time.perf_counter)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._frozen:
+                return
+            frames = self._frames
+            if frames is None or frames.shape[1:] != frame.shape or frames.dtype != frame.dtype:
+                # Kare boyutu değişince (ör. farklı kamera) tampon yeniden ayrılır
+                capacity = self.capacity(frame)
+                frames = self._frames = np.empty((capacity,) + frame.shape, frame.dtype)
+                self._times = np.empty(capacity)
+                self._head = 0
+                self._count = 0
+            np.copyto(frames[self._head], frame)
+            self._times[self._head] = timestamp
+            self._head = (self._head + 1) % len(frames)
+            self._count = min(self._count + 1, len(frames))
+
+    def freeze(self):
+        """
+        Kaydı durdur ve tampondaki kareleri döndür
+
+        Returns:
+            (kare, zaman damgası) listesi, eskiden yeniye; tampon boşsa veya
+            zaten dondurulmuşsa None. Kareler tamponun görünümleridir,
+            release() çağrılana kadar geçerlidir.
+        """
+        with self._lock:
+            if self._frozen or self._count == 0:
+                return None
+            self._frozen = True
+            capacity = len(self._frames)
+            start = (self._head - self._count) % capacity
+            slots = [(start + offset) % capacity for offset in range(self._count)]
+            return [(self._frames[slot], float(self._times[slot])) for slot in slots]
+
+    def release(self):
+        """Donmuş tamponu boşalt ve kayda devam et"""
+        with self._lock:
+            self._frozen = False
+            self._head = 0
+            self._count = 0
+            if self._release_pending:
+                self._release_memory()
+
+    def reset(self):
+        """Tampondaki kareleri unut (ayrılmış bellek korunur)"""
+        with self._lock:
+            if not self._frozen:
+                self._head = 0
+                self._count = 0
+
+    def clear(self):
+        """Tamponu boşalt ve belleği bırak"""
+        with self._lock:
+            self._release_memory()
+
+    def _release_memory(self):
+        # Donmuş tampon hâlâ yazılıyor olabilir; yazım bitince release() ile boşalır
+        if self._frozen:
+            self._release_pending = True
+            return
+        self._release_pending = False
+        self._frames = None
+        self._times = None
+        self._head = 0
+        self._count = 0
+
+class BurstCapture:
+    """
+    Seri çekim: son kareleri halka tamponda tutar, istendiğinde diske yazar
+
+    trigger() tamponu dondurur ve kareleri ayrı bir iş parçacığında
+    SnapshotWriter ile sırayla yazar; kayıt bu sürede durur ve yazım
+    bitince kaldığı yerden (boş tamponla) devam eder. Kareler normal
+    ekran görüntüleri gibi numaralanır ve dizine seri kimliği, karenin
+    seri içindeki sırası ve son kareye göre zamanıyla eklenir.
+    """
+
+    def __init__(self, snapshot_writer, on_complete=None):
+        """
+        Args:
+            snapshot_writer: Kareleri yazacak SnapshotWriter
+            on_complete: on_complete(yazılan kare sayısı, toplam kare, hata mesajı veya "");
+                yazıcı iş parçacığından çağrılır
+        """
+        self.buffer = FrameRingBuffer()
+        self.snapshot_writer = snapshot_writer
+        self.on_complete = on_complete
+        self._thread = None
+
+    def trigger(self, settings=None):
+        """
+        Tampondaki kareleri arka planda kaydet
+
+        Args:
+            settings: Her kareyle birlikte dizine kaydedilecek çekim ayarları
+
+        Returns:
+            (başlatıldı mı, kare sayısı veya hata mesajı)
+        """
+        if self.buffer.frozen:
+            return False, "Previous burst is still being saved"
+        frames = self.buffer.freeze()
+        if frames is None:
+            return False, "Burst buffer is empty"
+        self._thread = threading.Thread(target=self._flush, args=(frames, settings or {}),
+                                        name="cva-burst", daemon=True)
+        self._thread.start()
+        return True, len(frames)
+
+    def _flush(self, frames, settings):
+        saved = 0
+        error = ""
+        burst_id = time.strftime('%Y%m%d-%H%M%S')
+        last_time = frames[-1][1]
+        try:
+            for index, (frame, timestamp) in enumerate(frames):
+                frame_settings = dict(settings, burst=burst_id, burst_index=index,
+                                      burst_offset_ms=round((timestamp - last_time) * 1000.0, 1))
+                success, result = self.snapshot_writer.write(frame, frame_settings)
+                if success:
+                    saved += 1
+                elif not error:
+                    error = result
+        finally:
+            # Kareler yazıldı (ya da yazılamadı); tampon yeniden kullanılabilir
+            self.buffer.release()
+        if self.on_complete is not None:
+            self.on_complete(saved, len(frames), error)
+
+    def wait(self, timeout=None):
+        """Süren yazımın bitmesini bekle"""
+        if self._thread is not None:
+            self._thread.join(timeout)
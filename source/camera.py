@@ -1,6 +1,6 @@
 import os
+import time
 import cv2
-import glob
 import numpy as np
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget, QPushButton, QCheckBox, QHBoxLayout
 from PyQt5.QtCore import QSize, Qt
@@ -8,6 +8,8 @@ from PyQt5.QtGui import QPixmap
 
 # Paketin kendi modüllerini import et
 from .translations import translator as tr
+from .snapshots import SnapshotWriter
+from .burst import BurstCapture
 
 class CameraManager:
     def __init__(self, parent=None):
@@ -21,6 +23,15 @@ class CameraManager:
         self.camera_on = False
         self.cam = None
         self.current_frame = None
+        
+        # Son karenin okunduğu an (time.perf_counter), gecikme ölçümü için
+        self.frame_time = None
+        
+        # Ekran görüntüleri arka planda yazılır
+        self.snapshot_writer = SnapshotWriter()
+        
+        # Seri çekim için son kareler halka tamponda tutulur (etkinleştirilirse)
+        self.burst = BurstCapture(self.snapshot_writer)
     
     def start_camera(self):
         """Kamerayı başlat"""
@@ -40,12 +51,28 @@ class CameraManager:
             self.cam.release()
             self.camera_on = False
             self.current_frame = None
+            self.burst.buffer.reset()
             return True
         return False
     
-    def get_frame(self):
+    def grab_frame(self):
+        """
+        Kameradan bir kare yakala ama çözme (kod çözme retrieve_frame ile yapılır)
+        
+        Returns:
+            başarı durumu
+        """
+        if not self.camera_on:
+            return False
+            
+        ret = self.cam.grab()
+        if ret:
+            self.frame_time = time.perf_counter()
+        return ret
+    
+    def retrieve_frame(self):
         """
-        Kameradan bir kare al
+        Son yakalanan kareyi çöz
         
         Returns:
             (başarı durumu, kare)
@@ -53,46 +80,42 @@ class CameraManager:
         if not self.camera_on:
             return False, None
             
-        ret, frame = self.cam.read()
+        ret, frame = self.cam.retrieve()
         if ret:
             self.current_frame = frame.copy()
+            self.burst.buffer.record(frame, self.frame_time)
         return ret, frame
     
-    def take_snapshot(self):
+    def take_burst(self, settings=None):
+        """
+        Seri çekim tamponundaki son kareleri arka planda kaydet
+        
+        Args:
+            settings: Karelerle birlikte dizine kaydedilecek çekim ayarları
+        
+        Returns:
+            (başlatıldı mı, kare sayısı veya hata mesajı)
         """
-        Bir ekran görüntüsü al ve kaydet
+        return self.burst.trigger(settings)
+    
+    def take_snapshot(self, settings=None):
+        """
+        Bir ekran görüntüsü al ve arka planda kaydet
+        
+        Dosya snapshot_writer tarafından yazılır; yazım sonucu writer'ın
+        on_complete fonksiyonuyla bildirilir.
+        
+        Args:
+            settings: Görüntüyle birlikte dizine kaydedilecek çekim ayarları
         
         Returns:
-            (başarılı mı, dosya adı veya hata mesajı)
+            (kuyruğa alındı mı, hata mesajı veya "")
         """
         if not hasattr(self, 'current_frame') or self.current_frame is None:
             return False, "No frame available"
-                
-        # Ensure screenshots directory exists - ana klasör yerine source klasörünün üstünü kullan
-        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        screenshots_dir = os.path.join(root_dir, "screenshots")
-        if not os.path.exists(screenshots_dir):
-            os.makedirs(screenshots_dir)
         
-        # Find all PNG files in the screenshots directory that start with "screenshot_"
-        screenshot_files = glob.glob(os.path.join(screenshots_dir, "screenshot_*.png"))
-        next_num = 1
-        if screenshot_files:
-            # Extract numbers from existing files and find the maximum
-            existing_nums = []
-            for filename in screenshot_files:
-                try:
-                    base_filename = os.path.basename(filename)
-                    num = int(base_filename.replace("screenshot_", "").replace(".png", ""))
-                    existing_nums.append(num)
-                except ValueError:
-                    pass
-            if existing_nums:
-                next_num = max(existing_nums) + 1
-                
-        filename = os.path.join(screenshots_dir, f"screenshot_{next_num}.png")
-        cv2.imwrite(filename, self.current_frame)
-        return True, filename
+        # current_frame her karede yeni bir kopyadır, yazım bitene kadar değişmez
+        return self.snapshot_writer.submit(self.current_frame, settings)
 
 # Kamera arayüzü bileşenleri
 def create_camera_ui(parent, camera_feed_layout):
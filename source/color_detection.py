@@ -1,12 +1,205 @@
+import os
 import cv2
 import numpy as np
-from utils import draw_text_with_utf8
+from concurrent.futures import ThreadPoolExecutor
+from utils import draw_text_with_utf8, BufferPool, StageTimer
+
+# BGR formatında renk değerleri
+BOX_COLORS = {
+    'red': (0, 0, 255),
+    'green': (0, 255, 0),
+    'blue': (255, 0, 0),
+    'yellow': (0, 255, 255)
+}
+
+# Sınıf haritasında her rengin biti
+COLOR_CLASSES = ('red', 'green', 'blue', 'yellow')
+COLOR_CLASS_BITS = {color_name: 1 << i for i, color_name in enumerate(COLOR_CLASSES)}
+
+# Vurgu maskesini genişletme çekirdeği
+DILATE_KERNEL = np.ones((5, 5), np.uint8)
+DILATE_ITERATIONS = 2
+
+# Genişletmenin bir satırı etkileyebileceği en uzak komşu satır sayısı
+DILATE_HALO = DILATE_ITERATIONS * (DILATE_KERNEL.shape[0] // 2)
+
+# Paralel modda bir şeridin en az satır sayısı
+STRIP_MIN_ROWS = 64
+
+# Otomatik paralel modda en fazla şerit sayısı
+MAX_AUTO_STRIPS = 4
+
+def default_parallel_strips():
+    """Çekirdek sayısına göre şerit sayısı (tek çekirdekte 0, yani seri)"""
+    strips = min(os.cpu_count() or 1, MAX_AUTO_STRIPS)
+    return strips if strips > 1 else 0
+
+# Renk körlüğü benzetim matrisleri, RGB sırasıyla (Machado, Oliveira ve Fernandes 2009, tam şiddet)
+CVD_SIMULATION_MATRICES = {
+    'protanopia': np.array([[0.152286, 1.052583, -0.204868],
+                            [0.114503, 0.786281, 0.099216],
+                            [-0.003882, -0.048116, 1.051998]]),
+    'deuteranopia': np.array([[0.367322, 0.860646, -0.227968],
+                              [0.280085, 0.672501, 0.047413],
+                              [-0.011820, 0.042940, 0.968881]]),
+    'tritanopia': np.array([[1.255528, -0.076749, -0.178779],
+                            [-0.078411, 0.930809, 0.147602],
+                            [0.004733, 0.691367, 0.303900]])
+}
+
+# Renk düzeltmede (daltonizasyon) görülemeyen farkın aktarıldığı kanallar, RGB sırasıyla
+DALTONIZE_ERROR_SHIFTS = {
+    'protanopia': np.array([[0.0, 0.0, 0.0],
+                            [0.7, 1.0, 0.0],
+                            [0.7, 0.0, 1.0]]),
+    'deuteranopia': np.array([[0.0, 0.0, 0.0],
+                              [0.7, 1.0, 0.0],
+                              [0.7, 0.0, 1.0]]),
+    'tritanopia': np.array([[1.0, 0.0, 0.7],
+                            [0.0, 1.0, 0.7],
+                            [0.0, 0.0, 0.0]])
+}
+
+DISPLAY_MODES = ('normal', 'deuteranopia', 'protanopia', 'tritanopia')
+
+def display_mode_matrix(mode, simulate=False):
+    """
+    Gösterim modunun BGR kareye uygulanacak 3x3 renk matrisi
+    
+    Benzetim, renk körü bir gözün gördüğünü gösterir. Düzeltme,
+    benzetimde kaybolan farkı (orijinal - benzetim) görülebilen kanallara
+    aktarır: D = I + E (I - S). İkisi de tek bir doğrusal dönüşüm olduğu
+    için kare başına tek bir cv2.transform geçişiyle uygulanır. Matrisler
+    doğrusal RGB için tanımlıdır; gerçek zamanlı kullanım için doğrudan
+    gama kodlu değerlere uygulanır.
+    
+    Args:
+        mode: DISPLAY_MODES içinden bir mod
+        simulate: True ise benzetim, False ise düzeltme
+        
+    Returns:
+        float32 3x3 matris veya 'normal' modda None
+    """
+    if mode not in CVD_SIMULATION_MATRICES:
+        return None
+    simulation = CVD_SIMULATION_MATRICES[mode]
+    if simulate:
+        matrix = simulation
+    else:
+        matrix = np.eye(3) + DALTONIZE_ERROR_SHIFTS[mode] @ (np.eye(3) - simulation)
+    
+    # RGB matrisini BGR kanal sırasına çevir
+    return np.ascontiguousarray(matrix[::-1, ::-1], dtype=np.float32)
+
+class MotionGate:
+    """
+    Sahnenin son analiz edilen kareden bu yana değişip değişmediğini ucuzca ölçer
+    
+    Kare küçük renkli bir küçük resme indirgenir ve son analiz edilen karenin
+    küçük resmiyle piksel piksel karşılaştırılır. Ortalama fark küçük hareketli
+    nesneleri gizleyeceği için yerel bir ölçü kullanılır: herhangi bir kanalda
+    pixel_threshold'dan fazla değişen küçük resim pikseli sayısı changed_pixels'a
+    ulaşırsa sahne değişmiş sayılır. Renkli karşılaştırma, parlaklığı aynı kalıp
+    rengi değişen nesneleri de yakalar. Sahne durağansa önceki tespitler yeniden
+    kullanılabilir; yine de her refresh_interval karede bir tespit zorunlu
+    olarak yenilenir.
+    """
+    
+    def __init__(self, pixel_threshold=12, changed_pixels=1, refresh_interval=30, thumbnail_size=(64, 48)):
+        """
+        Args:
+            pixel_threshold: Bir küçük resim pikselinin değişmiş sayılması için 0-255
+                ölçeğinde kanal farkı eşiği
+            changed_pixels: Sahnenin değişmiş sayılması için gereken değişmiş piksel sayısı
+            refresh_interval: Sahne durağan olsa bile en fazla kaç karede bir tespit yapılır
+            thumbnail_size: Karşılaştırma için kullanılan (genişlik, yükseklik)
+        """
+        self.pixel_threshold = pixel_threshold
+        self.changed_pixels = changed_pixels
+        self.refresh_interval = refresh_interval
+        self.thumbnail_size = thumbnail_size
+        self._thumbnail = None
+        self._reference = None
+        self._key = None
+        self._frames_since_refresh = 0
+    
+    def is_static(self, frame, key):
+        """
+        Kare, son analiz edilen kareyle aynı sahneyi mi gösteriyor
+        
+        Args:
+            frame: OpenCV BGR formatında video karesi
+            key: Tespit sonucunu etkileyen ayarlar; değişirse sahne değişmiş sayılır
+            
+        Returns:
+            Önceki tespit yeniden kullanılabiliyorsa True
+        """
+        self._thumbnail = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        
+        if self._reference is None or key != self._key:
+            return False
+        if self._frames_since_refresh + 1 >= self.refresh_interval:
+            return False
+        
+        # Her pikselin kanallar arasındaki en büyük farkı
+        difference = cv2.absdiff(self._thumbnail, self._reference).max(axis=2)
+        if np.count_nonzero(difference > self.pixel_threshold) >= self.changed_pixels:
+            return False
+        
+        self._frames_since_refresh += 1
+        return True
+    
+    def mark_analyzed(self, key):
+        """Son is_static çağrısındaki kareyi yeni referans olarak kaydet"""
+        self._reference = self._thumbnail
+        self._key = key
+        self._frames_since_refresh = 0
+    
+    def reset(self):
+        self._reference = None
+        self._key = None
+        self._frames_since_refresh = 0
 
 class ColorDetector:
     def __init__(self):
+        # Sınıflandırma modu: 'hsv' (tam) veya 'bgr' (HSV dönüşümü olmadan, nicemlenmiş tablo)
+        self.classification_mode = 'hsv'
+        self.bgr_quantization_bits = 6
+        
+        # Çözünürlük başına yeniden kullanılan ara tamponlar
+        self.buffer_pool = BufferPool()
+        self.output_buffers = 3
+        self._output_index = 0
+        
+        # Büyük kareleri yatay şeritlere bölüp paralel işle (0 veya 1: seri)
+        self.parallel_strips = 0
+        self._executor = None
+        self._executor_workers = 0
+        self._strip_pools = []
+        
+        # Durağan sahnelerde tespiti atla ve önceki sonucu yeniden kullan
+        self.motion_gating = False
+        self.motion_gate = MotionGate()
+        self._gated_result = None
+        
         # Renk aralıkları tanımla
+        self._table_version = 0
         self.initialize_color_ranges()
-        self.min_contour_area = 500
+        
+        # En küçük bileşen alanı, kare alanının oranı olarak (640x480'de 500 piksel)
+        self.min_area_fraction = 500 / (640 * 480)
+        
+        # Tespitin yapılacağı çözünürlüğün tam çözünürlüğe oranı (0-1]
+        self.analysis_scale = 1.0
+        self.last_detections = {}
+        
+        # Renk körlüğü gösterim modu (tespit her zaman orijinal renkler üzerinde yapılır)
+        self.display_mode = 'normal'
+        self.simulate_cvd = False
+        self._display_matrix = None
+        
+        # Aşama süreleri (timer.enabled = True ile açılır, kapalıyken maliyeti yok denecek kadar azdır)
+        self.timer = StageTimer()
         
     def initialize_color_ranges(self):
         """HSV renk uzayında tespit edilecek renklerin aralıklarını tanımlar"""
@@ -32,8 +225,205 @@ class ColorDetector:
                 np.array([35, 255, 255])
             )
         }
+        self.compile_color_table()
+    
+    def set_color_range(self, name, lower, upper):
+        """
+        Bir renk aralığını günceller ve arama tablosunu yeniden derler
+        
+        Args:
+            name: Aralık adı ('red1', 'green' gibi)
+            lower: HSV alt sınırı
+            upper: HSV üst sınırı
+        """
+        self.color_ranges[name] = (np.array(lower), np.array(upper))
+        self.compile_color_table()
+    
+    def compile_color_table(self):
+        """
+        color_ranges sözlüğünü arama tablolarına derler
+        
+        Her HSV kanalı için 256 girişli bir bit maskesi tablosu oluşturulur: bir
+        değerin i. biti, değer i. aralığın o kanaldaki sınırları içindeyse 1'dir.
+        Üç kanalın bit maskelerinin kesişimi pikselin hangi aralıklarda olduğunu
+        verir, ikinci bir tablo da bunu renk sınıfı bitlerine (red1 + red2 -> red)
+        çevirir. Aralıklar değişmedikçe tablolar yeniden derlenmez.
+        """
+        if len(self.color_ranges) > 8:
+            raise ValueError("At most 8 color ranges are supported")
+        
+        values = np.arange(256)
+        channel_luts = [np.zeros(256, np.uint8) for _ in range(3)]
+        range_classes = []
+        for bit, (name, (lower, upper)) in enumerate(self.color_ranges.items()):
+            for channel, channel_lut in enumerate(channel_luts):
+                in_range = (values >= lower[channel]) & (values <= upper[channel])
+                channel_lut[in_range] |= 1 << bit
+            range_classes.append(COLOR_CLASS_BITS[name.rstrip('0123456789')])
+        
+        # Aralık bitlerinden renk sınıfı bitlerine geçiş tablosu
+        class_lut = np.zeros(256, np.uint8)
+        for bit, class_bit in enumerate(range_classes):
+            class_lut[(values & (1 << bit)) != 0] |= class_bit
+        
+        # Sınıf haritasından tek renk maskesine (0/255) geçiş tabloları
+        mask_luts = {}
+        for color_name, class_bit in COLOR_CLASS_BITS.items():
+            mask_luts[color_name] = np.where((values & class_bit) != 0, 255, 0).astype(np.uint8)
+        
+        self._table_version += 1
+        self._color_table = {
+            'channel_luts': channel_luts,
+            'class_lut': class_lut,
+            'mask_luts': mask_luts
+        }
+        self._color_table.update(self._compile_bgr_table())
+    
+    def _compile_bgr_table(self):
+        """
+        Nicemlenmiş BGR değerlerinden aralık bitlerine giden tabloyu oluşturur
+        
+        Tablo, her BGR hücresinin merkez rengi HSV yolundan geçirilerek çevrimdışı
+        hesaplanır; bu yüzden HSV aralıklarıyla aynı kaynaktan türetilir. Tablo
+        (n, n * n) boyutlu bir görüntü olarak saklanır (satır = B, sütun = G * n + R)
+        ve kareler cv2.remap ile sınıflandırılır.
+        """
+        bits = self.bgr_quantization_bits
+        shift = 8 - bits
+        levels = 1 << bits
+        
+        # Her hücrenin merkez rengi
+        centers = (np.arange(levels) << shift) + ((1 << shift) >> 1)
+        b, g, r = np.meshgrid(centers, centers, centers, indexing='ij')
+        cube = np.stack([b, g, r], axis=-1).astype(np.uint8).reshape(levels, levels * levels, 3)
+        bgr_table = self._hsv_range_codes(cv2.cvtColor(cube, cv2.COLOR_BGR2HSV)).copy()
+        
+        # Kanal değerlerini remap koordinatlarına çeviren tablolar
+        values = np.arange(256)
+        return {
+            'bgr_table': bgr_table,
+            'bgr_row_lut': (values >> shift).astype(np.int16),
+            'bgr_green_lut': ((values >> shift) << bits).astype(np.int16),
+            'bgr_red_lut': (values >> shift).astype(np.int16)
+        }
+    
+    def _hsv_range_codes(self, hsv, pool=None):
+        """HSV görüntüsündeki her piksel için aralık bitlerini hesaplar"""
+        # Her kanalı kendi tablosundan geçir ve aralık bitlerini kesiştir
+        pool = pool or self.buffer_pool
+        shape = hsv.shape[:2]
+        channel_luts = self._color_table['channel_luts']
+        channel = pool.get('hsv_channel', shape)
+        channel_codes = pool.get('channel_codes', shape)
+        range_codes = pool.get('range_codes', shape)
+        
+        cv2.LUT(cv2.extractChannel(hsv, 0, dst=channel), channel_luts[0], dst=range_codes)
+        for index in (1, 2):
+            cv2.extractChannel(hsv, index, dst=channel)
+            cv2.LUT(channel, channel_luts[index], dst=channel_codes)
+            cv2.bitwise_and(range_codes, channel_codes, dst=range_codes)
+        return range_codes
+    
+    def _range_codes_to_classes(self, range_codes, selected_colors, dst):
+        """Aralık bitlerini seçili renklerin sınıf bitlerine çevirir"""
+        selected_bits = 0
+        for color_name, class_bit in COLOR_CLASS_BITS.items():
+            if selected_colors.get(color_name, False):
+                selected_bits |= class_bit
+        
+        class_lut = self._color_table['class_lut'] & np.uint8(selected_bits)
+        return cv2.LUT(range_codes, class_lut, dst=dst)
+    
+    def classify_hsv(self, hsv, selected_colors, pool=None, dst=None):
+        """
+        HSV görüntüsünü tek geçişte renk sınıfı haritasına çevirir
+        
+        Args:
+            hsv: OpenCV HSV formatında görüntü
+            selected_colors: Dictionary (key=renk adı, value=bool seçili mi)
+            pool: Ara tamponların alınacağı BufferPool (varsayılan: buffer_pool)
+            dst: Sınıf haritasının yazılacağı tampon (varsayılan: havuzdaki 'label_map')
+            
+        Returns:
+            uint8 sınıf haritası; her seçili renk için COLOR_CLASS_BITS biti
+        """
+        pool = pool or self.buffer_pool
+        if dst is None:
+            dst = pool.get('label_map', hsv.shape[:2])
+        return self._range_codes_to_classes(self._hsv_range_codes(hsv, pool), selected_colors, dst)
+    
+    def classify_bgr(self, frame, selected_colors, pool=None, dst=None):
+        """
+        BGR karesini HSV dönüşümü yapmadan, nicemlenmiş tablo ile sınıflandırır
+        
+        Args:
+            frame: OpenCV BGR formatında video karesi
+            selected_colors: Dictionary (key=renk adı, value=bool seçili mi)
+            pool: Ara tamponların alınacağı BufferPool (varsayılan: buffer_pool)
+            dst: Sınıf haritasının yazılacağı tampon (varsayılan: havuzdaki 'label_map')
+            
+        Returns:
+            uint8 sınıf haritası; classify_hsv ile aynı biçimde
+        """
+        table = self._color_table
+        pool = pool or self.buffer_pool
+        shape = frame.shape[:2]
+        if dst is None:
+            dst = pool.get('label_map', shape)
+        channel = pool.get('bgr_channel', shape)
+        map_x = pool.get('bgr_map_x', shape, np.int16)
+        map_y = pool.get('bgr_map_y', shape, np.int16)
+        map_red = pool.get('bgr_map_red', shape, np.int16)
+        
+        # Tablo koordinatları: x = G * n + R, y = B
+        cv2.LUT(cv2.extractChannel(frame, 1, dst=channel), table['bgr_green_lut'], dst=map_x)
+        cv2.LUT(cv2.extractChannel(frame, 2, dst=channel), table['bgr_red_lut'], dst=map_red)
+        cv2.add(map_x, map_red, dst=map_x)
+        cv2.LUT(cv2.extractChannel(frame, 0, dst=channel), table['bgr_row_lut'], dst=map_y)
+        table_map = cv2.merge([map_x, map_y], dst=pool.get('bgr_table_map', shape + (2,), np.int16))
+        
+        range_codes = cv2.remap(table['bgr_table'], table_map, None, cv2.INTER_NEAREST,
+                                dst=pool.get('range_codes', shape))
+        return self._range_codes_to_classes(range_codes, selected_colors, dst)
+    
+    def classify(self, frame, selected_colors, pool=None, dst=None):
+        """Kareyi classification_mode ayarına göre sınıflandırır"""
+        if self.classification_mode == 'bgr':
+            return self.classify_bgr(frame, selected_colors, pool, dst)
+        pool = pool or self.buffer_pool
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=pool.get('hsv', frame.shape))
+        return self.classify_hsv(hsv, selected_colors, pool, dst)
+    
+    def measure_bgr_agreement(self, frame):
+        """
+        BGR tablosunun HSV yoluyla ne kadar uyuştuğunu ölçer
+        
+        Args:
+            frame: OpenCV BGR formatında örnek kare
+            
+        Returns:
+            Tüm renkler seçiliyken sınıf haritaları aynı olan piksellerin oranı (0-1)
+        """
+        all_colors = {color_name: True for color_name in COLOR_CLASSES}
+        hsv_classes = self.classify_hsv(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV), all_colors).copy()
+        bgr_classes = self.classify_bgr(frame, all_colors)
+        return float(np.count_nonzero(hsv_classes == bgr_classes)) / hsv_classes.size
+    
+    def set_display_mode(self, mode, simulate=False):
+        """
+        Gösterim modunu ayarla; matris burada bir kez hesaplanır
+        
+        Args:
+            mode: 'normal', 'deuteranopia', 'protanopia' veya 'tritanopia'
+            simulate: True ise renk körlüğü benzetimi, False ise renk düzeltme
+        """
+        if mode not in DISPLAY_MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
+        self.display_mode = mode
+        self.simulate_cvd = simulate
+        self._display_matrix = display_mode_matrix(mode, simulate)
     
-    def process_frame(self, frame, selected_colors, sensitivity=5, contrast=5, color_translations=None):
+    def process_frame(self, frame, selected_colors, sensitivity=5, contrast=5, color_translations=None, out=None):
         """
         Video karesini işler ve seçilen renkleri tespit eder
         
@@ -43,6 +433,7 @@ class ColorDetector:
             sensitivity: 1-10 arasında duyarlılık değeri
             contrast: 1-10 arasında kontrast değeri
             color_translations: Çevrilen renk isimlerini içeren sözlük
+            out: Sonucun yazılacağı kare boyutunda tampon (None ise dönüşümlü iç tampon)
             
         Returns:
             İşlenmiş video karesi
@@ -56,90 +447,421 @@ class ColorDetector:
                 'yellow': 'Yellow'
             }
         
-        # BGR'dan HSV'ye dönüştürme
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        timer = self.timer
+        with timer.stage('total'):
+            # Renkleri tespit et ve vurgulanacak bölgeyi bul; durağan sahnede öncekini kullan
+            if self.motion_gating:
+                key = self._detection_key(frame, selected_colors)
+                with timer.stage('motion_gate'):
+                    static = self.motion_gate.is_static(frame, key) and self._gated_result is not None
+                if static:
+                    highlight_mask, detections = self._gated_result
+                else:
+                    highlight_mask, detections = self.detect(frame, selected_colors)
+                    self.motion_gate.mark_analyzed(key)
+                    self._gated_result = (highlight_mask, detections)
+            else:
+                highlight_mask, detections = self.detect(frame, selected_colors)
+            self.last_detections = detections
+            
+            # Vurguyu ve koyulaştırmayı tek çıktı tamponunda birleştir
+            with timer.stage('composite'):
+                combined_result = self.composite(frame, highlight_mask, sensitivity, contrast, out)
+            
+            # Önce dikdörtgenleri, sonra metni çiz
+            with timer.stage('boxes'):
+                self.draw_boxes(combined_result, detections)
+            with timer.stage('labels'):
+                self.draw_labels(combined_result, detections, color_translations)
+                            
+        return combined_result
+    
+    def _detection_key(self, frame, selected_colors):
+        """Tespit sonucunu değiştiren ayarların özeti (hareket kapısı için)"""
+        selected = tuple(color_name for color_name in COLOR_CLASSES if selected_colors.get(color_name, False))
+        return (selected, frame.shape, self.analysis_scale, self.classification_mode,
+                self.min_area_fraction, self._table_version)
+    
+    def detect(self, frame, selected_colors):
+        """
+        Seçilen renkleri sınıflandırır ve bileşenlerini çıkarır
+        
+        analysis_scale 1'den küçükse eşikleme ve bileşen çıkarma küçültülmüş
+        bir kopya üzerinde yapılır; kutular ve vurgu maskesi tam çözünürlüğe
+        geri ölçeklenir.
+        
+        Args:
+            frame: OpenCV BGR formatında video karesi
+            selected_colors: Dictionary (key=renk adı, value=bool seçili mi)
+            
+        Returns:
+            (genişletilmiş vurgu maskesi, renk adı -> extract_components sonucu)
+        """
+        pool = self.buffer_pool
+        timer = self.timer
+        frame_h, frame_w = frame.shape[:2]
+        
+        # Analiz çözünürlüğüne küçült
+        scale = min(max(self.analysis_scale, 0.05), 1.0)
+        analysis_w = max(int(round(frame_w * scale)), 1)
+        analysis_h = max(int(round(frame_h * scale)), 1)
+        scaled = (analysis_w, analysis_h) != (frame_w, frame_h)
+        if scaled:
+            with timer.stage('downscale'):
+                analysis_frame = cv2.resize(frame, (analysis_w, analysis_h),
+                                            dst=pool.get('analysis_frame', (analysis_h, analysis_w, 3)),
+                                            interpolation=cv2.INTER_AREA)
+        else:
+            analysis_frame = frame
+        mask_shape = (analysis_h, analysis_w)
+        min_area = self.min_area_fraction * analysis_w * analysis_h
+        
+        if self._use_strips(analysis_h):
+            highlight_mask, detections = self._detect_strips(analysis_frame, selected_colors, min_area)
+        else:
+            # Tüm renkler için tek geçişte sınıf haritası oluştur
+            if self.classification_mode == 'bgr':
+                with timer.stage('classify'):
+                    label_map = self.classify_bgr(analysis_frame, selected_colors)
+            else:
+                with timer.stage('hsv_convert'):
+                    hsv = cv2.cvtColor(analysis_frame, cv2.COLOR_BGR2HSV, dst=pool.get('hsv', analysis_frame.shape))
+                with timer.stage('classify'):
+                    label_map = self.classify_hsv(hsv, selected_colors)
+            
+            # Her renk için bileşenleri bir kez çıkar, kutu ve etiketler aynı sonucu kullanır
+            with timer.stage('components'):
+                detections = {}
+                color_mask = pool.get('color_mask', mask_shape)
+                for color_name in COLOR_CLASSES:
+                    if selected_colors.get(color_name, False):
+                        cv2.LUT(label_map, self._color_table['mask_luts'][color_name], dst=color_mask)
+                        detections[color_name] = self.extract_components(color_mask, min_area)
+            
+            # Tüm maskeleri birleştir ve genişlet
+            with timer.stage('dilate'):
+                mask_combined = cv2.compare(label_map, 0, cv2.CMP_GT, dst=pool.get('mask_combined', mask_shape))
+                highlight_mask = cv2.dilate(mask_combined, DILATE_KERNEL, dst=pool.get('highlight_mask', mask_shape),
+                                            iterations=DILATE_ITERATIONS)
         
-        # Seçilen renkler için maskeler oluştur
-        masks = {}
-        if selected_colors.get('red', False):
-            mask_red1 = cv2.inRange(hsv, self.color_ranges['red1'][0], self.color_ranges['red1'][1])
-            mask_red2 = cv2.inRange(hsv, self.color_ranges['red2'][0], self.color_ranges['red2'][1])
-            masks['red'] = mask_red1 | mask_red2
+        if scaled:
+            # Sonuçları tam çözünürlüğe geri eşle
+            with timer.stage('upscale'):
+                highlight_mask = cv2.resize(highlight_mask, (frame_w, frame_h),
+                                            dst=pool.get('highlight_mask_full', (frame_h, frame_w)),
+                                            interpolation=cv2.INTER_NEAREST)
+                for color_name, detection in detections.items():
+                    detections[color_name] = self.rescale_components(
+                        detection, frame_w / analysis_w, frame_h / analysis_h)
         
-        if selected_colors.get('green', False):
-            masks['green'] = cv2.inRange(hsv, self.color_ranges['green'][0], self.color_ranges['green'][1])
+        return highlight_mask, detections
+    
+    def _use_strips(self, height):
+        """Kare, şeritlere bölünerek paralel işlenecek kadar büyük mü"""
+        return self.parallel_strips > 1 and height >= self.parallel_strips * STRIP_MIN_ROWS
+    
+    def _strip_bounds(self, height):
+        """Kareyi parallel_strips adet yatay şeride böler: [(y0, y1), ...]"""
+        edges = np.linspace(0, height, self.parallel_strips + 1).astype(int).tolist()
+        return list(zip(edges[:-1], edges[1:]))
+    
+    def _strip_executor(self):
+        """Şerit işleri için iş parçacığı havuzunu (gerekirse yeniden) oluşturur"""
+        if self._executor is None or self._executor_workers != self.parallel_strips:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=self.parallel_strips,
+                                                thread_name_prefix="cva-strip")
+            self._executor_workers = self.parallel_strips
+            self._strip_pools = [BufferPool() for _ in range(self.parallel_strips)]
+        return self._executor
+    
+    def _detect_strips(self, frame, selected_colors, min_area):
+        """
+        detect() işini yatay şeritlere bölerek iş parçacığı havuzunda yapar
         
-        if selected_colors.get('blue', False):
-            masks['blue'] = cv2.inRange(hsv, self.color_ranges['blue'][0], self.color_ranges['blue'][1])
+        Sınıflandırma piksel bazlı olduğundan şeritler bağımsızdır. Genişletme,
+        çekirdeğin etki yarıçapı kadar komşu satırla (halo) yapılır ve yalnızca
+        şeridin kendi satırları alınır. Şerit sınırında kesilen bileşenler
+        _stitch_components ile birleştirilir; sonuç seri yolla birebir aynıdır.
+        """
+        executor = self._strip_executor()
+        pool = self.buffer_pool
+        height = frame.shape[0]
+        mask_shape = frame.shape[:2]
+        bounds = self._strip_bounds(height)
+        colors = [color_name for color_name in COLOR_CLASSES if selected_colors.get(color_name, False)]
         
-        if selected_colors.get('yellow', False):
-            masks['yellow'] = cv2.inRange(hsv, self.color_ranges['yellow'][0], self.color_ranges['yellow'][1])
+        label_map = pool.get('label_map', mask_shape)
+        mask_combined = pool.get('mask_combined', mask_shape)
+        highlight_mask = pool.get('highlight_mask', mask_shape)
         
-        # Tüm maskeleri birleştir
-        mask_combined = np.zeros_like(hsv[:, :, 0])
-        for color, mask in masks.items():
-            mask_combined = mask_combined | mask
+        def classify_strip(index):
+            y0, y1 = bounds[index]
+            strip_pool = self._strip_pools[index]
+            strip_labels = self.classify(frame[y0:y1], selected_colors, strip_pool, label_map[y0:y1])
+            cv2.compare(strip_labels, 0, cv2.CMP_GT, dst=mask_combined[y0:y1])
+            
+            # Her renk için şeridin bileşenleri ve dikiş satırlarındaki etiketler
+            components = {}
+            color_mask = strip_pool.get('color_mask', strip_labels.shape)
+            labels = strip_pool.get('component_labels', strip_labels.shape, np.int32)
+            for color_name in colors:
+                cv2.LUT(strip_labels, self._color_table['mask_luts'][color_name], dst=color_mask)
+                _, _, stats, _ = cv2.connectedComponentsWithStats(color_mask, labels=labels, connectivity=8)
+                components[color_name] = (stats, labels[0].copy(), labels[-1].copy())
+            return components
         
-        # Maskeleri genişlet
-        kernel = np.ones((5, 5), np.uint8)
-        mask_combined = cv2.dilate(mask_combined, kernel, iterations=2)
+        def dilate_strip(index):
+            y0, y1 = bounds[index]
+            halo_top = max(y0 - DILATE_HALO, 0)
+            halo_bottom = min(y1 + DILATE_HALO, height)
+            source = mask_combined[halo_top:halo_bottom]
+            dilated = cv2.dilate(source, DILATE_KERNEL,
+                                 dst=self._strip_pools[index].get('dilated', source.shape),
+                                 iterations=DILATE_ITERATIONS)
+            highlight_mask[y0:y1] = dilated[y0 - halo_top:y1 - halo_top]
         
-        # Renkleri filtrele
-        result = cv2.bitwise_and(frame, frame, mask=mask_combined)
+        # Şeritler paralel çalıştığından aşamalar şerit başına değil, toplu ölçülür
+        timer = self.timer
+        with timer.stage('strip_classify'):
+            strip_components = list(executor.map(classify_strip, range(len(bounds))))
         
-        # Maskelenmiş renklerin canlılığını duyarlılığa göre ayarla
-        sensitivity = sensitivity * 20 + 40  # 1-10 değerlerini 60-240 aralığına eşle
-        result[np.where((result != [0, 0, 0]).all(axis=2))] = [sensitivity, sensitivity, sensitivity]
+        # Genişletme komşu şeritlerin maskelerine ihtiyaç duyar; dikişler bu sırada birleştirilir
+        dilation = list(map(lambda index: executor.submit(dilate_strip, index), range(len(bounds))))
+        with timer.stage('strip_stitch'):
+            detections = {}
+            for color_name in colors:
+                detections[color_name] = self._stitch_components(
+                    [components[color_name] for components in strip_components], bounds, min_area)
+        with timer.stage('strip_dilate_wait'):
+            for future in dilation:
+                future.result()
+        
+        return highlight_mask, detections
+    
+    def _stitch_components(self, strip_components, bounds, min_area):
+        """
+        Şerit bazlı bileşen istatistiklerini tüm karenin bileşenlerine birleştirir
+        
+        Args:
+            strip_components: Her şerit için (stats, ilk satır etiketleri, son satır etiketleri)
+            bounds: Şeritlerin (y0, y1) sınırları
+            min_area: Piksel cinsinden en küçük bileşen alanı
+            
+        Returns:
+            extract_components ile aynı biçimde sözlük
+        """
+        # Her şeridin bileşenlerine küresel numara ver (arka plan hariç)
+        offsets = []
+        stats_list = []
+        total = 0
+        for (stats, _, _), (y0, _) in zip(strip_components, bounds):
+            offsets.append(total)
+            strip_stats = stats[1:].copy()
+            strip_stats[:, cv2.CC_STAT_TOP] += y0
+            stats_list.append(strip_stats)
+            total += len(strip_stats)
+        stats = np.concatenate(stats_list) if stats_list else np.zeros((0, 5), np.int32)
+        
+        # Dikiş boyunca 8-komşuluk ile dokunan bileşenleri birleştir (union-find)
+        parent = np.arange(total)
+        
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+        
+        for index in range(len(strip_components) - 1):
+            upper = strip_components[index][2]
+            lower = strip_components[index + 1][1]
+            pairs = []
+            for upper_part, lower_part in ((upper, lower), (upper[1:], lower[:-1]), (upper[:-1], lower[1:])):
+                touching = (upper_part > 0) & (lower_part > 0)
+                pairs.append(np.stack([upper_part[touching] - 1 + offsets[index],
+                                       lower_part[touching] - 1 + offsets[index + 1]], axis=1))
+            for a, b in np.unique(np.concatenate(pairs), axis=0).tolist():
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
         
-        # Orijinal kareyi koyulaştır
+        # Kökleri vektörel olarak bul: her düğüm köküne ulaşana kadar atla
+        roots = parent
+        while True:
+            next_roots = roots[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+        _, groups = np.unique(roots, return_inverse=True)
+        group_count = groups.max() + 1 if total else 0
+        
+        # Birleşen bileşenlerin kutularını ve alanlarını topla
+        left = np.full(group_count, np.iinfo(np.int32).max, np.int64)
+        top = np.full(group_count, np.iinfo(np.int32).max, np.int64)
+        right = np.zeros(group_count, np.int64)
+        bottom = np.zeros(group_count, np.int64)
+        areas = np.zeros(group_count, np.int64)
+        np.minimum.at(left, groups, stats[:, cv2.CC_STAT_LEFT])
+        np.minimum.at(top, groups, stats[:, cv2.CC_STAT_TOP])
+        np.maximum.at(right, groups, stats[:, cv2.CC_STAT_LEFT] + stats[:, cv2.CC_STAT_WIDTH])
+        np.maximum.at(bottom, groups, stats[:, cv2.CC_STAT_TOP] + stats[:, cv2.CC_STAT_HEIGHT])
+        np.add.at(areas, groups, stats[:, cv2.CC_STAT_AREA])
+        
+        boxes = np.stack([left, top, right - left, bottom - top], axis=1).astype(np.int32)
+        return self._finalize_components(boxes, areas.astype(np.int32), min_area)
+    
+    def composite(self, frame, highlight_mask, sensitivity=5, contrast=5, out=None):
+        """
+        Kareyi koyulaştırır ve maskelenen bölgeleri gri vurguyla birleştirir
+        
+        Gösterim modu seçiliyse renk dönüşümü koyulaştırmayla aynı geçişte
+        uygulanır (matris koyulaştırma katsayısıyla ölçeklenir); gri vurgu
+        her iki dönüşümde de gri kaldığı için sonuç aynıdır. Kutular ve
+        etiketler bundan sonra çizildiği için renkleri değişmez.
+        
+        out verilmezse sonuç, dönüşümlü kullanılan çıktı tamponlarından birine
+        yazılır; böylece kararlı durumda kare başına yeni bellek ayrılmaz.
+        Döndürülen dizi output_buffers kare boyunca geçerlidir.
+        
+        Args:
+            frame: OpenCV BGR formatında video karesi
+            highlight_mask: Vurgulanacak pikselleri gösteren tek kanallı maske
+            sensitivity: 1-10 arasında duyarlılık değeri
+            contrast: 1-10 arasında kontrast değeri
+            out: Sonucun yazılacağı kare boyutunda tampon
+            
+        Returns:
+            Birleştirilmiş kare
+        """
+        if out is not None:
+            combined_result = out
+        else:
+            self._output_index = (self._output_index + 1) % self.output_buffers
+            combined_result = self.buffer_pool.get(f'output{self._output_index}', frame.shape)
+        
+        # Orijinal kareyi koyulaştır, sonuç ağırlığıyla (0.7) ölçekle
         contrast_value = contrast / 10  # 1-10 değerlerini 0.1-1.0 aralığına eşle
-        darkened_frame = cv2.addWeighted(frame, contrast_value, np.zeros_like(frame), 1-contrast_value, 0)
+        alpha = 0.7 * contrast_value
         
-        # Sonuçları birleştir
-        combined_result = cv2.addWeighted(darkened_frame, 0.7, result, 0.3, 0)
+        # Maskelenmiş renklerin canlılığını duyarlılığa göre ayarla, ağırlığıyla (0.3) ekle
+        sensitivity = sensitivity * 20 + 40  # 1-10 değerlerini 60-240 aralığına eşle
+        highlight = round(0.3 * sensitivity)
         
-        # BGR formatında renk değerleri
-        colors = {
-            'red': (0, 0, 255) if selected_colors.get('red', False) else None,
-            'green': (0, 255, 0) if selected_colors.get('green', False) else None,
-            'blue': (255, 0, 0) if selected_colors.get('blue', False) else None,
-            'yellow': (0, 255, 255) if selected_colors.get('yellow', False) else None
-        }
+        # Gösterim modu matrisi koyulaştırma katsayısıyla birleştirilir
+        matrix = self._display_matrix
+        if matrix is not None:
+            matrix = matrix * np.float32(alpha)
+        
+        height = frame.shape[0]
+        if self._use_strips(height):
+            def composite_strip(bounds):
+                y0, y1 = bounds
+                self._composite_rows(frame[y0:y1], highlight_mask[y0:y1], combined_result[y0:y1], alpha, highlight,
+                                     matrix)
+            list(self._strip_executor().map(composite_strip, self._strip_bounds(height)))
+        else:
+            self._composite_rows(frame, highlight_mask, combined_result, alpha, highlight, matrix)
         
-        # Önce dikdörtgenleri çiz
-        for color_name, mask in masks.items():
-            if colors[color_name] is not None:
-                contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                for contour in contours:
-                    if cv2.contourArea(contour) > self.min_contour_area:
-                        x, y, w, h = cv2.boundingRect(contour)
-                        # Dikdörtgen çiz
-                        cv2.rectangle(combined_result, (x, y), (x + w, y + h), colors[color_name], 2)
-        
-        # Sonra metni çiz
-        for color_name, mask in masks.items():
-            if colors[color_name] is not None:
-                contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                for contour in contours:
-                    if cv2.contourArea(contour) > self.min_contour_area:
-                        x, y, w, h = cv2.boundingRect(contour)
-                        mask_contour = mask[y:y+h, x:x+w]
-                        contour_area = cv2.contourArea(contour)
-                        mask_area = np.sum(mask_contour > 0)
-                        accuracy = min((mask_area / contour_area) * 100, 100)
-                        
-                        # Renk adı ve doğruluk yüzdesi metni oluştur
-                        text = f"{color_translations.get(color_name, color_name)} ({accuracy:.1f}%)"
-                        
-                        # UTF-8 metin çizim fonksiyonunu kullan
-                        combined_result = draw_text_with_utf8(
-                            combined_result,
-                            text,
-                            (x, y - 25),  # Metni dikdörtgenin üzerinde konumlandır
-                            text_color=colors[color_name],
-                            font_size=16,
-                            stroke_color=(0, 0, 0),  # Siyah dış çizgi
-                            stroke_width=1
-                        )
-                            
         return combined_result
+    
+    def _composite_rows(self, frame, highlight_mask, out, alpha, highlight, matrix=None):
+        """composite() işlemini verilen satırlar üzerinde yerinde yapar"""
+        if matrix is None:
+            cv2.convertScaleAbs(frame, dst=out, alpha=alpha)
+        else:
+            cv2.transform(frame, matrix, dst=out)
+        cv2.add(out, (highlight, highlight, highlight, 0), dst=out, mask=highlight_mask)
+    
+    def extract_components(self, mask, min_area):
+        """
+        Maskedeki bağlı bileşenleri tek geçişte çıkarır
+        
+        Args:
+            mask: Tek kanallı uint8 renk maskesi
+            min_area: Piksel cinsinden en küçük bileşen alanı
+            
+        Returns:
+            Sözlük: 'boxes' (N, 4) x, y, w, h dizisi, 'areas' (N,) piksel alanları,
+            'fill_ratios' (N,) bileşen alanının kutu alanına oranı
+        """
+        labels = self.buffer_pool.get('component_labels', mask.shape, np.int32)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(mask, labels=labels, connectivity=8)
+        
+        # 0 etiketi arka plandır
+        stats = stats[1:]
+        return self._finalize_components(stats[:, :4], stats[:, cv2.CC_STAT_AREA], min_area)
+    
+    def _finalize_components(self, boxes, areas, min_area):
+        """
+        Küçük bileşenleri eler, doluluk oranlarını hesaplar ve sırayı sabitler
+        
+        Bileşenler (y, x, w, h, alan) sırasına göre dizilir; böylece sonuç
+        etiketleme algoritmasının numaralandırma sırasına bağlı kalmaz.
+        """
+        keep = areas > min_area
+        boxes = boxes[keep]
+        areas = areas[keep]
+        order = np.lexsort((areas, boxes[:, 3], boxes[:, 2], boxes[:, 0], boxes[:, 1]))
+        boxes = boxes[order]
+        areas = areas[order]
+        fill_ratios = areas / (boxes[:, 2] * boxes[:, 3]).astype(np.float64)
+        
+        return {
+            'boxes': boxes,
+            'areas': areas,
+            'fill_ratios': fill_ratios
+        }
+    
+    def rescale_components(self, detection, scale_x, scale_y):
+        """
+        Analiz çözünürlüğündeki bileşenleri tam çözünürlüğe ölçekler
+        
+        Args:
+            detection: extract_components sonucu
+            scale_x: Yatay ölçek (tam genişlik / analiz genişliği)
+            scale_y: Dikey ölçek (tam yükseklik / analiz yüksekliği)
+            
+        Returns:
+            Aynı biçimde, tam çözünürlük koordinatlarında sözlük
+        """
+        boxes = detection['boxes']
+        left = np.floor(boxes[:, 0] * scale_x)
+        top = np.floor(boxes[:, 1] * scale_y)
+        right = np.ceil((boxes[:, 0] + boxes[:, 2]) * scale_x)
+        bottom = np.ceil((boxes[:, 1] + boxes[:, 3]) * scale_y)
+        scaled_boxes = np.stack([left, top, right - left, bottom - top], axis=1).astype(boxes.dtype)
+        
+        return {
+            'boxes': scaled_boxes,
+            'areas': np.round(detection['areas'] * (scale_x * scale_y)).astype(detection['areas'].dtype),
+            'fill_ratios': detection['fill_ratios']
+        }
+    
+    def draw_boxes(self, image, detections):
+        """Tespit edilen bileşenlerin etrafına renk dikdörtgenleri çizer"""
+        for color_name, detection in detections.items():
+            color = BOX_COLORS[color_name]
+            for x, y, w, h in detection['boxes'].tolist():
+                cv2.rectangle(image, (x, y), (x + w, y + h), color, 2)
+    
+    def draw_labels(self, image, detections, color_translations):
+        """Tespit edilen bileşenlerin üzerine renk adı ve doluluk yüzdesini yazar"""
+        for color_name, detection in detections.items():
+            color = BOX_COLORS[color_name]
+            name = color_translations.get(color_name, color_name)
+            percentages = np.minimum(detection['fill_ratios'] * 100, 100).tolist()
+            for (x, y, _, _), accuracy in zip(detection['boxes'].tolist(), percentages):
+                # Renk adı ve doğruluk yüzdesi metni oluştur
+                text = f"{name} ({accuracy:.1f}%)"
+                
+                # UTF-8 metin çizim fonksiyonunu kullan
+                draw_text_with_utf8(
+                    image,
+                    text,
+                    (x, y - 25),  # Metni dikdörtgenin üzerinde konumlandır
+                    text_color=color,
+                    font_size=16,
+                    stroke_color=(0, 0, 0),  # Siyah dış çizgi
+                    stroke_width=1
+                )
@@ -0,0 +1,154 @@
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+
+# Paketin kendi modüllerini import et
+from .snapshots import SNAPSHOT_FORMATS, DEFAULT_FORMAT_LEVELS
+
+# Uzantıların gösterdiği biçimler (.jpg ve .jpeg aynı biçimdir)
+FORMAT_EXTENSIONS = {
+    '.png': 'png',
+    '.jpg': 'jpg',
+    '.jpeg': 'jpg',
+    '.webp': 'webp'
+}
+
+def image_format(path):
+    """Dosya uzantısından biçim adı ('png', 'jpg', 'webp' veya bilinmiyorsa None)"""
+    return FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+def needs_transcode(source, destination):
+    """Hedef uzantı kaynakla aynı biçimi göstermiyorsa True"""
+    source_format = image_format(source)
+    return source_format is None or source_format != image_format(destination)
+
+def export_file(source, destination):
+    """
+    Tek bir ekran görüntüsünü dışa aktar
+
+    Biçim aynıysa dosya bayt bayt kopyalanır (kodlama yok, içerik değişmez);
+    değilse görüntü çözülüp hedef biçimde yeniden kodlanır.
+
+    Args:
+        source: Kaynak dosya yolu
+        destination: Hedef dosya yolu (biçim uzantıdan seçilir)
+    """
+    if not needs_transcode(source, destination):
+        shutil.copy2(source, destination)
+        return
+
+    image = cv2.imread(source, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise IOError(f"Cannot read {source}")
+    target_format = image_format(destination)
+    parameters = []
+    if target_format is not None:
+        _, parameter = SNAPSHOT_FORMATS[target_format]
+        parameters = [parameter, DEFAULT_FORMAT_LEVELS[target_format]]
+    if not cv2.imwrite(destination, image, parameters):
+        raise IOError(f"Cannot write {destination}")
+
+def unique_destination(directory, filename, taken=None):
+    """
+    Klasörde (ve taken kümesinde) bulunmayan bir hedef yol üret
+
+    Args:
+        directory: Hedef klasör
+        filename: İstenen dosya adı; varsa sonuna _1, _2 ... eklenir
+        taken: Bu dışa aktarımda zaten ayrılmış yollar (güncellenir)
+    """
+    taken = taken if taken is not None else set()
+    stem, extension = os.path.splitext(filename)
+    path = os.path.join(directory, filename)
+    counter = 1
+    while path in taken or os.path.exists(path):
+        path = os.path.join(directory, f"{stem}_{counter}{extension}")
+        counter += 1
+    taken.add(path)
+    return path
+
+class ScreenshotExporter:
+    """
+    Birden çok ekran görüntüsünü bir iş parçacığı havuzunda dışa aktarır
+
+    Her dosya ayrı bir iş olarak havuza verilir; kopyalama ve yeniden
+    kodlama (OpenCV GIL'i bırakır) paralel çalışır. İlerleme ve sonuç
+    fonksiyonları havuz iş parçacıklarından çağrılır. cancel() henüz
+    başlamamış işleri iptal eder; başlamış olanlar tamamlanır.
+    """
+
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers: Havuzdaki iş parçacığı sayısı (varsayılan: çekirdek sayısı, en fazla 4)
+        """
+        self._executor = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="cva-export")
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._closed = False
+        self._futures = []
+
+    def start(self, jobs, on_progress=None, on_finished=None):
+        """
+        Dışa aktarımı başlat
+
+        Args:
+            jobs: (kaynak yol, hedef yol) listesi
+            on_progress: on_progress(biten iş sayısı, toplam iş sayısı)
+            on_finished: on_finished(aktarılan dosya sayısı, hata mesajları listesi, iptal edildi mi)
+        """
+        self._cancelled.clear()
+        total = len(jobs)
+        state = {'finished': 0, 'exported': 0, 'errors': []}
+
+        def run(source, destination):
+            # Kuyrukta beklerken iptal edildiyse başlama
+            if self._cancelled.is_set():
+                return False
+            export_file(source, destination)
+            return True
+
+        def done(future):
+            with self._lock:
+                state['finished'] += 1
+                if not future.cancelled():
+                    error = future.exception()
+                    if error is not None:
+                        state['errors'].append(str(error))
+                    elif future.result():
+                        state['exported'] += 1
+                finished = state['finished']
+            # Kapatıldıktan sonra biten işler için kimseye haber verilmez
+            if self._closed:
+                return
+            if on_progress is not None:
+                on_progress(finished, total)
+            if finished == total and on_finished is not None:
+                on_finished(state['exported'], state['errors'], self._cancelled.is_set())
+
+        if not jobs:
+            if on_finished is not None:
+                on_finished(0, [], False)
+            return
+
+        with self._lock:
+            self._futures = [self._executor.submit(run, source, destination) for source, destination in jobs]
+        for future in list(self._futures):
+            future.add_done_callback(done)
+
+    def cancel(self):
+        """Bekleyen işleri iptal et"""
+        self._cancelled.set()
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def close(self):
+        """Bekleyen işleri iptal et ve havuzu kapat (çalışan işler bitirilir)"""
+        self._closed = True
+        self.cancel()
+        self._executor.shutdown(wait=False)
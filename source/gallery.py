@@ -1,10 +1,10 @@
 import os
-import glob
-import cv2
 import sys
-from PyQt5.QtWidgets import (QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, 
-                           QWidget, QGridLayout, QScrollArea, QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt, QSize
+from collections import OrderedDict
+from PyQt5.QtWidgets import (QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QListView,
+                           QAbstractItemView, QMessageBox, QFileDialog, QInputDialog, QProgressDialog)
+from PyQt5.QtCore import (Qt, QSize, QAbstractListModel, QModelIndex, QItemSelectionModel, QFileSystemWatcher,
+                          QTimer, pyqtSignal)
 from PyQt5.QtGui import QPixmap, QIcon
 
 # Modülün doğru import edilebilmesi için source klasörünü ekleme
@@ -13,13 +13,158 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 from .translations import translator as tr
+from .manifest import get_manifest
+from .thumbnails import ThumbnailCache, THUMBNAIL_SIZE
+from .exporter import ScreenshotExporter, unique_destination
+
+# Upper bound for decoded thumbnails kept in memory; least recently shown are evicted first
+PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+
+# Directory change notifications arriving within this interval are applied together (ms)
+REFRESH_DELAY = 250
+
+class ScreenshotListModel(QAbstractListModel):
+    """
+    List model over the screenshot manifest entries.
+    
+    The view only asks for the cells it paints, so thumbnails are loaded
+    lazily: a cached thumbnail is read from disk the first time its cell
+    becomes visible, a missing one is requested from the thumbnail pool.
+    Decoded pixmaps live in an LRU cache capped at PIXMAP_CACHE_BYTES.
+    """
+    
+    # A thumbnail finished in the background pool: (screenshot path, thumbnail path)
+    thumbnail_ready = pyqtSignal(str, str)
+    
+    def __init__(self, thumbnail_cache, parent=None):
+        super().__init__(parent)
+        self.thumbnail_cache = thumbnail_cache
+        self.entries = []
+        self.rows_by_path = {}
+        self.cached_names = set()
+        self.pixmaps = OrderedDict()
+        self.pixmap_bytes = 0
+        self.thumbnail_ready.connect(self.set_thumbnail)
+    
+    def set_entries(self, entries):
+        """Replace the listed screenshots (newest first)."""
+        self.beginResetModel()
+        self.entries = entries
+        self.rows_by_path = {entry.path: row for row, entry in enumerate(entries)}
+        
+        # One directory listing tells which thumbnails are already cached
+        self.cached_names = self.thumbnail_cache.cached_names()
+        self.endResetModel()
+    
+    def apply_entries(self, entries):
+        """
+        Update the list to match entries with per-row removes and inserts.
+        
+        Rows that did not change keep their cached pixmaps and their
+        selection; a replaced file (new mtime or size) is removed and
+        inserted again so it gets a fresh thumbnail.
+        """
+        current = {entry.path: (entry.created, entry.size) for entry in entries}
+        
+        # Remove vanished and replaced files, bottom up so row numbers stay valid
+        for row in reversed(range(len(self.entries))):
+            entry = self.entries[row]
+            if current.get(entry.path) != (entry.created, entry.size):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.entries[row]
+                self.evict(entry.path)
+                self.endRemoveRows()
+        
+        # What is left is in manifest order, so new files are merged in as runs
+        remaining = {entry.path for entry in self.entries}
+        row = 0
+        index = 0
+        while index < len(entries):
+            if entries[index].path in remaining:
+                row += 1
+                index += 1
+                continue
+            start = index
+            while index < len(entries) and entries[index].path not in remaining:
+                index += 1
+            self.beginInsertRows(QModelIndex(), row, row + index - start - 1)
+            self.entries[row:row] = entries[start:index]
+            self.endInsertRows()
+            row += index - start
+        
+        self.rows_by_path = {entry.path: row for row, entry in enumerate(self.entries)}
+    
+    def evict(self, path):
+        pixmap = self.pixmaps.pop(path, None)
+        if pixmap is not None:
+            self.pixmap_bytes -= pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    
+    def clear_pixmaps(self):
+        """Drop every decoded thumbnail."""
+        self.pixmaps.clear()
+        self.pixmap_bytes = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == Qt.DecorationRole:
+            return self.thumbnail(entry)
+        if role == Qt.ToolTipRole:
+            return entry.path
+        return None
+    
+    def thumbnail(self, entry):
+        pixmap = self.pixmaps.get(entry.path)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(entry.path)
+            return pixmap
+        
+        thumbnail_path = self.thumbnail_cache.cached_path(entry, self.cached_names)
+        if thumbnail_path is None:
+            # Generated in the background; the cell is repainted when it is ready
+            self.thumbnail_cache.request(entry, self.on_thumbnail_generated)
+            return None
+        
+        pixmap = QPixmap(thumbnail_path)
+        if pixmap.isNull():
+            return None
+        self.pixmaps[entry.path] = pixmap
+        self.pixmap_bytes += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        while self.pixmap_bytes > PIXMAP_CACHE_BYTES and len(self.pixmaps) > 1:
+            self.evict(next(iter(self.pixmaps)))
+        return pixmap
+    
+    def on_thumbnail_generated(self, entry, thumbnail_path):
+        # Called from the thumbnail pool; the signal hands the result to the UI thread
+        if thumbnail_path is not None:
+            self.thumbnail_ready.emit(entry.path, thumbnail_path)
+    
+    def set_thumbnail(self, file_path, thumbnail_path):
+        self.cached_names.add(os.path.basename(thumbnail_path))
+        row = self.rows_by_path.get(file_path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
 
 class ScreenshotGallery(QDialog):
+    # Export progress from the worker pool: (finished, total)
+    export_progress = pyqtSignal(int, int)
+    
+    # Export done: (exported count, error messages, cancelled)
+    export_finished = pyqtSignal(int, list, bool)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle(tr.get_text("gallery_title"))
         self.setGeometry(200, 200, 800, 600)
         
+        # Each opening builds a new gallery; free it (and its pixmap cache) once closed
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        
         # Icon yolunu güncelle
         icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons', 'gallery_icon.png')
         self.setWindowIcon(QIcon(icon_path))
@@ -31,21 +176,32 @@ class ScreenshotGallery(QDialog):
         self.info_label = QLabel(tr.get_text("saved_screenshots"))
         layout.addWidget(self.info_label)
         
-        # Create a scroll area for the gallery
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        self.gallery_layout = QGridLayout(scroll_widget)
+        # Thumbnails are cached on disk and generated off the UI thread
+        self.manifest = get_manifest()
+        self.thumbnail_cache = ThumbnailCache(self.manifest.directory)
+        self.model = ScreenshotListModel(self.thumbnail_cache, self)
+        
+        # Icon-mode list view: only the visible cells are ever created and painted
+        self.gallery_view = QListView()
+        self.gallery_view.setViewMode(QListView.IconMode)
+        self.gallery_view.setMovement(QListView.Static)
+        self.gallery_view.setResizeMode(QListView.Adjust)
+        self.gallery_view.setUniformItemSizes(True)
+        self.gallery_view.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.gallery_view.setGridSize(QSize(180, 180))
+        self.gallery_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.gallery_view.setModel(self.model)
+        self.gallery_view.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
-        scroll_area.setWidget(scroll_widget)
-        layout.addWidget(scroll_area)
+        self.gallery_view.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        layout.addWidget(self.gallery_view)
         
         # Buttons layout
         button_layout = QHBoxLayout()
         
         # Add buttons
         self.refresh_button = QPushButton(tr.get_text("refresh"))
-        self.refresh_button.clicked.connect(self.load_screenshots)
+        self.refresh_button.clicked.connect(self.refresh_screenshots)
         
         self.delete_button = QPushButton(tr.get_text("delete_selected"))
         self.delete_button.clicked.connect(self.delete_selected)
@@ -65,11 +221,28 @@ class ScreenshotGallery(QDialog):
         # Variables
         self.screenshots = []
         self.selected_index = -1
-        self.thumbnail_labels = []
+        
+        # Exports copy or transcode in a worker pool behind a progress dialog
+        self.exporter = ScreenshotExporter()
+        self.export_jobs = []
+        self.export_dialog = None
+        self.export_progress.connect(self.on_export_progress)
+        self.export_finished.connect(self.on_export_finished)
         
         # Load screenshots
         self.load_screenshots()
         
+        # Files added, removed or replaced by other programs show up without a full reload
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(REFRESH_DELAY)
+        self.refresh_timer.timeout.connect(self.refresh_screenshots)
+        self.watcher = QFileSystemWatcher([self.manifest.directory], self)
+        self.watcher.directoryChanged.connect(self.refresh_timer.start)
+        
+        # Every way of closing the dialog ends in finished
+        self.finished.connect(self.release_resources)
+        
         # Apply the dark theme
         self.setStyleSheet("""
             QDialog {
@@ -92,117 +265,205 @@ class ScreenshotGallery(QDialog):
                 background-color: #444;
                 color: #888;
             }
-            QScrollArea {
+            QListView {
                 border: 1px solid #555;
                 background-color: #444;
             }
+            QListView::item {
+                border: 2px solid #555;
+                margin: 5px;
+                background-color: #222;
+                padding: 5px;
+            }
+            QListView::item:selected {
+                border: 2px solid #2196F3;
+                background-color: #333;
+            }
         """)
     
     def load_screenshots(self):
-        # Clear existing thumbnails
-        for label in self.thumbnail_labels:
-            self.gallery_layout.removeWidget(label)
-            label.deleteLater()
-        
-        self.thumbnail_labels = []
-        self.screenshots = []
-        
-        # Ensure screenshots directory exists - ana klasör yerine source klasörünün üstünü kullan
-        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        screenshots_dir = os.path.join(root_dir, "screenshots")
-        if not os.path.exists(screenshots_dir):
-            os.makedirs(screenshots_dir)
+        # Thumbnails queued for the previous listing are no longer needed
+        self.thumbnail_cache.cancel()
+        self.selected_index = -1
+        self.delete_button.setEnabled(False)
+        self.export_button.setEnabled(False)
         
-        # Find all PNG files in the screenshots directory that start with "screenshot_"
-        screenshot_files = glob.glob(os.path.join(screenshots_dir, "screenshot_*.png"))
+        # Dizin yalnızca klasör dışarıdan değiştiyse yeniden taranır
+        self.manifest.reconcile()
         
-        if not screenshot_files:
+        # Kayıtlar en yeniden en eskiye sıralı gelir
+        entries = self.manifest.entries()
+        self.model.set_entries(entries)
+        self.update_listing(entries)
+    
+    def refresh_screenshots(self):
+        """Apply added, removed and replaced files to the list without rebuilding it."""
+        self.manifest.reconcile()
+        entries = self.manifest.entries()
+        self.model.apply_entries(entries)
+        self.update_listing(entries)
+        self.on_selection_changed(None, None)
+    
+    def update_listing(self, entries):
+        self.screenshots = [entry.path for entry in entries]
+        if not entries:
             self.info_label.setText(tr.get_text("no_screenshots"))
-            self.selected_index = -1
-            self.delete_button.setEnabled(False)
-            self.export_button.setEnabled(False)
             return
         
-        # Sort files by creation time (newest first)
-        screenshot_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        self.screenshots = screenshot_files
-        
-        # Display thumbnails in a grid (4 columns)
-        cols = 4
-        for i, file_path in enumerate(screenshot_files):
-            # Create thumbnail
-            pixmap = QPixmap(file_path)
-            thumbnail = pixmap.scaled(QSize(150, 150), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            
-            # Create label and add to layout
-            label = QLabel()
-            label.setPixmap(thumbnail)
-            label.setAlignment(Qt.AlignCenter)
-            label.setToolTip(file_path)
-            label.setStyleSheet("border: 2px solid #555; margin: 5px; background-color: #222; padding: 5px;")
-            label.setFixedSize(QSize(180, 180))
-            label.mousePressEvent = lambda event, idx=i: self.select_screenshot(idx)
-            
-            row, col = i // cols, i % cols
-            self.gallery_layout.addWidget(label, row, col)
-            self.thumbnail_labels.append(label)
+        # Drop thumbnails of screenshots that no longer exist
+        self.thumbnail_cache.prune(entries)
         
         # Update info text
-        self.info_label.setText(f"{tr.get_text('saved_screenshots')} {len(screenshot_files)}")
+        self.info_label.setText(f"{tr.get_text('saved_screenshots')} {len(entries)}")
 
+    def on_scrolled(self, value):
+        # Cells scrolled past before their turn in the pool do not need a thumbnail anymore.
+        # Scrolling only blits the cells that stay visible, so repaint them to re-request theirs
+        self.thumbnail_cache.cancel()
+        self.gallery_view.viewport().update()
+    
+    def release_resources(self):
+        """Stop watching, generating thumbnails and exporting; the dialog is deleted next."""
+        self.watcher.directoryChanged.disconnect()
+        self.watcher.deleteLater()
+        self.refresh_timer.stop()
+        self.thumbnail_cache.close()
+        self.exporter.close()
+        self.model.clear_pixmaps()
+    
     def select_screenshot(self, index):
-        # Deselect the previous selection
-        if 0 <= self.selected_index < len(self.thumbnail_labels):
-            self.thumbnail_labels[self.selected_index].setStyleSheet("border: 2px solid #555; margin: 5px; background-color: #222; padding: 5px;")
-        
-        # Select the new one
-        self.selected_index = index
-        self.thumbnail_labels[index].setStyleSheet("border: 2px solid #2196F3; margin: 5px; background-color: #333; padding: 5px;")
+        """Select a single screenshot, replacing the current selection."""
+        if 0 <= index < len(self.screenshots):
+            self.gallery_view.selectionModel().setCurrentIndex(
+                self.model.index(index), QItemSelectionModel.ClearAndSelect)
+    
+    def selected_rows(self):
+        return sorted(index.row() for index in self.gallery_view.selectionModel().selectedIndexes())
+    
+    def selected_paths(self):
+        return [self.screenshots[row] for row in self.selected_rows()]
+    
+    def on_selection_changed(self, selected, deselected):
+        rows = self.selected_rows()
+        current = self.gallery_view.currentIndex().row()
+        self.selected_index = current if current in rows else (rows[0] if rows else -1)
         
         # Enable buttons
-        self.delete_button.setEnabled(True)
-        self.export_button.setEnabled(True)
+        self.delete_button.setEnabled(bool(rows))
+        self.export_button.setEnabled(bool(rows) and not self.export_jobs)
     
     def delete_selected(self):
-        if 0 <= self.selected_index < len(self.screenshots):
-            file_to_delete = self.screenshots[self.selected_index]
-            
-            # Confirm deletion
-            reply = QMessageBox.question(
-                self, 
-                tr.get_text("delete_confirmation"), 
-                tr.get_text("delete_confirm_text", file_to_delete),
-                QMessageBox.Yes | QMessageBox.No, 
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                try:
+        files_to_delete = self.selected_paths()
+        if not files_to_delete:
+            return
+        
+        # Confirm deletion
+        if len(files_to_delete) == 1:
+            confirm_text = tr.get_text("delete_confirm_text", files_to_delete[0])
+        else:
+            confirm_text = tr.get_text("delete_confirm_multiple", len(files_to_delete))
+        reply = QMessageBox.question(
+            self, 
+            tr.get_text("delete_confirmation"), 
+            confirm_text,
+            QMessageBox.Yes | QMessageBox.No, 
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            try:
+                for file_to_delete in files_to_delete:
+                    was_in_sync = self.manifest.is_in_sync()
                     os.remove(file_to_delete)
-                    self.load_screenshots()  # Refresh the gallery
-                    self.parent().status_bar.showMessage(tr.get_text("file_deleted", file_to_delete))
-                except Exception as e:
-                    QMessageBox.critical(self, tr.get_text("error"), tr.get_text("delete_failed", str(e)))
+                    self.manifest.remove(file_to_delete, was_in_sync)
+                if len(files_to_delete) == 1:
+                    self.parent().status_bar.showMessage(tr.get_text("file_deleted", files_to_delete[0]))
+                else:
+                    self.parent().status_bar.showMessage(tr.get_text("files_deleted", len(files_to_delete)))
+            except Exception as e:
+                QMessageBox.critical(self, tr.get_text("error"), tr.get_text("delete_failed", str(e)))
+            self.refresh_screenshots()  # Only the deleted rows leave the list
     
     def export_selected(self):
-        if 0 <= self.selected_index < len(self.screenshots):
-            file_to_export = self.screenshots[self.selected_index]
+        files_to_export = self.selected_paths()
+        if not files_to_export or self.export_jobs:
+            return
+        
+        if len(files_to_export) == 1:
+            file_to_export = files_to_export[0]
             
             # Open file dialog to choose export location
             export_path, _ = QFileDialog.getSaveFileName(
                 self, 
                 tr.get_text("export_title"), 
                 os.path.basename(file_to_export),
-                "PNG Image (*.png);;JPEG Image (*.jpg);;All Files (*.*)"
+                "PNG Image (*.png);;JPEG Image (*.jpg);;WebP Image (*.webp);;All Files (*.*)"
             )
+            if not export_path:
+                return
             
-            if export_path:
-                try:
-                    # Read the original image
-                    img = cv2.imread(file_to_export)
-                    
-                    # Save to the selected path
-                    cv2.imwrite(export_path, img)
-                    self.parent().status_bar.showMessage(tr.get_text("file_exported", export_path))
-                except Exception as e:
-                    QMessageBox.critical(self, tr.get_text("error"), tr.get_text("export_failed", str(e)))
+            # Without an extension the file is copied as it is
+            if not os.path.splitext(export_path)[1]:
+                export_path += os.path.splitext(file_to_export)[1]
+            self.start_export([(file_to_export, export_path)])
+            return
+        
+        # Several screenshots go into a folder, optionally converted to one format
+        export_dir = QFileDialog.getExistingDirectory(self, tr.get_text("export_title"))
+        if not export_dir:
+            return
+        formats = [tr.get_text("export_format_original"), "PNG", "JPEG", "WebP"]
+        choice, ok = QInputDialog.getItem(
+            self,
+            tr.get_text("export_title"),
+            tr.get_text("export_format_prompt"),
+            formats, 0, False
+        )
+        if not ok:
+            return
+        extension = {"PNG": ".png", "JPEG": ".jpg", "WebP": ".webp"}.get(choice)
+        
+        taken = set()
+        jobs = []
+        for file_to_export in files_to_export:
+            stem, original_extension = os.path.splitext(os.path.basename(file_to_export))
+            filename = stem + (extension or original_extension)
+            jobs.append((file_to_export, unique_destination(export_dir, filename, taken)))
+        self.start_export(jobs)
+    
+    def start_export(self, jobs):
+        """Copy or transcode the (source, destination) pairs in the worker pool."""
+        self.export_jobs = jobs
+        self.export_button.setEnabled(False)
+        
+        self.export_dialog = QProgressDialog(tr.get_text("export_progress"), tr.get_text("cancel"),
+                                             0, len(jobs), self)
+        self.export_dialog.setWindowTitle(tr.get_text("export_title"))
+        self.export_dialog.setWindowModality(Qt.WindowModal)
+        self.export_dialog.setMinimumDuration(500)
+        self.export_dialog.setValue(0)
+        self.export_dialog.canceled.connect(self.exporter.cancel)
+        
+        # Callbacks run in the pool; the signals hand them to the UI thread
+        self.exporter.start(jobs, self.export_progress.emit, self.export_finished.emit)
+    
+    def on_export_progress(self, finished, total):
+        if self.export_dialog is not None:
+            self.export_dialog.setValue(finished)
+    
+    def on_export_finished(self, exported, errors, cancelled):
+        jobs, self.export_jobs = self.export_jobs, []
+        if self.export_dialog is not None:
+            self.export_dialog.canceled.disconnect(self.exporter.cancel)
+            self.export_dialog.close()
+            self.export_dialog = None
+        self.export_button.setEnabled(bool(self.selected_rows()))
+        
+        if len(jobs) == 1 and exported == 1:
+            self.parent().status_bar.showMessage(tr.get_text("file_exported", jobs[0][1]))
+        elif exported:
+            export_dir = os.path.dirname(jobs[0][1])
+            self.parent().status_bar.showMessage(tr.get_text("files_exported", exported, len(jobs), export_dir))
+        
+        if errors:
+            QMessageBox.critical(self, tr.get_text("error"), tr.get_text("export_failed", errors[0]))
@@ -0,0 +1,301 @@
+"""
+Qt gerektirmeyen toplu işleme komut satırı arayüzü
+
+Video dosyaları, görüntü klasörleri veya glob desenlerinden gelen kareler bir
+üreteç (generator) hattı üzerinden ColorDetector'a aktarılır; işaretlenmiş
+çıktılar ve JSON Lines biçiminde tespitler yazılır.
+
+Örnek:
+    python CVA.py --headless footage/*.mp4 --output-dir out --json detections.jsonl
+    find archive -name '*.png' | python CVA.py --headless - --json -
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import cv2
+
+from color_detection import ColorDetector, COLOR_CLASSES, DISPLAY_MODES
+from translations import translator as tr
+from recorder import RECORD_CODECS
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp'}
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.m4v', '.webm', '.wmv'}
+
+class FrameRecord:
+    """Hat boyunca taşınan tek kare ve kaynak bilgisi"""
+
+    def __init__(self, source, index, frame, fps=None):
+        self.source = source
+        self.index = index
+        self.frame = frame
+        self.fps = fps
+        self.result = None
+        self.detections = None
+
+def expand_inputs(inputs):
+    """
+    Girdi listesini dosya yollarına genişletir
+
+    Args:
+        inputs: Dosya, klasör veya glob desenleri; '-' stdin'den satır satır okur
+
+    Yields:
+        Sıralı dosya yolları
+    """
+    for item in inputs:
+        if item == '-':
+            # stdin'deki her satır bir yol veya glob desenidir
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    yield from expand_inputs([line])
+        elif os.path.isdir(item):
+            for name in sorted(os.listdir(item)):
+                path = os.path.join(item, name)
+                if os.path.isfile(path) and os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                    yield path
+        elif os.path.isfile(item):
+            yield item
+        else:
+            matches = sorted(glob.glob(item))
+            if not matches:
+                print(f"warning: no input matches {item}", file=sys.stderr)
+            for path in matches:
+                if os.path.isfile(path):
+                    yield path
+
+def read_frames(paths):
+    """
+    Dosya yollarından kareleri okur
+
+    Args:
+        paths: expand_inputs çıktısı
+
+    Yields:
+        FrameRecord nesneleri (görüntü dosyaları için index 0)
+    """
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in IMAGE_EXTENSIONS:
+            frame = cv2.imread(path)
+            if frame is None:
+                print(f"warning: cannot read image {path}", file=sys.stderr)
+                continue
+            yield FrameRecord(path, 0, frame)
+        else:
+            capture = cv2.VideoCapture(path)
+            if not capture.isOpened():
+                print(f"warning: cannot open video {path}", file=sys.stderr)
+                continue
+            fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+            index = 0
+            try:
+                while True:
+                    ret, frame = capture.read()
+                    if not ret:
+                        break
+                    yield FrameRecord(path, index, frame, fps)
+                    index += 1
+            finally:
+                capture.release()
+
+def detect_frames(records, detector, selected_colors, sensitivity, contrast, color_translations):
+    """
+    Kareleri ColorDetector'dan geçirir
+
+    Yields:
+        result ve detections alanları doldurulmuş FrameRecord nesneleri
+    """
+    for record in records:
+        record.result = detector.process_frame(
+            record.frame,
+            selected_colors,
+            sensitivity,
+            contrast,
+            color_translations
+        )
+        record.detections = detector.last_detections
+        yield record
+
+def detections_to_dict(record):
+    """Bir karenin tespitlerini JSON'a yazılabilir sözlüğe çevirir"""
+    height, width = record.frame.shape[:2]
+    colors = {}
+    for color_name, detection in record.detections.items():
+        colors[color_name] = [
+            {'box': box, 'area': area, 'fill_ratio': round(fill_ratio, 4)}
+            for box, area, fill_ratio in zip(detection['boxes'].tolist(),
+                                             detection['areas'].tolist(),
+                                             detection['fill_ratios'].tolist())
+        ]
+    return {
+        'source': record.source,
+        'frame': record.index,
+        'width': width,
+        'height': height,
+        'detections': colors
+    }
+
+class AnnotatedWriter:
+    """
+    İşaretlenmiş kareleri kaynak türüne göre görüntü veya video olarak yazar
+
+    Çıktılar girdilerin klasör yapısını çıktı klasöründe yineler (çalışma
+    klasörüne göre göreli yol; dışındaysa kökten itibaren mutlak yol), böylece
+    farklı klasörlerdeki aynı adlı dosyalar birbirinin üzerine yazılmaz. Aynı
+    çalıştırmada yine de çakışan çıktı adlarına _1, _2 ... eklenir.
+    """
+
+    def __init__(self, output_dir, fourcc='mp4v'):
+        self.output_dir = output_dir
+        self.fourcc = fourcc
+        # Kodeğe uygun kap; bilinmeyen kodekler için AVI her FourCC'yi kabul eder
+        self.video_extension = RECORD_CODECS.get(fourcc, '.avi')
+        self._video_source = None
+        self._video_writer = None
+        self._written = set()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def output_path(self, source, extension):
+        """
+        Kaynak dosyanın işaretlenmiş çıktısının yolu (klasörleri oluşturulur)
+
+        Args:
+            source: Girdi dosyasının yolu
+            extension: Çıktı dosyasının uzantısı
+        """
+        source = os.path.abspath(source)
+        try:
+            relative = os.path.relpath(source)
+        except ValueError:
+            # Windows'ta farklı sürücüdeki dosyalar
+            relative = os.pardir
+        if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+            relative = os.path.splitdrive(source)[1].lstrip(os.sep)
+        directory, name = os.path.split(relative)
+        stem = f"{os.path.splitext(name)[0]}_annotated"
+        directory = os.path.join(self.output_dir, directory)
+        os.makedirs(directory, exist_ok=True)
+
+        path = os.path.join(directory, f"{stem}{extension}")
+        counter = 1
+        while path in self._written:
+            path = os.path.join(directory, f"{stem}_{counter}{extension}")
+            counter += 1
+        self._written.add(path)
+        return path
+
+    def write(self, record):
+        if record.fps is None:
+            self._close_video()
+            path = self.output_path(record.source, os.path.splitext(record.source)[1])
+            cv2.imwrite(path, record.result)
+            return
+
+        if record.source != self._video_source:
+            self._close_video()
+            height, width = record.result.shape[:2]
+            path = self.output_path(record.source, self.video_extension)
+            self._video_writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*self.fourcc),
+                                                 record.fps, (width, height))
+            self._video_source = record.source
+        self._video_writer.write(record.result)
+
+    def _close_video(self):
+        if self._video_writer is not None:
+            self._video_writer.release()
+        self._video_writer = None
+        self._video_source = None
+
+    def close(self):
+        self._close_video()
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="CVA.py --headless",
+        description="Run ColorVisionAid color detection over video files and images without a display."
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="video files, image files, image directories or glob patterns; '-' reads them from stdin")
+    parser.add_argument('--output-dir', help="write annotated images/videos to this directory")
+    parser.add_argument('--json', dest='json_path', help="write detections as JSON Lines to this file ('-' for stdout)")
+    parser.add_argument('--colors', default='red,green',
+                        help="comma separated colors to detect (default: red,green)")
+    parser.add_argument('--sensitivity', type=int, default=5, help="1-10 (default: 5)")
+    parser.add_argument('--contrast', type=int, default=5, help="1-10 (default: 5)")
+    parser.add_argument('--analysis-scale', type=float, default=1.0,
+                        help="detect on a downscaled copy, 0-1 (default: 1.0)")
+    parser.add_argument('--strips', type=int, default=0,
+                        help="split frames into this many strips processed in parallel (default: serial)")
+    parser.add_argument('--display-mode', default='normal', choices=DISPLAY_MODES,
+                        help="color vision deficiency correction applied to annotated output (default: normal)")
+    parser.add_argument('--simulate', action='store_true',
+                        help="simulate the chosen color vision deficiency instead of correcting for it")
+    parser.add_argument('--language', default='en', choices=sorted(tr.LANGUAGES), help="label language")
+    parser.add_argument('--fourcc', default='mp4v',
+                        help="codec for annotated videos; the container follows the codec (default: mp4v)")
+    parser.add_argument('--profile', action='store_true',
+                        help="print per-stage timing statistics of the detector to stderr when finished")
+    return parser
+
+def main(argv=None):
+    """
+    Komut satırı giriş noktası
+
+    Returns:
+        Çıkış kodu
+    """
+    args = build_parser().parse_args(argv)
+
+    colors = [color.strip() for color in args.colors.split(',') if color.strip()]
+    unknown = [color for color in colors if color not in COLOR_CLASSES]
+    if unknown:
+        print(f"error: unknown colors: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    selected_colors = {color_name: color_name in colors for color_name in COLOR_CLASSES}
+
+    tr.set_language(args.language)
+    color_translations = {color_name: tr.get_text(color_name) for color_name in COLOR_CLASSES}
+
+    detector = ColorDetector()
+    detector.analysis_scale = args.analysis_scale
+    detector.parallel_strips = args.strips
+    detector.set_display_mode(args.display_mode, args.simulate)
+    detector.timer.enabled = args.profile
+
+    writer = AnnotatedWriter(args.output_dir, args.fourcc) if args.output_dir else None
+    if args.json_path == '-':
+        json_file = sys.stdout
+    elif args.json_path:
+        json_file = open(args.json_path, 'w', encoding='utf-8')
+    else:
+        json_file = None
+
+    records = detect_frames(read_frames(expand_inputs(args.inputs)), detector,
+                            selected_colors, args.sensitivity, args.contrast, color_translations)
+
+    frame_count = 0
+    start = time.perf_counter()
+    try:
+        for record in records:
+            if writer is not None:
+                writer.write(record)
+            if json_file is not None:
+                json_file.write(json.dumps(detections_to_dict(record), ensure_ascii=False) + '\n')
+            frame_count += 1
+    finally:
+        if writer is not None:
+            writer.close()
+        if json_file is not None and json_file is not sys.stdout:
+            json_file.close()
+
+    elapsed = time.perf_counter() - start
+    fps = frame_count / elapsed if elapsed > 0 else 0.0
+    print(f"processed {frame_count} frames in {elapsed:.2f} s ({fps:.1f} FPS)", file=sys.stderr)
+    if args.profile and frame_count:
+        print(f"stage timings over the last {min(frame_count, detector.timer.window)} frames:", file=sys.stderr)
+        print(detector.timer.format_summary(), file=sys.stderr)
+    return 0 if frame_count else 1
@@ -1,22 +1,34 @@
 import os
 import sys
+import time
 import cv2
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout
-from PyQt5.QtWidgets import QWidget, QStatusBar
-from PyQt5.QtCore import Qt, QTimer, QSize, QSettings
-from PyQt5.QtGui import QImage, QPixmap, QIcon
+from PyQt5.QtWidgets import QWidget, QStatusBar, QFileDialog, QMessageBox
+from PyQt5.QtCore import Qt, QSize, QSettings, pyqtSignal
+from PyQt5.QtGui import QIcon
 
 # Paketin kendi modüllerini import et
 from .translations import translator as tr
 from .gallery import ScreenshotGallery
-from .color_detection import ColorDetector
+from .color_detection import ColorDetector, DISPLAY_MODES, default_parallel_strips
 from .camera import CameraManager, create_camera_ui, show_camera_permission_ui
+from .pipeline import FramePipeline
+from .video_display import VideoDisplay
 from .utils import draw_text_with_utf8
 from .ui_components import (create_camera_controls, create_color_detection_group,
                           create_display_settings_group, create_camera_settings_group,
                           create_language_group, create_about_group, apply_dark_theme)
 
 class ColorVisionAid(QMainWindow):
+    # Ekran görüntüsü yazımı bitti: (başarılı mı, dosya yolu veya hata mesajı)
+    snapshot_finished = pyqtSignal(bool, str)
+    
+    # Seri çekim yazımı bitti: (yazılan kare, toplam kare, hata mesajı)
+    burst_finished = pyqtSignal(int, int, str)
+    
+    # Video kaydı bitti: (dosya yolu, yazılan kare, atılan kare, hata mesajı)
+    recording_finished = pyqtSignal(str, int, int, str)
+    
     def __init__(self):
         super().__init__()
         
@@ -30,14 +42,42 @@ class ColorVisionAid(QMainWindow):
         
         # Camera manager ve color detector oluştur
         self.camera_manager = CameraManager(self)
+        self.camera_manager.snapshot_writer.set_format(
+            self.settings.value("snapshot_format", "png"),
+            self.settings.value("snapshot_level", None)
+        )
+        # Yazıcı iş parçacığından gelen sonuç sinyal ile UI iş parçacığına taşınır
+        self.camera_manager.snapshot_writer.on_complete = self.snapshot_finished.emit
+        self.snapshot_finished.connect(self.on_snapshot_finished)
+        burst = self.camera_manager.burst
+        burst.buffer.configure(self.settings.value("burst_frames", burst.buffer.max_frames, type=int),
+                               self.settings.value("burst_memory_mb", burst.buffer.memory_limit_mb, type=int))
+        burst.buffer.enabled = self.settings.value("burst_enabled", False, type=bool)
+        burst.on_complete = self.burst_finished.emit
+        self.burst_finished.connect(self.on_burst_finished)
         self.color_detector = ColorDetector()
+        self.color_detector.analysis_scale = float(self.settings.value("analysis_scale", 1.0))
+        self.apply_parallel_strips(self.settings.value("parallel_strips", -1, type=int))
+        self.color_detector.motion_gating = self.settings.value("motion_gating", True, type=bool)
+        display_mode = self.settings.value("display_mode", "normal")
+        self.color_detector.set_display_mode(display_mode if display_mode in DISPLAY_MODES else "normal",
+                                             self.settings.value("simulate_cvd", False, type=bool))
+        self.color_detector.timer.enabled = self.settings.value("stage_timing", False, type=bool)
+        self.stage_timing_refreshed = 0.0
+        self.performance_hud_refreshed = 0.0
         
         # UI kurulumu
         self.setup_ui()
         
-        # Timer for updating the camera feed
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
+        # Yakalama ve işleme arka plan iş parçacıklarında çalışır, UI yalnızca sonucu gösterir
+        self.pipeline = FramePipeline(self.camera_manager, self.color_detector, self)
+        self.pipeline.frame_ready.connect(self.update_frame)
+        self.video_display.frame_painted.connect(self.pipeline.mark_displayed)
+        self.pipeline.budget_changed.connect(self.on_processing_budget_changed)
+        self.pipeline.processing_failed.connect(self.on_processing_failed)
+        self.pipeline.recorder.set_codec(self.record_codec.currentData())
+        self.pipeline.recorder.on_finished = self.recording_finished.emit
+        self.recording_finished.connect(self.on_recording_finished)
 
     def setup_ui(self):
         """UI bileşenlerini ve düzeni oluştur"""
@@ -84,8 +124,25 @@ class ColorVisionAid(QMainWindow):
         # Kamera mesajını göster
         create_camera_ui(self, self.camera_feed_layout)
         
+        # Kamera açıkken düzene eklenen kalıcı görüntü alanı
+        self.video_display = VideoDisplay()
+        
+        # Görüntünün üstünde duran hız/gecikme göstergesi (düzene eklenmez)
+        self.performance_hud = QLabel(self.camera_feed_container)
+        self.performance_hud.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 160); color: #A5D6A7; font-family: monospace; "
+            "font-size: 9pt; padding: 6px; border-radius: 5px;")
+        self.performance_hud.move(24, 24)
+        self.performance_hud.hide()
+        
         self.camera_layout.addWidget(self.camera_feed_container)
         
+        # Aşama süreleri tablosu (ayarlardan açılır)
+        self.stage_timing_label = QLabel()
+        self.stage_timing_label.setStyleSheet("color: #ccc; font-family: monospace; font-size: 9pt;")
+        self.stage_timing_label.setVisible(self.color_detector.timer.enabled)
+        self.camera_layout.addWidget(self.stage_timing_label)
+        
         # Kamera kontrol butonları - UI Components modülünü kullan
         self.camera_layout.addLayout(create_camera_controls(self))
 
@@ -123,6 +180,105 @@ class ColorVisionAid(QMainWindow):
             # Durum mesajını göster
             self.status_bar.showMessage(tr.get_text("language_changed"))
     
+    def change_analysis_resolution(self, index):
+        """Renk tespitinin yapılacağı çözünürlük oranını değiştir"""
+        scale = self.analysis_resolution.itemData(index)
+        self.color_detector.analysis_scale = scale
+        self.settings.setValue("analysis_scale", scale)
+    
+    def change_parallel_strips(self, index):
+        """Tespitin bölüneceği paralel şerit sayısını değiştir"""
+        strips = self.parallel_strips.itemData(index)
+        self.apply_parallel_strips(strips)
+        self.settings.setValue("parallel_strips", strips)
+    
+    def apply_parallel_strips(self, strips):
+        """Şerit sayısını dedektöre uygula (-1: çekirdek sayısına göre)"""
+        self.color_detector.parallel_strips = default_parallel_strips() if strips < 0 else strips
+    
+    def change_display_mode(self, *args):
+        """Renk körlüğü gösterim modunu (düzeltme veya benzetim) değiştir"""
+        mode = self.display_mode.currentData()
+        simulate = self.simulate_cvd_checkbox.isChecked()
+        self.color_detector.set_display_mode(mode, simulate)
+        self.settings.setValue("display_mode", mode)
+        self.settings.setValue("simulate_cvd", simulate)
+    
+    def change_motion_gating(self, enabled):
+        """Durağan sahnelerde tespitin atlanmasını aç/kapat"""
+        self.color_detector.motion_gating = enabled
+        self.settings.setValue("motion_gating", enabled)
+    
+    def change_stage_timing(self, enabled):
+        """İşlem aşamalarının süre ölçümünü aç/kapat"""
+        self.color_detector.timer.enabled = enabled
+        self.color_detector.timer.reset()
+        self.stage_timing_label.clear()
+        self.stage_timing_label.setVisible(enabled)
+        self.settings.setValue("stage_timing", enabled)
+    
+    def change_performance_hud(self, enabled):
+        """Hız ve gecikme göstergesini aç/kapat"""
+        self.performance_hud.setVisible(enabled and self.camera_manager.camera_on)
+        self.settings.setValue("performance_hud", enabled)
+    
+    def update_performance_hud(self):
+        """Göstergeyi en fazla saniyede iki kez yenile ve görüntünün üstünde tut"""
+        now = time.monotonic()
+        if now - self.performance_hud_refreshed >= 0.5:
+            self.performance_hud_refreshed = now
+            self.performance_hud.setText(self.pipeline.performance.format_hud())
+            self.performance_hud.adjustSize()
+        self.performance_hud.show()
+        self.performance_hud.raise_()
+    
+    def current_settings(self):
+        """Ölçüm ve ekran görüntüsü kayıtlarına eklenen güncel işleme ayarları"""
+        frame = self.camera_manager.current_frame
+        return {
+            'resolution': f"{frame.shape[1]}x{frame.shape[0]}" if frame is not None else "",
+            'analysis_scale': self.color_detector.analysis_scale,
+            'parallel_strips': self.color_detector.parallel_strips,
+            'motion_gating': self.color_detector.motion_gating,
+            'classification_mode': self.color_detector.classification_mode,
+            'parallel_strips': self.color_detector.parallel_strips,
+            'colors': "+".join(color_name for color_name, checkbox in (
+                ('red', self.red_checkbox), ('green', self.green_checkbox),
+                ('blue', self.blue_checkbox), ('yellow', self.yellow_checkbox)) if checkbox.isChecked()),
+            'sensitivity': self.sensitivity_slider.value(),
+            'contrast': self.contrast_slider.value(),
+            'display_mode': self.color_detector.display_mode,
+            'simulate_cvd': self.color_detector.simulate_cvd
+        }
+    
+    def export_performance_metrics(self):
+        """Kamera oturumunun hız ve gecikme ölçümlerini CSV veya JSON olarak kaydet"""
+        export_path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            tr.get_text("export_metrics_title"),
+            f"cva_performance_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+            "CSV (*.csv);;JSON (*.json)"
+        )
+        if not export_path:
+            return
+        if not os.path.splitext(export_path)[1]:
+            export_path += ".json" if "json" in selected_filter else ".csv"
+        
+        # Sonuçları karşılaştırabilmek için ölçüm anındaki ayarlar
+        try:
+            self.pipeline.performance.export(export_path, self.current_settings())
+            self.status_bar.showMessage(tr.get_text("metrics_exported", export_path))
+        except Exception as e:
+            QMessageBox.critical(self, tr.get_text("error"), tr.get_text("export_failed", str(e)))
+    
+    def update_stage_timing(self):
+        """Aşama süreleri tablosunu en fazla saniyede iki kez yenile"""
+        now = time.monotonic()
+        if now - self.stage_timing_refreshed < 0.5:
+            return
+        self.stage_timing_refreshed = now
+        self.stage_timing_label.setText(self.color_detector.timer.format_summary())
+    
     def update_ui_language(self):
         """UI elemanlarını yeni dile göre güncelle"""
         # Pencere başlığını güncelle
@@ -130,6 +286,10 @@ class ColorVisionAid(QMainWindow):
         
         # Butonları güncelle
         self.snapshot_button.setText(tr.get_text("take_screenshot"))
+        self.burst_button.setText(tr.get_text("save_burst"))
+        self.burst_button.setToolTip(tr.get_text("save_burst_tooltip"))
+        self.record_button.setText(tr.get_text("stop_recording" if self.pipeline.recorder.recording else "record"))
+        self.record_button.setToolTip(tr.get_text("record_tooltip"))
         self.gallery_button.setText(tr.get_text("gallery"))
         
         # Kamera butonunu güncelle
@@ -157,7 +317,34 @@ class ColorVisionAid(QMainWindow):
         self.detection_sensitivity_label.setText(tr.get_text("detection_sensitivity"))
         self.contrast_label.setText(tr.get_text("contrast"))
         self.display_mode_label.setText(tr.get_text("display_mode"))
+        self.display_mode.setToolTip(tr.get_text("display_mode_tooltip"))
+        self.simulate_cvd_checkbox.setText(tr.get_text("simulate_cvd"))
+        self.simulate_cvd_checkbox.setToolTip(tr.get_text("simulate_cvd_tooltip"))
+        self.analysis_resolution_label.setText(tr.get_text("analysis_resolution"))
+        self.analysis_resolution.setToolTip(tr.get_text("analysis_resolution_tooltip"))
+        self.parallel_strips_label.setText(tr.get_text("parallel_strips"))
+        self.parallel_strips.setItemText(0, tr.get_text("parallel_strips_auto"))
+        self.parallel_strips.setItemText(1, tr.get_text("parallel_strips_off"))
+        self.parallel_strips.setToolTip(tr.get_text("parallel_strips_tooltip"))
+        self.motion_gating_checkbox.setText(tr.get_text("motion_gating"))
+        self.motion_gating_checkbox.setToolTip(tr.get_text("motion_gating_tooltip"))
+        self.stage_timing_checkbox.setText(tr.get_text("stage_timing"))
+        self.stage_timing_checkbox.setToolTip(tr.get_text("stage_timing_tooltip"))
+        self.performance_hud_checkbox.setText(tr.get_text("performance_hud"))
+        self.performance_hud_checkbox.setToolTip(tr.get_text("performance_hud_tooltip"))
+        self.export_metrics_button.setText(tr.get_text("export_metrics"))
+        self.export_metrics_button.setToolTip(tr.get_text("export_metrics_tooltip"))
         self.camera_info_label.setText(tr.get_text("camera_settings_info"))
+        self.snapshot_format_label.setText(tr.get_text("snapshot_format"))
+        self.snapshot_format.setToolTip(tr.get_text("snapshot_format_tooltip"))
+        self.snapshot_format.setItemText(1, tr.get_text("snapshot_format_png_small"))
+        self.record_codec_label.setText(tr.get_text("record_codec"))
+        self.record_codec.setToolTip(tr.get_text("record_codec_tooltip"))
+        self.burst_checkbox.setText(tr.get_text("burst_buffer"))
+        self.burst_checkbox.setToolTip(tr.get_text("burst_buffer_tooltip"))
+        self.burst_frames_label.setText(tr.get_text("burst_frames"))
+        self.burst_memory_label.setText(tr.get_text("burst_memory"))
+        self.burst_memory.setToolTip(tr.get_text("burst_memory_tooltip"))
         self.about_label.setText(tr.get_text("about_text"))
         self.reset_permission_button.setText(tr.get_text("reset_camera_permission"))
         
@@ -229,7 +416,8 @@ class ColorVisionAid(QMainWindow):
         
         # Şimdi kamerayı başlatmayı dene
         if self.camera_manager.start_camera():
-            self.timer.start(33)  # ~30 FPS
+            self.update_detection_parameters()
+            self.pipeline.start()
             self.status_bar.showMessage(tr.get_text("camera_started"))
             
             # "Durdur" butonu görünümünü güncelle
@@ -251,16 +439,22 @@ class ColorVisionAid(QMainWindow):
                 }
             """)
             
-            # Ekran görüntüsü butonunu göster
+            # Ekran görüntüsü butonlarını göster
             self.snapshot_button.setVisible(True)
+            self.burst_button.setVisible(self.camera_manager.burst.buffer.enabled)
+            self.record_button.setVisible(True)
         else:
             self.status_bar.showMessage(tr.get_text("camera_start_failed"))
             create_camera_ui(self, self.camera_feed_layout)  # Kamera başlatılamazsa başlangıç mesajını göster
 
     def stop_camera(self):
         """Kamerayı durdur"""
+        # Kamera kapatılmadan önce yakalama iş parçacığı durmalı
+        self.pipeline.stop()
+        self.stop_recording()
+        self.performance_hud.hide()
+        self.video_display.clear()
         if self.camera_manager.stop_camera():
-            self.timer.stop()
             
             # Başlangıç mesajına dön
             create_camera_ui(self, self.camera_feed_layout)
@@ -286,70 +480,181 @@ class ColorVisionAid(QMainWindow):
                 }
             """)
             
-            # Ekran görüntüsü butonunu gizle
+            # Ekran görüntüsü butonlarını gizle
             self.snapshot_button.setVisible(False)
+            self.burst_button.setVisible(False)
+            self.record_button.setVisible(False)
 
     def take_snapshot(self):
-        """Ekran görüntüsü al"""
-        success, result = self.camera_manager.take_snapshot()
+        """Ekran görüntüsü al; dosya arka planda yazılır"""
+        success, result = self.camera_manager.take_snapshot(self.current_settings())
+        if not success:
+            self.status_bar.showMessage(tr.get_text("screenshot_failed", result))
+    
+    def take_burst(self):
+        """Seri çekim tamponundaki son kareleri kaydet; dosyalar arka planda yazılır"""
+        success, result = self.camera_manager.take_burst(self.current_settings())
+        if success:
+            self.status_bar.showMessage(tr.get_text("burst_saving", result))
+        else:
+            self.status_bar.showMessage(tr.get_text("burst_failed", result))
+    
+    def on_burst_finished(self, saved, total, error):
+        """Arka planda yazılan seri çekimin sonucunu göster"""
+        if error:
+            self.status_bar.showMessage(tr.get_text("burst_failed", error))
+        else:
+            self.status_bar.showMessage(tr.get_text("burst_saved", saved, total))
+    
+    def toggle_recording(self):
+        """İşlenmiş görüntünün video kaydını başlat/durdur"""
+        recorder = self.pipeline.recorder
+        if recorder.recording:
+            self.stop_recording()
+            return
+        
+        # Video, işlenen karelerin hızında yazılır (kameradan yavaşsa kareler atlanır)
+        fps = self.pipeline.performance.snapshot()['processed_fps']
+        if fps <= 0 and self.pipeline.pacer.source_interval:
+            fps = 1.0 / self.pipeline.pacer.source_interval
+        success, result = recorder.start(round(fps, 1) if fps > 0 else 30.0)
+        if success:
+            self.record_button.setText(tr.get_text("stop_recording"))
+            self.status_bar.showMessage(tr.get_text("recording_started", os.path.basename(result)))
+        else:
+            self.status_bar.showMessage(tr.get_text("recording_failed", result))
+    
+    def stop_recording(self):
+        """Kaydı durdur; kodlayıcı kuyruğu boşaltana kadar kayıt düğmesi kapalı kalır"""
+        recorder = self.pipeline.recorder
+        if recorder.recording:
+            recorder.stop()
+            self.record_button.setEnabled(False)
+    
+    def on_recording_finished(self, path, written, dropped, error):
+        """Kodlayıcı dosyayı kapattı; sonucu göster"""
+        self.record_button.setEnabled(True)
+        # Bu sırada yeni bir kayıt başlamış olabilir; düğme süren kaydı göstersin
+        self.record_button.setText(tr.get_text("stop_recording" if self.pipeline.recorder.recording else "record"))
+        if error:
+            self.status_bar.showMessage(tr.get_text("recording_failed", error))
+        else:
+            self.status_bar.showMessage(tr.get_text("recording_saved", os.path.basename(path), written, dropped))
+    
+    def change_record_codec(self, index):
+        """Sonraki kayıtların kodeğini değiştir"""
+        codec = self.record_codec.itemData(index)
+        self.pipeline.recorder.set_codec(codec)
+        self.settings.setValue("record_codec", codec)
+    
+    def change_burst_enabled(self, enabled):
+        """Seri çekim tamponunu aç/kapat; kapatınca bellek bırakılır"""
+        buffer = self.camera_manager.burst.buffer
+        buffer.enabled = enabled
+        if not enabled:
+            buffer.clear()
+        self.burst_button.setVisible(enabled and self.camera_manager.camera_on)
+        self.settings.setValue("burst_enabled", enabled)
+    
+    def change_burst_frames(self, frames):
+        """Seri çekimde tutulacak kare sayısını değiştir"""
+        self.camera_manager.burst.buffer.configure(max_frames=frames)
+        self.settings.setValue("burst_frames", frames)
+    
+    def change_burst_memory(self, memory_mb):
+        """Seri çekim tamponunun bellek sınırını değiştir"""
+        self.camera_manager.burst.buffer.configure(memory_limit_mb=memory_mb)
+        self.settings.setValue("burst_memory_mb", memory_mb)
+    
+    def on_snapshot_finished(self, success, result):
+        """Arka planda yazılan ekran görüntüsünün sonucunu göster"""
         if success:
             # Dosya yolunu göstermek için dosya adını path'den ayır
             filename = os.path.basename(result)
             self.status_bar.showMessage(tr.get_text("screenshot_saved", filename))
         else:
             self.status_bar.showMessage(tr.get_text("screenshot_failed", result))
+    
+    def change_snapshot_format(self, index):
+        """Ekran görüntülerinin kaydedileceği biçimi değiştir"""
+        image_format, level = self.snapshot_format.itemData(index)
+        self.camera_manager.snapshot_writer.set_format(image_format, level)
+        self.settings.setValue("snapshot_format", image_format)
+        self.settings.setValue("snapshot_level", level)
 
     def open_gallery(self):
         """Galeriyi aç"""
         gallery = ScreenshotGallery(self)
         gallery.exec_()
 
+    def update_detection_parameters(self):
+        """Ayar panelindeki değerleri işleme iş hattına aktar"""
+        selected_colors = {
+            'red': self.red_checkbox.isChecked(),
+            'green': self.green_checkbox.isChecked(),
+            'blue': self.blue_checkbox.isChecked(),
+            'yellow': self.yellow_checkbox.isChecked()
+        }
+        
+        # Çevrilmiş renk isimleri
+        color_translated = {
+            'red': tr.get_text("red"),
+            'green': tr.get_text("green"),
+            'blue': tr.get_text("blue"),
+            'yellow': tr.get_text("yellow")
+        }
+        
+        self.pipeline.set_parameters(
+            selected_colors,
+            self.sensitivity_slider.value(),
+            self.contrast_slider.value(),
+            color_translated
+        )
+
     def update_frame(self):
-        ret, frame = self.camera_manager.get_frame()
-        if ret:
-            selected_colors = {
-                'red': self.red_checkbox.isChecked(),
-                'green': self.green_checkbox.isChecked(),
-                'blue': self.blue_checkbox.isChecked(),
-                'yellow': self.yellow_checkbox.isChecked()
-            }
-            
-            # Çevrilmiş renk isimleri
-            color_translated = {
-                'red': tr.get_text("red"),
-                'green': tr.get_text("green"),
-                'blue': tr.get_text("blue"),
-                'yellow': tr.get_text("yellow")
-            }
+        """İş hattından gelen en son işlenmiş kareyi göster"""
+        combined_result = self.pipeline.take_processed()
+        if combined_result is not None:
+            # Ayar değişikliklerini bir sonraki kareye yansıt
+            self.update_detection_parameters()
             
-            # Renk detektörü ile kareyi işle
-            combined_result = self.color_detector.process_frame(
-                frame, 
-                selected_colors,
-                self.sensitivity_slider.value(),
-                self.contrast_slider.value(),
-                color_translated
-            )
+            # İlk karede başlatma mesajını kalıcı görüntü alanıyla değiştir
+            if self.video_display.parent() is not self.camera_feed_container:
+                for i in reversed(range(self.camera_feed_layout.count())): 
+                    self.camera_feed_layout.itemAt(i).widget().setParent(None)
+                self.camera_feed_layout.addWidget(self.video_display)
             
-            # Sonucu QImage'a çevir ve göster
-            h, w, c = combined_result.shape
-            bytesPerLine = 3 * w
-            qImg = QImage(combined_result.data, w, h, bytesPerLine, QImage.Format_RGB888).rgbSwapped()
+            # Kareyi ver; ölçekleme ve çizim paintEvent içinde yapılır
+            self.video_display.set_frame(combined_result)
             
-            # Tüm mevcut widget'ları temizle
-            for i in reversed(range(self.camera_feed_layout.count())): 
-                self.camera_feed_layout.itemAt(i).widget().setParent(None)
-                
-            # Resim etiketini oluştur ve ekle
-            image_label = QLabel()
-            image_label.setPixmap(QPixmap.fromImage(qImg).scaled(
-                self.camera_feed_container.width() - 40,  # Kenar boşluklarını hesaba kat
-                self.camera_feed_container.height() - 40, 
-                Qt.KeepAspectRatio
-            ))
-            image_label.setAlignment(Qt.AlignCenter)
-            self.camera_feed_layout.addWidget(image_label)
+            if self.performance_hud_checkbox.isChecked():
+                self.update_performance_hud()
+            if self.color_detector.timer.enabled:
+                self.update_stage_timing()
     
+    def on_processing_budget_changed(self, over_budget, processing_ms, interval_ms):
+        """İşleme kamera hızına yetişemediğinde veya yeniden yetiştiğinde bildir"""
+        if over_budget:
+            self.status_bar.showMessage(tr.get_text("processing_budget_exceeded", processing_ms, interval_ms))
+        else:
+            self.status_bar.showMessage(tr.get_text("processing_budget_ok"), 5000)
+    
+    def on_processing_failed(self, message):
+        """Yakalanamayan veya işlenemeyen kareyi bildir; iş hattı sonraki karelerle devam eder"""
+        self.status_bar.showMessage(tr.get_text("processing_failed", message))
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken arka plan iş parçacıklarını durdur"""
+        self.pipeline.stop()
+        self.camera_manager.stop_camera()
+        
+        # Kuyrukta bekleyen ekran görüntülerini kaybetme
+        self.pipeline.recorder.stop()
+        self.pipeline.recorder.wait()
+        self.camera_manager.burst.wait()
+        self.camera_manager.snapshot_writer.close()
+        super().closeEvent(event)
+
     def toggle_camera(self):
         """Kamerayı açıp kapatma"""
         if self.camera_manager.camera_on:
@@ -0,0 +1,207 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+from functools import cached_property
+from PIL import Image
+
+# Ekran görüntüleri klasöründeki dizin dosyası (gizli, galeri desenine uymaz)
+MANIFEST_FILENAME = ".manifest.sqlite"
+
+SCREENSHOT_PATTERN = re.compile(r'^screenshot_(\d+)\.(png|jpg|webp)$', re.IGNORECASE)
+
+def screenshots_directory():
+    """Ekran görüntüleri klasörü (source klasörünün üstünde), yoksa oluşturulur"""
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    screenshots_dir = os.path.join(root_dir, "screenshots")
+    os.makedirs(screenshots_dir, exist_ok=True)
+    return screenshots_dir
+
+class ScreenshotEntry:
+    """Dizindeki tek bir ekran görüntüsü kaydı"""
+
+    def __init__(self, directory, filename, number, created, size, width, height, settings):
+        self.path = os.path.join(directory, filename)
+        self.filename = filename
+        self.number = number
+        self.created = created
+        self.size = size
+        self.width = width
+        self.height = height
+        self._settings_json = settings
+
+    @cached_property
+    def settings(self):
+        """Çekim ayarları sözlüğü (ilk erişimde çözülür ve saklanır)"""
+        return json.loads(self._settings_json) if self._settings_json else {}
+
+class ScreenshotManifest:
+    """
+    Ekran görüntülerinin kalıcı dizini (klasördeki bir SQLite dosyası)
+
+    Her görüntü için dosya adı, oluşturulma zamanı, boyut, çözünürlük ve çekim
+    ayarları tutulur. Galeri ve sıra numarası klasörü taramak yerine bu dizini
+    okur. Klasör dışarıdan değişirse (dosya eklenir, silinir veya yerine
+    yenisi yazılırsa) klasörün değişiklik zamanı farklılaşır; reconcile()
+    yalnızca o zaman klasörü tarar ve yalnızca yeni ya da boyutu/zamanı
+    değişmiş dosyaların bilgilerini okur.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(directory, MANIFEST_FILENAME), check_same_thread=False)
+        
+        # Günlük dosyası silinip yeniden oluşturulursa klasörün değişiklik zamanı
+        # her işlemde değişir; PERSIST modunda dosya yerinde kalır
+        self._connection.execute("PRAGMA journal_mode=PERSIST")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS screenshots (
+                filename TEXT PRIMARY KEY,
+                number INTEGER NOT NULL,
+                created REAL NOT NULL,
+                size INTEGER,
+                width INTEGER,
+                height INTEGER,
+                settings TEXT
+            );
+            CREATE INDEX IF NOT EXISTS screenshots_number ON screenshots (number);
+            CREATE INDEX IF NOT EXISTS screenshots_created ON screenshots (created);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        self._connection.commit()
+
+    def _directory_mtime(self):
+        return os.stat(self.directory).st_mtime_ns
+
+    def _stored_mtime(self):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'directory_mtime'").fetchone()
+        return int(row[0]) if row else None
+
+    def _store_mtime(self, mtime):
+        self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('directory_mtime', ?)",
+                                 (str(mtime),))
+
+    def is_in_sync(self):
+        """Klasör son eşitlemeden bu yana dışarıdan değişmedi mi"""
+        with self._lock:
+            return self._stored_mtime() == self._directory_mtime()
+
+    def reconcile(self):
+        """
+        Dizini klasörle eşitle (klasör değişmediyse hiçbir dosyaya bakılmaz)
+
+        Returns:
+            Klasör tarandıysa True
+        """
+        with self._lock:
+            mtime = self._directory_mtime()
+            if self._stored_mtime() == mtime:
+                return False
+
+            stats = {entry.name: entry.stat() for entry in os.scandir(self.directory)
+                     if entry.is_file() and SCREENSHOT_PATTERN.match(entry.name)}
+            known = {row[0]: (row[1], row[2]) for row in
+                     self._connection.execute("SELECT filename, created, size FROM screenshots")}
+
+            vanished = known.keys() - stats.keys()
+            self._connection.executemany("DELETE FROM screenshots WHERE filename = ?",
+                                         [(name,) for name in vanished])
+            for name, stat in stats.items():
+                if known.get(name) != (stat.st_mtime, stat.st_size):
+                    self._insert(name, None, stat=stat)
+            self._store_mtime(mtime)
+            self._connection.commit()
+            return True
+
+    def _insert(self, filename, settings, width=None, height=None, stat=None):
+        """Dosyanın bilgilerini okuyup kaydı ekle veya güncelle (kilit tutulurken çağrılır)"""
+        path = os.path.join(self.directory, filename)
+        try:
+            stat = stat or os.stat(path)
+        except OSError:
+            return
+        if width is None or height is None:
+            try:
+                # PIL yalnızca dosya başlığını okur
+                with Image.open(path) as image:
+                    width, height = image.size
+            except Exception:
+                width = height = None
+        number = int(SCREENSHOT_PATTERN.match(filename).group(1))
+        # Yerine yazılan dosyada önceki çekim ayarları korunur
+        self._connection.execute(
+            "INSERT INTO screenshots (filename, number, created, size, width, height, settings) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (filename) DO UPDATE SET number = excluded.number, created = excluded.created, "
+            "size = excluded.size, width = excluded.width, height = excluded.height, "
+            "settings = COALESCE(excluded.settings, settings)",
+            (filename, number, stat.st_mtime, stat.st_size, width, height,
+             json.dumps(settings) if settings else None))
+
+    def add(self, path, width, height, settings=None, was_in_sync=False):
+        """
+        Uygulamanın yazdığı bir ekran görüntüsünü kaydet
+
+        Args:
+            path: Yazılan dosyanın yolu
+            width, height: Görüntü boyutu
+            settings: Çekim ayarları sözlüğü
+            was_in_sync: Dosya yazılmadan önce is_in_sync() True idiyse, klasör
+                değişikliği bu dosyadan ibarettir ve tarama gerekmez
+        """
+        with self._lock:
+            self._insert(os.path.basename(path), settings, width, height)
+            if was_in_sync:
+                self._store_mtime(self._directory_mtime())
+            self._connection.commit()
+
+    def remove(self, path, was_in_sync=False):
+        """Silinen bir ekran görüntüsünün kaydını kaldır (was_in_sync: add ile aynı)"""
+        with self._lock:
+            self._connection.execute("DELETE FROM screenshots WHERE filename = ?", (os.path.basename(path),))
+            if was_in_sync:
+                self._store_mtime(self._directory_mtime())
+            self._connection.commit()
+
+    def next_number(self):
+        """Kullanılmamış bir sonraki sıra numarası"""
+        with self._lock:
+            row = self._connection.execute("SELECT MAX(number) FROM screenshots").fetchone()
+        return (row[0] or 0) + 1
+
+    def entries(self):
+        """
+        Tüm kayıtlar, en yeniden en eskiye
+
+        Returns:
+            ScreenshotEntry listesi
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT filename, number, created, size, width, height, settings "
+                "FROM screenshots ORDER BY created DESC, number DESC").fetchall()
+        return [ScreenshotEntry(self.directory, *row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+def get_manifest(directory=None):
+    """
+    Klasörün paylaşılan dizin nesnesini döndür
+
+    Args:
+        directory: Ekran görüntüleri klasörü (varsayılan: screenshots_directory())
+    """
+    directory = os.path.abspath(directory or screenshots_directory())
+    with _manifests_lock:
+        manifest = _manifests.get(directory)
+        if manifest is None:
+            manifest = _manifests[directory] = ScreenshotManifest(directory)
+        return manifest
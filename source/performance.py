@@ -0,0 +1,176 @@
+import csv
+import json
+import threading
+import time
+from collections import deque
+import numpy as np
+
+# Paketin kendi modüllerini import et
+from .translations import translator as tr
+
+# FPS değerlerinin hesaplandığı kayan pencere (saniye)
+FPS_WINDOW = 2.0
+
+# Gecikme yüzdelikleri için tutulan son ölçüm sayısı
+LATENCY_WINDOW = 300
+
+# Dışa aktarım için saklanan en fazla kare kaydı (30 FPS'de yaklaşık bir saat)
+SESSION_MAX_FRAMES = 108000
+
+class PerformanceMonitor:
+    """
+    Yakalama, işleme ve görüntüleme hızını ve uçtan uca gecikmeyi ölçer
+
+    Zaman damgaları time.perf_counter() ile alınır: kare kameradan yakalandığında
+    (CameraManager.grab_frame), işleme bittiğinde ve kare ekrana çizildiğinde.
+    Kayıtlar farklı iş parçacıklarından gelebilir. Gösterilen her kare için
+    bir kayıt oturum boyunca saklanır ve CSV veya JSON olarak dışa aktarılabilir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Yeni bir ölçüm oturumu başlat"""
+        with self._lock:
+            self.session_start = time.perf_counter()
+            self.session_started_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+            self.captured = 0
+            self.processed = 0
+            self.displayed = 0
+            self.dropped = 0
+            self._capture_times = deque()
+            self._processed_times = deque()
+            self._display_times = deque()
+            self._latencies = deque(maxlen=LATENCY_WINDOW)
+            self._frames = deque(maxlen=SESSION_MAX_FRAMES)
+
+    def _append_time(self, times, timestamp):
+        """Zaman damgasını ekle ve FPS penceresinden çıkanları at"""
+        times.append(timestamp)
+        while times and timestamp - times[0] > FPS_WINDOW:
+            times.popleft()
+
+    def record_capture(self, timestamp):
+        """Kameradan bir kare okundu"""
+        with self._lock:
+            self.captured += 1
+            self._append_time(self._capture_times, timestamp)
+
+    def record_processed(self, timestamp):
+        """Bir karenin işlenmesi bitti"""
+        with self._lock:
+            self.processed += 1
+            self._append_time(self._processed_times, timestamp)
+
+    def record_display(self, capture_time, processed_time, display_time):
+        """
+        Bir kare ekrana çizildi
+
+        Args:
+            capture_time: Karenin kameradan okunduğu an
+            processed_time: Karenin işlenmesinin bittiği an
+            display_time: Karenin çizildiği an
+        """
+        with self._lock:
+            self.displayed += 1
+            self._append_time(self._display_times, display_time)
+            self._latencies.append(display_time - capture_time)
+            self._frames.append((self.displayed, capture_time, processed_time, display_time))
+
+    def _rate(self, times, now):
+        """Penceredeki zaman damgalarından saniyedeki kare sayısını hesapla"""
+        recent = [timestamp for timestamp in times if now - timestamp <= FPS_WINDOW]
+        if len(recent) < 2:
+            return 0.0
+        return (len(recent) - 1) / (recent[-1] - recent[0])
+
+    def snapshot(self):
+        """
+        Güncel ölçümleri döndür
+
+        Returns:
+            Sözlük: FPS değerleri, kare sayaçları ve gecikme yüzdelikleri (ms)
+        """
+        now = time.perf_counter()
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000.0
+            stats = {
+                'capture_fps': self._rate(self._capture_times, now),
+                'processed_fps': self._rate(self._processed_times, now),
+                'display_fps': self._rate(self._display_times, now),
+                'captured': self.captured,
+                'processed': self.processed,
+                'displayed': self.displayed,
+                'dropped': self.dropped
+            }
+        for percentile in (50, 95, 99):
+            stats[f'latency_p{percentile}_ms'] = float(np.percentile(latencies, percentile)) if latencies.size else 0.0
+        return stats
+
+    def format_hud(self):
+        """Ekran üstü gösterge için kısa metin"""
+        stats = self.snapshot()
+        labels = [tr.get_text(key) for key in ("hud_capture", "hud_processed", "hud_display",
+                                               "hud_dropped", "hud_latency")]
+        width = max(len(label) for label in labels)
+        capture, processed, display, dropped, latency = (f"{label:<{width}}" for label in labels)
+        return (f"{capture} {stats['capture_fps']:5.1f} FPS\n"
+                f"{processed} {stats['processed_fps']:5.1f} FPS\n"
+                f"{display} {stats['display_fps']:5.1f} FPS\n"
+                f"{dropped} {stats['dropped']:5d}\n"
+                f"{latency} p50 {stats['latency_p50_ms']:.0f} / p95 {stats['latency_p95_ms']:.0f} / "
+                f"p99 {stats['latency_p99_ms']:.0f} ms")
+
+    def session_frames(self):
+        """
+        Oturumda gösterilen karelerin kayıtları
+
+        Returns:
+            Sözlük listesi; zamanlar oturum başlangıcına göre saniye, gecikmeler ms
+        """
+        with self._lock:
+            frames = list(self._frames)
+            start = self.session_start
+        return [{
+            'frame': index,
+            'capture_s': round(capture_time - start, 6),
+            'processed_s': round(processed_time - start, 6),
+            'displayed_s': round(display_time - start, 6),
+            'processing_ms': round((processed_time - capture_time) * 1000.0, 3),
+            'latency_ms': round((display_time - capture_time) * 1000.0, 3)
+        } for index, capture_time, processed_time, display_time in frames]
+
+    def export(self, path, settings=None):
+        """
+        Oturumu dosyaya yaz; biçim uzantıdan seçilir (.json, diğerleri CSV)
+
+        Args:
+            path: Hedef dosya yolu
+            settings: Sonuçlarla birlikte kaydedilecek ayarlar sözlüğü
+        """
+        frames = self.session_frames()
+        summary = {key: round(value, 3) for key, value in self.snapshot().items()}
+        settings = settings or {}
+
+        if path.lower().endswith('.json'):
+            report = {
+                'session_start': self.session_started_at,
+                'settings': settings,
+                'summary': summary,
+                'frames': frames
+            }
+            with open(path, 'w', encoding='utf-8') as output_file:
+                json.dump(report, output_file, indent=2)
+            return
+
+        # CSV: ayarlar ve özet yorum satırları olarak, ardından kare tablosu
+        with open(path, 'w', encoding='utf-8', newline='') as output_file:
+            output_file.write(f"# session_start,{self.session_started_at}\n")
+            for key, value in list(settings.items()) + list(summary.items()):
+                output_file.write(f"# {key},{value}\n")
+            writer = csv.DictWriter(output_file, fieldnames=['frame', 'capture_s', 'processed_s', 'displayed_s',
+                                                             'processing_ms', 'latency_ms'])
+            writer.writeheader()
+            writer.writerows(frames)
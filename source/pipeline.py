@@ -0,0 +1,405 @@
+import threading
+import time
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# Paketin kendi modüllerini import et
+from .utils import BufferPool
+from .performance import PerformanceMonitor
+from .recorder import VideoRecorder
+
+# stop() içinde her iş parçacığının bitmesi için beklenecek en uzun süre (saniye)
+PIPELINE_STOP_TIMEOUT = 2.0
+
+class LatestFrameSlot:
+    """
+    Tek elemanlı devir noktası: yeni öğe, alınmamış eski öğenin yerine geçer
+
+    Üretici hiçbir zaman beklemez; tüketici her zaman en son öğeyi alır.
+    Yerine yazılan (bayat) öğeler kuyruğa alınmaz, yalnızca sayılır.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._item = None
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        """
+        Öğeyi yerleştir
+
+        Returns:
+            Yuva önceden boşsa True (tüketicinin uyandırılması gerekir)
+        """
+        with self._condition:
+            was_empty = self._item is None
+            if not was_empty:
+                self.dropped += 1
+            self._item = item
+            self._condition.notify()
+            return was_empty
+
+    def take(self, timeout=None):
+        """
+        En son öğeyi al ve yuvayı boşalt
+
+        Args:
+            timeout: En fazla bekleme süresi (saniye); 0 ise beklemez
+
+        Returns:
+            Öğe veya yuva boşsa/kapatıldıysa None
+        """
+        with self._condition:
+            if timeout != 0:
+                self._condition.wait_for(lambda: self._item is not None or self._closed, timeout)
+            item = self._item
+            self._item = None
+            return item
+
+    def peek(self):
+        """Yuvadaki öğeyi almadan döndür"""
+        with self._condition:
+            return self._item
+
+    def close(self):
+        """Bekleyen tüketicileri uyandır ve yuvayı boşalt"""
+        with self._condition:
+            self._closed = True
+            self._item = None
+            self._condition.notify_all()
+
+    def reopen(self):
+        with self._condition:
+            self._closed = False
+            self._item = None
+            self.dropped = 0
+
+class FramePacer:
+    """
+    Kaynağın kare aralığını ve işleme süresini ölçer, hangi karelerin çözüleceğine karar verir
+
+    Kamera kendi hızında kare üretir; yakalama iş parçacığı her kareyi
+    grab() ile alır ama yalnızca işlenme şansı olan kareleri çözer. İşleyici
+    meşgulken bir sonraki kare de onun işi bitmeden gelecekse, bu kare zaten
+    atılacağı için çözülmez. Böylece işleme bütçesi (kaynak kare aralığı)
+    aşıldığında yakalama tarafı geri çekilir ve bayat kareler birikmez.
+    """
+
+    # Üssel ortalama katsayısı
+    SMOOTHING = 0.1
+
+    # Bütçe aşımı için histerezis: süre aralığın bu oranlarını geçince değişir
+    OVER_BUDGET_RATIO = 1.1
+    UNDER_BUDGET_RATIO = 1.0
+
+    # İlk kareler (tablo/tampon hazırlığı) bütçe kararına katılmaz
+    WARMUP_FRAMES = 10
+
+    # Bundan uzun aralıklar (takılma, duraklatma) ölçüme katılmaz
+    MAX_INTERVAL = 1.0
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.source_interval = None
+        self.processing_time = None
+        self.over_budget = False
+        self.skipped = 0
+        self._processed = 0
+        self._last_grab = None
+        self._processing_started = None
+
+    def _smooth(self, average, sample):
+        if average is None:
+            return sample
+        return average + self.SMOOTHING * (sample - average)
+
+    def on_grab(self, timestamp):
+        """Kaynaktan bir kare yakalandı (yakalama iş parçacığı)"""
+        if self._last_grab is not None:
+            interval = timestamp - self._last_grab
+            if 0 < interval <= self.MAX_INTERVAL:
+                self.source_interval = self._smooth(self.source_interval, interval)
+        self._last_grab = timestamp
+
+    def should_decode(self, timestamp):
+        """
+        Yakalanan kare çözülmeli mi (yakalama iş parçacığı)
+
+        Args:
+            timestamp: Karenin yakalandığı an
+
+        Returns:
+            İşleyici boşta ise ya da bir sonraki kare gelmeden boşalacaksa True
+        """
+        started = self._processing_started
+        if started is None or self.processing_time is None or self.source_interval is None:
+            return True
+        # İşleyici bu kareyi almadan önce bir sonraki kare gelecekse bu kare atılacak
+        if timestamp + self.source_interval < started + self.processing_time:
+            self.skipped += 1
+            return False
+        return True
+
+    def on_processing_started(self, timestamp):
+        self._processing_started = timestamp
+
+    def on_processing_finished(self, timestamp):
+        """
+        Bir karenin işlenmesi bitti (işleme iş parçacığı)
+
+        Returns:
+            Bütçe durumu değiştiyse True
+        """
+        if self._processing_started is not None:
+            self.processing_time = self._smooth(self.processing_time, timestamp - self._processing_started)
+        self._processing_started = None
+        self._processed += 1
+
+        if self._processed < self.WARMUP_FRAMES or self.source_interval is None or self.processing_time is None:
+            return False
+        ratio = self.processing_time / self.source_interval
+        over_budget = ratio > self.OVER_BUDGET_RATIO if not self.over_budget else ratio > self.UNDER_BUDGET_RATIO
+        changed = over_budget != self.over_budget
+        self.over_budget = over_budget
+        return changed
+
+class FramePipeline(QObject):
+    """
+    Kamera yakalama, renk işleme ve görüntüleme aşamalarını ayıran iş hattı
+
+    Yakalama ve işleme ayrı iş parçacıklarında çalışır ve LatestFrameSlot
+    üzerinden el değiştirir; işleme yetişemezse bayat kareler atılır.
+    Bitmiş kareler UI iş parçacığına yalnızca frame_ready sinyali ile
+    bildirilir, UI da take_processed() ile en son kareyi alır. OpenCV
+    işlemleri GIL'i bıraktığı için yakalama ve tespit farklı çekirdeklerde
+    örtüşebilir. Yakalama hızı kameranın kendi kare aralığına göre ayarlanır
+    (bkz. FramePacer); sabit bir zamanlayıcı kullanılmaz.
+    """
+
+    # Yeni işlenmiş kare hazır (UI iş parçacığında take_processed çağrılmalı)
+    frame_ready = pyqtSignal()
+
+    # İşleme bütçesi aşıldı/yeniden sağlandı: (aşıldı mı, işleme süresi ms, kare aralığı ms)
+    budget_changed = pyqtSignal(bool, float, float)
+
+    # Bir kare yakalanamadı veya işlenemedi (hata mesajı); aynı hata art arda yalnızca bir kez bildirilir
+    processing_failed = pyqtSignal(str)
+
+    # İşleme tamponu sayısı: biri yuvada, biri UI'da, biri yazılıyor
+    OUTPUT_BUFFERS = 3
+
+    def __init__(self, camera_manager, color_detector, parent=None):
+        """
+        Args:
+            camera_manager: Kareleri sağlayan CameraManager
+            color_detector: Kareleri işleyen ColorDetector
+            parent: Qt ebeveyn nesnesi
+        """
+        super().__init__(parent)
+        self.camera_manager = camera_manager
+        self.color_detector = color_detector
+
+        self._capture_slot = LatestFrameSlot()
+        self._display_slot = LatestFrameSlot()
+        self._output_pool = BufferPool()
+        self._displayed_index = None
+        self._displayed_times = None
+        self._buffer_lock = threading.Lock()
+        
+        # Hız ve gecikme ölçümü (her start() yeni bir oturum başlatır)
+        self.performance = PerformanceMonitor()
+        self.pacer = FramePacer()
+        
+        # İşlenmiş kareler kayıt açıkken arka planda videoya yazılır
+        self.recorder = VideoRecorder()
+
+        self._parameters = {}
+        self._parameters_lock = threading.Lock()
+
+        self._running = False
+        self._stopped = threading.Event()
+        self._threads = []
+        self._last_error = None
+
+    @property
+    def running(self):
+        return self._running
+
+    @property
+    def dropped_frames(self):
+        """Çözülmeden, işlenmeden ya da gösterilmeden atılan kare sayısı"""
+        return self.pacer.skipped + self._capture_slot.dropped + self._display_slot.dropped
+
+    def set_parameters(self, selected_colors, sensitivity, contrast, color_translations):
+        """
+        İşleme parametrelerini güncelle (UI iş parçacığından çağrılır)
+
+        Args:
+            selected_colors: Dictionary (key=renk adı, value=bool seçili mi)
+            sensitivity: 1-10 arasında duyarlılık değeri
+            contrast: 1-10 arasında kontrast değeri
+            color_translations: Çevrilen renk isimlerini içeren sözlük
+        """
+        with self._parameters_lock:
+            self._parameters = {
+                'selected_colors': dict(selected_colors),
+                'sensitivity': sensitivity,
+                'contrast': contrast,
+                'color_translations': dict(color_translations)
+            }
+
+    def start(self):
+        """Yakalama ve işleme iş parçacıklarını başlat"""
+        if self._running:
+            return
+        self._running = True
+        self._last_error = None
+        # Her başlatma kendi durdurma işaretini kullanır; önceki oturumdan takılı
+        # kalmış bir iş parçacığı yeni oturumun işaretine bakmaz ve sonunda çıkar
+        self._stopped = threading.Event()
+        self._capture_slot.reopen()
+        self._display_slot.reopen()
+        self._displayed_index = None
+        self._displayed_times = None
+        self.performance.reset()
+        self.pacer.reset()
+
+        self._threads = [
+            threading.Thread(target=self._capture_loop, args=(self._stopped,), name="cva-capture", daemon=True),
+            threading.Thread(target=self._process_loop, args=(self._stopped,), name="cva-process", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=PIPELINE_STOP_TIMEOUT):
+        """
+        İş parçacıklarını durdur ve bitmelerini en fazla timeout saniye bekle
+
+        Kamera grab() içinde takılırsa UI sonsuza dek beklemez; takılan iş
+        parçacığı (daemon) geri döndüğünde kendiliğinden çıkar.
+
+        Returns:
+            Tüm iş parçacıkları bittiyse True
+        """
+        if not self._running:
+            return True
+        self._running = False
+        self._stopped.set()
+        self._capture_slot.close()
+        self._display_slot.close()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        stopped = not any(thread.is_alive() for thread in self._threads)
+        self._threads = []
+        return stopped
+
+    def _report_error(self, error):
+        """Hatayı UI'a bildir; aynı hata her karede yeniden gönderilmez"""
+        message = f"{type(error).__name__}: {error}"
+        if message != self._last_error:
+            self._last_error = message
+            self.processing_failed.emit(message)
+
+    def take_processed(self):
+        """
+        En son işlenmiş kareyi al (UI iş parçacığından çağrılır)
+
+        Dönen dizi bir sonraki take_processed çağrısına kadar üzerine yazılmaz.
+
+        Returns:
+            İşlenmiş BGR kare veya yeni kare yoksa None
+        """
+        # Tampon seçimiyle aynı kilit altında al, aksi halde işçi bu tamponu seçebilir
+        with self._buffer_lock:
+            item = self._display_slot.take(timeout=0)
+            if item is None:
+                return None
+            self._displayed_index = item[0]
+            self._displayed_times = item[2:]
+        return item[1]
+    
+    def mark_displayed(self):
+        """Son alınan kare ekrana çizildi (UI iş parçacığından çağrılır)"""
+        if self._displayed_times is None:
+            return
+        self.performance.dropped = self.dropped_frames
+        self.performance.record_display(*self._displayed_times, time.perf_counter())
+        self._displayed_times = None
+
+    def _next_output_buffer(self, shape):
+        """Ne yuvada bekleyen ne de UI'da gösterilen bir çıktı tamponu seç"""
+        with self._buffer_lock:
+            pending = self._display_slot.peek()
+            busy = {self._displayed_index, pending[0] if pending is not None else None}
+        for index in range(self.OUTPUT_BUFFERS):
+            if index not in busy:
+                return index, self._output_pool.get(f'output{index}', shape)
+
+    def _capture_loop(self, stopped):
+        while not stopped.is_set():
+            try:
+                self._capture_once()
+            except Exception as e:
+                # Tek bir karedeki hata yakalamayı durdurmaz
+                self._report_error(e)
+                time.sleep(0.01)
+
+    def _capture_once(self):
+        # grab() kameranın bir sonraki karesini bekler; hız kaynağa göre ayarlanır
+        if not self.camera_manager.grab_frame():
+            # Kamera geçici olarak kare vermezse döngüyü meşgul etme
+            time.sleep(0.01)
+            return
+        capture_time = self.camera_manager.frame_time
+        self.pacer.on_grab(capture_time)
+        self.performance.record_capture(capture_time)
+        
+        # Zaten atılacak kareyi çözme; seri çekim tamponu açıksa her kare çözülüp saklanır
+        decode = self.pacer.should_decode(capture_time)
+        if not decode and not self.camera_manager.burst.buffer.enabled:
+            return
+        ret, frame = self.camera_manager.retrieve_frame()
+        if ret and decode:
+            self._capture_slot.put((frame, capture_time))
+
+    def _process_loop(self, stopped):
+        while not stopped.is_set():
+            item = self._capture_slot.take(timeout=0.1)
+            if item is None:
+                continue
+            try:
+                self._process_item(item)
+            except Exception as e:
+                # Hatalı kare atlanır; görüntü sessizce donmak yerine sonraki karelerle devam eder
+                self._report_error(e)
+            else:
+                self._last_error = None
+
+    def _process_item(self, item):
+        frame, capture_time = item
+
+        with self._parameters_lock:
+            parameters = self._parameters
+        if not parameters:
+            return
+
+        index, output = self._next_output_buffer(frame.shape)
+        self.pacer.on_processing_started(time.perf_counter())
+        result = self.color_detector.process_frame(frame, out=output, **parameters)
+        processed_time = time.perf_counter()
+        self.performance.record_processed(processed_time)
+        
+        # Kayıt yuvası yoksa kare kayıttan atılır; işleme beklemez
+        self.recorder.submit(result)
+        
+        # Bütçe durumu değiştiğinde UI'ı bilgilendir
+        if self.pacer.on_processing_finished(processed_time):
+            self.budget_changed.emit(self.pacer.over_budget, self.pacer.processing_time * 1000.0,
+                                     self.pacer.source_interval * 1000.0)
+
+        # Yuva boşken bir sinyal yeterli; UI her seferinde en son kareyi alır
+        if self._display_slot.put((index, result, capture_time, processed_time)) and self._running:
+            self.frame_ready.emit()
@@ -0,0 +1,194 @@
+import os
+import queue
+import threading
+import time
+import numpy as np
+import cv2
+
+# Kodlayıcıya bekleyen en fazla kare sayısı (önceden ayrılmış yuva sayısı)
+RECORD_SLOTS = 8
+
+# Desteklenen kodekler (FourCC) ve dosya uzantıları
+RECORD_CODECS = {
+    'mp4v': '.mp4',
+    'MJPG': '.avi',
+    'XVID': '.avi'
+}
+
+def recordings_directory():
+    """Kayıt klasörü (source klasörünün üstünde), yoksa oluşturulur"""
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    recordings_dir = os.path.join(root_dir, "recordings")
+    os.makedirs(recordings_dir, exist_ok=True)
+    return recordings_dir
+
+class RecordingSession:
+    """Tek bir kaydın durumu; kodlayıcı iş parçacığı yalnızca kendi oturumunu kullanır"""
+
+    def __init__(self, path, codec, fps, slots):
+        self.path = path
+        self.codec = codec
+        self.fps = fps
+        self.slot_count = slots
+        self.buffers = None
+        self.free = queue.Queue()
+        self.pending = queue.Queue()
+        self.active = True
+        self.written = 0
+        self.dropped = 0
+
+class VideoRecorder:
+    """
+    İşlenmiş kareleri arka plandaki bir cv2.VideoWriter iş parçacığıyla kaydeder
+
+    Kareler sabit sayıda, önceden ayrılmış yuvalara kopyalanıp kodlayıcı
+    kuyruğuna girer; kare başına bellek ayrılmaz ve bellek kullanımı
+    sınırlıdır. Kodlayıcı geride kalıp boş yuva kalmazsa kare atılır ve
+    sayılır; işleme iş parçacığı (dolayısıyla canlı görüntü) hiçbir zaman
+    kodlayıcıyı beklemez. Her kaydın durumu ayrı bir RecordingSession'da
+    tutulur, böylece durdurulan kaydın kodlayıcısı kuyruğu boşaltırken yeni
+    kayıt onu bozmaz. Kayıt bitince on_finished(dosya yolu, yazılan kare,
+    atılan kare, hata mesajı veya "") yazıcı iş parçacığından çağrılır.
+    """
+
+    def __init__(self, slots=RECORD_SLOTS, on_finished=None):
+        """
+        Args:
+            slots: Kodlayıcıya bekleyebilecek en fazla kare sayısı
+            on_finished: Kayıt bittiğinde çağrılacak fonksiyon
+        """
+        self.codec = 'mp4v'
+        self.on_finished = on_finished
+        self._slot_count = slots
+        self._session = None
+        self._thread = None
+
+    @property
+    def recording(self):
+        session = self._session
+        return session is not None and session.active
+
+    @property
+    def path(self):
+        """Süren (ya da son) kaydın dosya yolu"""
+        session = self._session
+        return session.path if session is not None else None
+
+    def set_codec(self, codec):
+        """Sonraki kayıtların kodeğini ayarla ('mp4v', 'MJPG' veya 'XVID')"""
+        if codec not in RECORD_CODECS:
+            raise ValueError(f"Unsupported codec: {codec}")
+        self.codec = codec
+
+    def start(self, fps, directory=None):
+        """
+        Yeni bir kayıt başlat; video boyutu ilk kareden alınır
+
+        Önceki kaydın kodlayıcısı hâlâ kuyruğu boşaltıyorsa beklemeden
+        reddedilir (UI iş parçacığından çağrılır).
+
+        Args:
+            fps: Videonun kare hızı
+            directory: Hedef klasör (varsayılan: recordings_directory())
+
+        Returns:
+            (başlatıldı mı, dosya yolu veya hata mesajı)
+        """
+        if self.recording:
+            return False, "Already recording"
+        if self._thread is not None and self._thread.is_alive():
+            return False, "Previous recording is still being saved"
+
+        session = RecordingSession(self._unique_path(directory or recordings_directory()),
+                                   self.codec, fps, self._slot_count)
+        self._session = session
+        self._thread = threading.Thread(target=self._write_loop, args=(session,),
+                                        name="cva-recorder", daemon=True)
+        self._thread.start()
+        return True, session.path
+
+    def _unique_path(self, directory):
+        # Aynı saniyede başlayan kayıtlar birbirinin üzerine yazmasın
+        now = time.time()
+        stem = f"recording_{time.strftime('%Y%m%d_%H%M%S', time.localtime(now))}_{int(now * 1000) % 1000:03d}"
+        extension = RECORD_CODECS[self.codec]
+        path = os.path.join(directory, f"{stem}{extension}")
+        counter = 1
+        while os.path.exists(path):
+            path = os.path.join(directory, f"{stem}_{counter}{extension}")
+            counter += 1
+        return path
+
+    def submit(self, frame):
+        """
+        Kareyi kodlayıcıya ver (işleme iş parçacığından çağrılır, beklemez)
+
+        Args:
+            frame: OpenCV BGR formatında işlenmiş kare; kopyalanır
+        """
+        session = self._session
+        if session is None or not session.active:
+            return
+        if session.buffers is None:
+            # Yuvalar ilk karede, kare boyutu belli olunca bir kez ayrılır
+            session.buffers = [np.empty_like(frame) for _ in range(session.slot_count)]
+            for index in range(session.slot_count):
+                session.free.put(index)
+        elif session.buffers[0].shape != frame.shape:
+            # Video boyutu kayıt sırasında değişemez
+            session.dropped += 1
+            return
+
+        try:
+            index = session.free.get_nowait()
+        except queue.Empty:
+            # Kodlayıcı geride: kareyi at, canlı görüntüyü bekletme
+            session.dropped += 1
+            return
+        np.copyto(session.buffers[index], frame)
+        session.pending.put(index)
+
+    def stop(self):
+        """Kaydı bitir; kuyruktaki kareler yazıldıktan sonra dosya kapatılır"""
+        session = self._session
+        if session is None or not session.active:
+            return
+        session.active = False
+        session.pending.put(None)
+
+    def wait(self, timeout=None):
+        """Kodlayıcı iş parçacığının bitmesini bekle"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _write_loop(self, session):
+        writer = None
+        error = ""
+        try:
+            while True:
+                index = session.pending.get()
+                if index is None:
+                    break
+                frame = session.buffers[index]
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    writer = cv2.VideoWriter(session.path, cv2.VideoWriter_fourcc(*session.codec),
+                                             session.fps, (width, height))
+                    if not writer.isOpened():
+                        error = f"Cannot open video writer for {session.codec}"
+                        session.active = False
+                        break
+                writer.write(frame)
+                session.written += 1
+                session.free.put(index)
+        except Exception as e:
+            error = str(e)
+            session.active = False
+        finally:
+            if writer is not None:
+                writer.release()
+
+        if not error and session.written == 0:
+            error = "No frames were recorded"
+        if self.on_finished is not None:
+            self.on_finished(session.path, session.written, session.dropped, error)
@@ -0,0 +1,198 @@
+import os
+import queue
+import tempfile
+import threading
+import cv2
+
+# Paketin kendi modüllerini import et
+from .manifest import get_manifest
+
+# Bekleyen en fazla ekran görüntüsü sayısı (dolarsa yeni istek reddedilir)
+SNAPSHOT_QUEUE_SIZE = 8
+
+# Desteklenen biçimler: uzantı ve OpenCV sıkıştırma/kalite parametresi
+SNAPSHOT_FORMATS = {
+    'png': ('.png', cv2.IMWRITE_PNG_COMPRESSION),
+    'jpg': ('.jpg', cv2.IMWRITE_JPEG_QUALITY),
+    'webp': ('.webp', cv2.IMWRITE_WEBP_QUALITY)
+}
+
+# Biçim başına varsayılan seviye (PNG: 0-9 sıkıştırma, JPEG/WebP: 1-100 kalite)
+DEFAULT_FORMAT_LEVELS = {
+    'png': 3,
+    'jpg': 95,
+    'webp': 95
+}
+
+class SnapshotWriter:
+    """
+    Ekran görüntülerini arka plandaki bir iş parçacığında diske yazar
+
+    Dosya numarası bellekte tutulan bir sayaçtan alınır; sayaç ilk yazımda,
+    yazan iş parçacığında ekran görüntüsü dizininden (manifest) bir kez
+    okunur. İstekler sınırlı bir kuyruğa girer, UI hiçbir zaman dizin
+    taramasını, kodlamayı veya disk yazımını beklemez. Dosya önce gizli bir
+    geçici adla yazılır, sonra mevcut bir dosyanın üzerine yazmadan son adına
+    bağlanır; o numara bu arada klasöre başka bir programca eklendiyse sayaç
+    dizinden yeniden okunur ve sonraki numara denenir. Böylece yarım dosya
+    görünmez ve hiçbir ekran görüntüsü ezilmez; dosya ardından boyutu ve
+    çekim ayarlarıyla dizine eklenir.
+    Yazım bitince on_complete(başarılı mı, dosya yolu veya hata mesajı) yazıcı
+    iş parçacığından çağrılır.
+    """
+
+    def __init__(self, directory=None, queue_size=SNAPSHOT_QUEUE_SIZE, on_complete=None):
+        """
+        Args:
+            directory: Hedef klasör (varsayılan: screenshots_directory())
+            queue_size: Bekleyen en fazla istek sayısı
+            on_complete: Her yazımdan sonra çağrılacak fonksiyon
+        """
+        self.directory = directory
+        self.on_complete = on_complete
+        self.image_format = 'png'
+        self.level = DEFAULT_FORMAT_LEVELS['png']
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._next_number = None
+        self._thread = None
+
+    def set_format(self, image_format, level=None):
+        """
+        Yeni ekran görüntülerinin biçimini ayarla
+
+        Args:
+            image_format: 'png', 'jpg' veya 'webp'
+            level: PNG için 0-9 sıkıştırma, JPEG/WebP için 1-100 kalite (None: varsayılan)
+        """
+        if image_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unsupported snapshot format: {image_format}")
+        self.image_format = image_format
+        self.level = DEFAULT_FORMAT_LEVELS[image_format] if level is None else int(level)
+
+    @property
+    def manifest(self):
+        """Hedef klasörün ekran görüntüsü dizini"""
+        manifest = get_manifest(self.directory)
+        self.directory = manifest.directory
+        return manifest
+
+    def _reserve_number(self):
+        """Bir sonraki dosya numarasını ayır (sayaç yalnızca gerektiğinde dizinden okunur)"""
+        with self._lock:
+            if self._next_number is None:
+                manifest = self.manifest
+                manifest.reconcile()
+                self._next_number = manifest.next_number()
+            number = self._next_number
+            self._next_number += 1
+        return number
+
+    def _claim_path(self, temporary_path, extension):
+        """
+        Yazılmış geçici dosyaya, var olan bir dosyanın üzerine yazmadan son adını ver
+
+        Returns:
+            (dosyanın son yolu, hiçbir numara dışarıdan kullanılmış değilse True)
+        """
+        clean = True
+        while True:
+            path = os.path.join(self.directory, f"screenshot_{self._reserve_number()}{extension}")
+            try:
+                # Bağlantı, hedef varsa başarısız olur; kontrol ve adlandırma tek adımdır
+                os.link(temporary_path, path)
+            except FileExistsError:
+                pass
+            except OSError:
+                # Sabit bağlantı desteklemeyen dosya sistemleri
+                if not os.path.exists(path):
+                    os.replace(temporary_path, path)
+                    return path, clean
+            else:
+                os.remove(temporary_path)
+                return path, clean
+
+            # Numara dışarıdan kullanılmış: sayacı dizinden yeniden oku
+            clean = False
+            with self._lock:
+                self._next_number = None
+
+    def submit(self, frame, settings=None):
+        """
+        Kareyi yazılmak üzere kuyruğa ekle
+
+        Args:
+            frame: OpenCV BGR formatında kare; yazım bitene kadar değiştirilmemeli
+            settings: Dizine kaydedilecek çekim ayarları sözlüğü
+
+        Returns:
+            (kuyruğa alındı mı, hata mesajı veya ""); dosya yolu yazım bitince
+            on_complete ile bildirilir
+        """
+        extension, parameter = SNAPSHOT_FORMATS[self.image_format]
+        try:
+            self._queue.put_nowait((frame, extension, [parameter, self.level], settings))
+        except queue.Full:
+            return False, "Snapshot queue is full"
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._write_loop, name="cva-snapshot", daemon=True)
+            self._thread.start()
+        return True, ""
+
+    def write(self, frame, settings=None):
+        """
+        Kareyi çağıran iş parçacığında hemen yaz (kuyruğu kullanmaz)
+
+        Seri çekim gibi kendi iş parçacığında çok sayıda kare yazanlar içindir;
+        numaralandırma ve dizin kaydı submit ile aynıdır.
+
+        Returns:
+            (başarılı mı, dosya yolu veya hata mesajı)
+        """
+        extension, parameter = SNAPSHOT_FORMATS[self.image_format]
+        return self._write(frame, extension, [parameter, self.level], settings)
+
+    def pending(self):
+        """Kuyrukta bekleyen istek sayısı"""
+        return self._queue.qsize()
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            frame, extension, parameters, settings = item
+            success, result = self._write(frame, extension, parameters, settings)
+            if self.on_complete is not None:
+                self.on_complete(success, result)
+
+    def _write(self, frame, extension, parameters, settings):
+        manifest = self.manifest
+        temporary_path = None
+        try:
+            # Klasör dışarıdan değişmediyse, yazımdan sonra yeniden taranması gerekmez
+            was_in_sync = manifest.is_in_sync()
+            descriptor, temporary_path = tempfile.mkstemp(suffix=extension, prefix='.snapshot_',
+                                                          dir=self.directory)
+            os.close(descriptor)
+            if not cv2.imwrite(temporary_path, frame, parameters):
+                os.remove(temporary_path)
+                return False, f"Cannot write screenshot{extension}"
+            path, clean = self._claim_path(temporary_path, extension)
+            height, width = frame.shape[:2]
+            manifest.add(path, width, height, settings, was_in_sync and clean)
+            return True, path
+        except Exception as e:
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return False, str(e)
+
+    def close(self, timeout=None):
+        """Kuyruktaki tüm görüntüleri yaz ve iş parçacığını durdur"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
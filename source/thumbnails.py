@@ -0,0 +1,184 @@
+import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+
+# Küçük resimlerin en uzun kenarı (piksel)
+THUMBNAIL_SIZE = 150
+
+# Ekran görüntüleri klasörü içindeki önbellek klasörü (gizli, manifest taramasına girmez)
+THUMBNAIL_DIRNAME = ".thumbnails"
+
+# Küçük resimler için JPEG kalitesi
+THUMBNAIL_QUALITY = 85
+
+# OpenCV'nin azaltılmış çözünürlükte okuma seçenekleri (büyükten küçüğe)
+REDUCED_READ_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2)
+)
+
+def reduced_read_flag(width, height, size=THUMBNAIL_SIZE):
+    """
+    Küçük resmi hâlâ doldurabilecek en küçük çözünürlükte okuma seçeneği
+
+    Args:
+        width, height: Görüntünün gerçek boyutu (bilinmiyorsa None)
+        size: Küçük resmin en uzun kenarı
+
+    Returns:
+        cv2.imread için okuma bayrağı
+    """
+    if width and height:
+        for factor, flag in REDUCED_READ_FLAGS:
+            if max(width, height) / factor >= size:
+                return flag
+    return cv2.IMREAD_COLOR
+
+class ThumbnailCache:
+    """
+    Ekran görüntülerinin küçük resimlerini diskte saklayan önbellek
+
+    Küçük resimler ekran görüntülerinin yanındaki gizli bir klasörde JPEG
+    olarak tutulur. Anahtar dosya adı, değişiklik zamanı ve dosya boyutudur;
+    dosya değişirse yeni anahtar oluşur ve eski küçük resim kullanılmaz.
+    Eksik küçük resimler arka plandaki bir iş parçacığı havuzunda üretilir;
+    görüntü mümkünse azaltılmış çözünürlükte okunur (JPEG için çözücü yalnızca
+    gereken ölçekte çözer), böylece tam boyutlu kare hiç belleğe alınmaz.
+    """
+
+    def __init__(self, directory, size=THUMBNAIL_SIZE, workers=None):
+        """
+        Args:
+            directory: Ekran görüntüleri klasörü
+            size: Küçük resimlerin en uzun kenarı
+            workers: Havuzdaki iş parçacığı sayısı (varsayılan: çekirdek sayısı, en fazla 4)
+        """
+        self.directory = os.path.join(directory, THUMBNAIL_DIRNAME)
+        self.size = size
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._executor = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="cva-thumbnail")
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def key(self, entry):
+        """
+        Bir manifest kaydının önbellek dosyası adı
+
+        Args:
+            entry: ScreenshotEntry (dosya adı, değişiklik zamanı ve boyut içerir)
+        """
+        digest = hashlib.sha1(f"{entry.filename}|{entry.created!r}|{entry.size}|{self.size}".encode()).hexdigest()
+        return f"{digest[:20]}.jpg"
+
+    def cached_names(self):
+        """Önbellekte bulunan dosya adları (tek bir klasör okuması)"""
+        try:
+            # Noktayla başlayanlar henüz yazılmakta olan geçici dosyalardır
+            return {entry.name for entry in os.scandir(self.directory)
+                    if entry.is_file() and not entry.name.startswith('.')}
+        except FileNotFoundError:
+            return set()
+
+    def cached_path(self, entry, cached_names=None):
+        """
+        Kaydın küçük resmi önbellekteyse yolunu döndür
+
+        Args:
+            entry: ScreenshotEntry
+            cached_names: cached_names() sonucu; verilirse dosya sistemine bakılmaz
+
+        Returns:
+            Küçük resim yolu veya önbellekte yoksa None
+        """
+        name = self.key(entry)
+        path = os.path.join(self.directory, name)
+        if cached_names is not None:
+            return path if name in cached_names else None
+        return path if os.path.exists(path) else None
+
+    def request(self, entry, callback):
+        """
+        Küçük resmi arka planda üret
+
+        Args:
+            entry: ScreenshotEntry
+            callback: callback(entry, küçük resim yolu veya None); havuz iş
+                parçacığından çağrılır
+        """
+        name = self.key(entry)
+        with self._lock:
+            # Kapatılmış havuza iş verilemez; aynı dosya için ikinci bir üretim başlatma
+            if self._closed or name in self._pending:
+                return
+            future = self._executor.submit(self._generate, entry, name)
+            self._pending[name] = future
+
+        def done(future):
+            with self._lock:
+                self._pending.pop(name, None)
+                closed = self._closed
+            # Üretim kapatmadan önce başlamışsa sonucu artık kimse beklemiyor
+            if not future.cancelled() and not closed:
+                callback(entry, future.result())
+        future.add_done_callback(done)
+
+    def _generate(self, entry, name):
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            return path
+        try:
+            image = cv2.imread(entry.path, reduced_read_flag(entry.width, entry.height, self.size))
+            if image is None:
+                return None
+            height, width = image.shape[:2]
+            scale = min(self.size / width, self.size / height, 1.0)
+            thumbnail = cv2.resize(image, (max(1, round(width * scale)), max(1, round(height * scale))),
+                                   interpolation=cv2.INTER_AREA)
+
+            # Yarım dosya okunmasın diye geçici adla yaz, sonra yeniden adlandır
+            temporary_path = os.path.join(self.directory, f".{name}")
+            if not cv2.imwrite(temporary_path, thumbnail, [cv2.IMWRITE_JPEG_QUALITY, THUMBNAIL_QUALITY]):
+                return None
+            os.replace(temporary_path, path)
+            return path
+        except Exception:
+            return None
+
+    def prune(self, entries):
+        """
+        Artık hiçbir kayda ait olmayan küçük resimleri sil (arka planda)
+
+        Args:
+            entries: Güncel ScreenshotEntry listesi
+        """
+        valid = {self.key(entry) for entry in entries}
+
+        def remove_stale():
+            for name in self.cached_names() - valid:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+        with self._lock:
+            if not self._closed:
+                self._executor.submit(remove_stale)
+
+    def cancel(self):
+        """Henüz başlamamış üretimleri iptal et"""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.cancel()
+
+    def close(self):
+        """Bekleyen işleri iptal et ve havuzu kapat (çalışan işler bitirilir)"""
+        with self._lock:
+            self._closed = True
+        # İptal edilen işlerin geri çağrıları kilidi aldığı için kilit dışında kapat
+        self._executor.shutdown(wait=False, cancel_futures=True)
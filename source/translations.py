@@ -107,6 +107,62 @@ class Translations:
                 "en": "Display Mode:",
                 "tr": "Gösterim Modu:"
             },
+            "simulate_cvd": {
+                "en": "Simulate",
+                "tr": "Benzet"
+            },
+            "analysis_resolution": {
+                "en": "Analysis Resolution:",
+                "tr": "Analiz Çözünürlüğü:"
+            },
+            "parallel_strips": {
+                "en": "Parallel Strips:",
+                "tr": "Paralel Şeritler:"
+            },
+            "parallel_strips_auto": {
+                "en": "Auto",
+                "tr": "Otomatik"
+            },
+            "parallel_strips_off": {
+                "en": "Off",
+                "tr": "Kapalı"
+            },
+            "motion_gating": {
+                "en": "Skip detection on static scenes",
+                "tr": "Durağan sahnelerde algılamayı atla"
+            },
+            "stage_timing": {
+                "en": "Show stage timings",
+                "tr": "Aşama sürelerini göster"
+            },
+            "hud_capture": {
+                "en": "Capture",
+                "tr": "Yakalama"
+            },
+            "hud_processed": {
+                "en": "Processed",
+                "tr": "İşlenen"
+            },
+            "hud_display": {
+                "en": "Display",
+                "tr": "Görüntüleme"
+            },
+            "hud_dropped": {
+                "en": "Dropped",
+                "tr": "Atılan"
+            },
+            "hud_latency": {
+                "en": "Latency",
+                "tr": "Gecikme"
+            },
+            "performance_hud": {
+                "en": "Show performance overlay",
+                "tr": "Performans göstergesini göster"
+            },
+            "export_metrics": {
+                "en": "Export Performance Data",
+                "tr": "Performans Verilerini Dışa Aktar"
+            },
             
             # Language settings
             "language": {
@@ -159,6 +215,54 @@ class Translations:
                 "en": "Screenshot exported: {}",
                 "tr": "Ekran görüntüsü dışa aktarıldı: {}"
             },
+            "processing_budget_exceeded": {
+                "en": "Processing is slower than the camera ({:.0f} ms per frame, camera every {:.0f} ms); frames are skipped. A lower analysis resolution can help.",
+                "tr": "İşleme kameradan yavaş (kare başına {:.0f} ms, kamera {:.0f} ms'de bir); kareler atlanıyor. Daha düşük analiz çözünürlüğü yardımcı olabilir."
+            },
+            "processing_failed": {
+                "en": "A frame could not be processed: {}",
+                "tr": "Bir kare işlenemedi: {}"
+            },
+            "processing_budget_ok": {
+                "en": "Processing keeps up with the camera again",
+                "tr": "İşleme yeniden kameraya yetişiyor"
+            },
+            "files_exported": {
+                "en": "{} of {} screenshots exported to {}",
+                "tr": "{1} ekran görüntüsünden {0} tanesi {2} klasörüne aktarıldı"
+            },
+            "files_deleted": {
+                "en": "{} screenshots deleted",
+                "tr": "{} ekran görüntüsü silindi"
+            },
+            "recording_started": {
+                "en": "Recording to {}",
+                "tr": "Kaydediliyor: {}"
+            },
+            "recording_saved": {
+                "en": "Recording saved: {} ({} frames, {} dropped)",
+                "tr": "Kayıt kaydedildi: {} ({} kare, {} kare atlandı)"
+            },
+            "recording_failed": {
+                "en": "Recording failed: {}",
+                "tr": "Kayıt başarısız: {}"
+            },
+            "burst_saving": {
+                "en": "Saving burst of {} frames...",
+                "tr": "{} karelik seri çekim kaydediliyor..."
+            },
+            "burst_saved": {
+                "en": "Burst saved: {} of {} frames",
+                "tr": "Seri çekim kaydedildi: {} / {} kare"
+            },
+            "burst_failed": {
+                "en": "Failed to save burst: {}",
+                "tr": "Seri çekim kaydedilemedi: {}"
+            },
+            "metrics_exported": {
+                "en": "Performance data exported: {}",
+                "tr": "Performans verileri dışa aktarıldı: {}"
+            },
             
             # Dialog messages
             "delete_confirmation": {
@@ -169,6 +273,10 @@ class Translations:
                 "en": "Are you sure you want to delete the file {}?",
                 "tr": "{} dosyasını silmek istediğinize emin misiniz?"
             },
+            "delete_confirm_multiple": {
+                "en": "Are you sure you want to delete {} screenshots?",
+                "tr": "{} ekran görüntüsünü silmek istediğinize emin misiniz?"
+            },
             "error": {
                 "en": "Error",
                 "tr": "Hata"
@@ -185,6 +293,26 @@ class Translations:
                 "en": "Export Screenshot",
                 "tr": "Ekran Görüntüsünü Dışa Aktar"
             },
+            "export_format_prompt": {
+                "en": "Format of the exported files:",
+                "tr": "Dışa aktarılan dosyaların biçimi:"
+            },
+            "export_format_original": {
+                "en": "Keep original format",
+                "tr": "Özgün biçimi koru"
+            },
+            "export_progress": {
+                "en": "Exporting screenshots...",
+                "tr": "Ekran görüntüleri dışa aktarılıyor..."
+            },
+            "cancel": {
+                "en": "Cancel",
+                "tr": "İptal"
+            },
+            "export_metrics_title": {
+                "en": "Export Performance Data",
+                "tr": "Performans Verilerini Dışa Aktar"
+            },
             
             # Color names (for detection)
             "red": {
@@ -253,6 +381,58 @@ class Translations:
                 "en": "Control how the app accesses your camera.",
                 "tr": "Uygulamanın kameranıza nasıl erişeceğini kontrol edin."
             },
+            "snapshot_format": {
+                "en": "Screenshot format:",
+                "tr": "Ekran görüntüsü biçimi:"
+            },
+            "record": {
+                "en": "Record",
+                "tr": "Kaydı Başlat"
+            },
+            "stop_recording": {
+                "en": "Stop Recording",
+                "tr": "Kaydı Durdur"
+            },
+            "record_codec": {
+                "en": "Recording format:",
+                "tr": "Kayıt biçimi:"
+            },
+            "save_burst": {
+                "en": "Save Burst",
+                "tr": "Seri Çekimi Kaydet"
+            },
+            "burst_buffer": {
+                "en": "Burst buffer (keep the last frames)",
+                "tr": "Seri çekim tamponu (son kareleri tut)"
+            },
+            "burst_frames": {
+                "en": "Burst length (frames):",
+                "tr": "Seri çekim uzunluğu (kare):"
+            },
+            "burst_memory": {
+                "en": "Burst memory limit:",
+                "tr": "Seri çekim bellek sınırı:"
+            },
+            "snapshot_format_png_small": {
+                "en": "PNG (smaller, slower)",
+                "tr": "PNG (daha küçük, daha yavaş)"
+            },
+            "record_codec_tooltip": {
+                "en": "Video codec for recordings of the processed view",
+                "tr": "İşlenmiş görüntü kayıtları için video kodeği"
+            },
+            "burst_buffer_tooltip": {
+                "en": "Keeps the most recent camera frames in memory so a fast moving scene can be saved afterwards. Every frame is decoded while this is on.",
+                "tr": "Hızlı değişen bir sahnenin sonradan kaydedilebilmesi için son kamera karelerini bellekte tutar. Açıkken her kare çözülür."
+            },
+            "burst_memory_tooltip": {
+                "en": "Upper limit for the burst buffer; fewer frames are kept at high resolutions",
+                "tr": "Seri çekim tamponunun üst sınırı; yüksek çözünürlükte daha az kare tutulur"
+            },
+            "snapshot_format_tooltip": {
+                "en": "PNG keeps every pixel, JPEG and WebP make much smaller files",
+                "tr": "PNG her pikseli korur, JPEG ve WebP çok daha küçük dosyalar oluşturur"
+            },
             "current_permission_status": {
                 "en": "Current status",
                 "tr": "Mevcut durum"
@@ -283,6 +463,14 @@ class Translations:
                 "en": "Take a snapshot of the current camera view",
                 "tr": "Mevcut kamera görüntüsünün ekran görüntüsünü alın"
             },
+            "record_tooltip": {
+                "en": "Record the processed camera view (with detection boxes) to a video file",
+                "tr": "İşlenmiş kamera görüntüsünü (algılama kutularıyla) video dosyasına kaydedin"
+            },
+            "save_burst_tooltip": {
+                "en": "Save the frames kept in the burst buffer (the moments just before the click)",
+                "tr": "Seri çekim tamponundaki kareleri kaydedin (tıklamadan hemen önceki anlar)"
+            },
             "gallery_tooltip": {
                 "en": "View your saved snapshots",
                 "tr": "Kayıtlı ekran görüntülerinizi görüntüleyin"
@@ -316,8 +504,36 @@ class Translations:
                 "tr": "Ekranın kontrastını ayarlayın"
             },
             "display_mode_tooltip": {
-                "en": "Choose a display mode that fits your needs",
-                "tr": "İhtiyaçlarınıza uygun bir görüntüleme modu seçin"
+                "en": "Choose a display mode that fits your needs: colors are adjusted so that differences lost to the selected color vision deficiency become visible",
+                "tr": "İhtiyaçlarınıza uygun bir görüntüleme modu seçin: renkler, seçilen renk körlüğünde kaybolan farklar görünür olacak şekilde ayarlanır"
+            },
+            "simulate_cvd_tooltip": {
+                "en": "Show how the camera view looks with the selected color vision deficiency instead of correcting it",
+                "tr": "Kamera görüntüsünü düzeltmek yerine seçilen renk körlüğüyle nasıl göründüğünü gösterin"
+            },
+            "analysis_resolution_tooltip": {
+                "en": "Detect colors on a smaller copy of the frame for higher speed",
+                "tr": "Daha yüksek hız için renkleri karenin küçültülmüş kopyasında algıla"
+            },
+            "parallel_strips_tooltip": {
+                "en": "Split large frames into horizontal strips detected in parallel on several CPU cores",
+                "tr": "Büyük kareleri birden çok işlemci çekirdeğinde paralel algılanan yatay şeritlere böl"
+            },
+            "motion_gating_tooltip": {
+                "en": "Reuse the previous detection while the camera view does not change (saves CPU)",
+                "tr": "Kamera görüntüsü değişmediği sürece önceki algılamayı kullan (işlemci tasarrufu)"
+            },
+            "stage_timing_tooltip": {
+                "en": "Measure how long each processing step takes, to find what slows the video down",
+                "tr": "Görüntüyü neyin yavaşlattığını bulmak için her işlem adımının süresini ölç"
+            },
+            "performance_hud_tooltip": {
+                "en": "Show camera, processing and display speed, dropped frames and delay on the video",
+                "tr": "Kamera, işleme ve görüntüleme hızını, atlanan kareleri ve gecikmeyi görüntü üzerinde göster"
+            },
+            "export_metrics_tooltip": {
+                "en": "Save the speed and delay measurements of this camera session as CSV or JSON",
+                "tr": "Bu kamera oturumunun hız ve gecikme ölçümlerini CSV veya JSON olarak kaydet"
             },
             
             # Permission button tooltips
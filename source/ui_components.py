@@ -1,6 +1,6 @@
 import os
 from PyQt5.QtWidgets import (QLabel, QPushButton, QVBoxLayout, QHBoxLayout, 
-                           QWidget, QSlider, QCheckBox, QGroupBox, QGridLayout, QComboBox)
+                           QWidget, QSlider, QCheckBox, QGroupBox, QGridLayout, QComboBox, QSpinBox)
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QIcon
 
@@ -121,6 +121,26 @@ def create_camera_controls(parent):
     snapshot_button.setVisible(parent.camera_manager.camera_on)
     parent.snapshot_button = snapshot_button
     
+    # Seri çekim butonu: yalnızca kamera açık ve tampon etkinken görünür
+    burst_button = create_button(
+        tr.get_text("save_burst"),
+        tr.get_text("save_burst_tooltip"),
+        "snapshot",
+        parent.take_burst
+    )
+    burst_button.setVisible(parent.camera_manager.camera_on and parent.camera_manager.burst.buffer.enabled)
+    parent.burst_button = burst_button
+    
+    # Video kayıt butonu (kayıt sırasında "Kaydı Durdur" olur)
+    record_button = create_button(
+        tr.get_text("record"),
+        tr.get_text("record_tooltip"),
+        "default",
+        parent.toggle_recording
+    )
+    record_button.setVisible(parent.camera_manager.camera_on)
+    parent.record_button = record_button
+    
     gallery_button = create_button(
         tr.get_text("gallery"),
         tr.get_text("gallery_tooltip"),
@@ -131,6 +151,8 @@ def create_camera_controls(parent):
     
     button_layout.addWidget(toggle_camera_button)
     button_layout.addWidget(snapshot_button)
+    button_layout.addWidget(burst_button)
+    button_layout.addWidget(record_button)
     button_layout.addWidget(gallery_button)
     
     return button_layout
@@ -191,9 +213,77 @@ def create_display_settings_group(parent):
     parent.display_mode_label = QLabel(tr.get_text("display_mode"))
     display_layout.addWidget(parent.display_mode_label, 2, 0)
     parent.display_mode = QComboBox()
-    parent.display_mode.addItems(["Normal", "Deuteranopia", "Protanopia", "Tritanopia"])
+    for mode in ("Normal", "Deuteranopia", "Protanopia", "Tritanopia"):
+        parent.display_mode.addItem(mode, mode.lower())
+    parent.display_mode.setCurrentIndex(max(parent.display_mode.findData(parent.settings.value("display_mode", "normal")), 0))
     parent.display_mode.setToolTip(tr.get_text("display_mode_tooltip"))
-    display_layout.addWidget(parent.display_mode, 2, 1)
+    parent.display_mode.currentIndexChanged.connect(parent.change_display_mode)
+    
+    # Düzeltme yerine renk körlüğü benzetimi (ör. tasarım kontrolü için)
+    parent.simulate_cvd_checkbox = QCheckBox(tr.get_text("simulate_cvd"))
+    parent.simulate_cvd_checkbox.setChecked(parent.settings.value("simulate_cvd", False, type=bool))
+    parent.simulate_cvd_checkbox.setToolTip(tr.get_text("simulate_cvd_tooltip"))
+    parent.simulate_cvd_checkbox.toggled.connect(parent.change_display_mode)
+    display_mode_layout = QHBoxLayout()
+    display_mode_layout.addWidget(parent.display_mode, 1)
+    display_mode_layout.addWidget(parent.simulate_cvd_checkbox)
+    display_layout.addLayout(display_mode_layout, 2, 1)
+    
+    # Analiz çözünürlüğü
+    parent.analysis_resolution_label = QLabel(tr.get_text("analysis_resolution"))
+    display_layout.addWidget(parent.analysis_resolution_label, 3, 0)
+    parent.analysis_resolution = QComboBox()
+    for scale in (1.0, 0.75, 0.5, 0.25):
+        parent.analysis_resolution.addItem(f"{int(scale * 100)}%", scale)
+    current_scale = float(parent.settings.value("analysis_scale", 1.0))
+    index = parent.analysis_resolution.findData(current_scale)
+    parent.analysis_resolution.setCurrentIndex(max(index, 0))
+    parent.analysis_resolution.setToolTip(tr.get_text("analysis_resolution_tooltip"))
+    parent.analysis_resolution.currentIndexChanged.connect(parent.change_analysis_resolution)
+    display_layout.addWidget(parent.analysis_resolution, 3, 1)
+    
+    # Büyük karelerde tespiti paralel şeritlere bölme (-1: otomatik)
+    parent.parallel_strips_label = QLabel(tr.get_text("parallel_strips"))
+    display_layout.addWidget(parent.parallel_strips_label, 4, 0)
+    parent.parallel_strips = QComboBox()
+    parent.parallel_strips.addItem(tr.get_text("parallel_strips_auto"), -1)
+    parent.parallel_strips.addItem(tr.get_text("parallel_strips_off"), 0)
+    for strips in (2, 4, 8):
+        parent.parallel_strips.addItem(str(strips), strips)
+    index = parent.parallel_strips.findData(parent.settings.value("parallel_strips", -1, type=int))
+    parent.parallel_strips.setCurrentIndex(max(index, 0))
+    parent.parallel_strips.setToolTip(tr.get_text("parallel_strips_tooltip"))
+    parent.parallel_strips.currentIndexChanged.connect(parent.change_parallel_strips)
+    display_layout.addWidget(parent.parallel_strips, 4, 1)
+    
+    # Durağan sahnelerde tespiti atlama
+    parent.motion_gating_checkbox = QCheckBox(tr.get_text("motion_gating"))
+    parent.motion_gating_checkbox.setChecked(parent.settings.value("motion_gating", True, type=bool))
+    parent.motion_gating_checkbox.setToolTip(tr.get_text("motion_gating_tooltip"))
+    parent.motion_gating_checkbox.toggled.connect(parent.change_motion_gating)
+    display_layout.addWidget(parent.motion_gating_checkbox, 5, 0, 1, 2)
+    
+    # İşlem aşamalarının sürelerini gösterme
+    parent.stage_timing_checkbox = QCheckBox(tr.get_text("stage_timing"))
+    parent.stage_timing_checkbox.setChecked(parent.settings.value("stage_timing", False, type=bool))
+    parent.stage_timing_checkbox.setToolTip(tr.get_text("stage_timing_tooltip"))
+    parent.stage_timing_checkbox.toggled.connect(parent.change_stage_timing)
+    display_layout.addWidget(parent.stage_timing_checkbox, 6, 0, 1, 2)
+    
+    # Hız ve gecikme göstergesi
+    parent.performance_hud_checkbox = QCheckBox(tr.get_text("performance_hud"))
+    parent.performance_hud_checkbox.setChecked(parent.settings.value("performance_hud", False, type=bool))
+    parent.performance_hud_checkbox.setToolTip(tr.get_text("performance_hud_tooltip"))
+    parent.performance_hud_checkbox.toggled.connect(parent.change_performance_hud)
+    display_layout.addWidget(parent.performance_hud_checkbox, 7, 0, 1, 2)
+    
+    # Ölçümleri dışa aktarma butonu
+    parent.export_metrics_button = create_button(
+        tr.get_text("export_metrics"),
+        tr.get_text("export_metrics_tooltip"),
+        callback=parent.export_performance_metrics
+    )
+    display_layout.addWidget(parent.export_metrics_button, 8, 0, 1, 2)
     
     display_group.setLayout(display_layout)
     
@@ -210,6 +300,63 @@ def create_camera_settings_group(parent):
     parent.camera_info_label.setStyleSheet("color: #CCC; font-size: 9pt;")
     camera_layout.addWidget(parent.camera_info_label)
     
+    # Ekran görüntüsü biçimi: (biçim, PNG sıkıştırma seviyesi veya JPEG/WebP kalitesi)
+    parent.snapshot_format_label = QLabel(tr.get_text("snapshot_format"))
+    camera_layout.addWidget(parent.snapshot_format_label)
+    parent.snapshot_format = QComboBox()
+    parent.snapshot_format.addItem("PNG", ('png', 3))
+    parent.snapshot_format.addItem(tr.get_text("snapshot_format_png_small"), ('png', 9))
+    parent.snapshot_format.addItem("JPEG", ('jpg', 95))
+    parent.snapshot_format.addItem("WebP", ('webp', 95))
+    current_format = (parent.settings.value("snapshot_format", "png"),
+                      int(parent.settings.value("snapshot_level", 3)))
+    index = parent.snapshot_format.findData(current_format)
+    parent.snapshot_format.setCurrentIndex(max(index, 0))
+    parent.snapshot_format.setToolTip(tr.get_text("snapshot_format_tooltip"))
+    parent.snapshot_format.currentIndexChanged.connect(parent.change_snapshot_format)
+    camera_layout.addWidget(parent.snapshot_format)
+    
+    # Video kaydı biçimi (FourCC kodeği)
+    parent.record_codec_label = QLabel(tr.get_text("record_codec"))
+    camera_layout.addWidget(parent.record_codec_label)
+    parent.record_codec = QComboBox()
+    parent.record_codec.addItem("MP4 (mp4v)", 'mp4v')
+    parent.record_codec.addItem("AVI (MJPG)", 'MJPG')
+    parent.record_codec.addItem("AVI (XVID)", 'XVID')
+    parent.record_codec.setCurrentIndex(max(parent.record_codec.findData(parent.settings.value("record_codec", "mp4v")), 0))
+    parent.record_codec.setToolTip(tr.get_text("record_codec_tooltip"))
+    parent.record_codec.currentIndexChanged.connect(parent.change_record_codec)
+    camera_layout.addWidget(parent.record_codec)
+    
+    # Seri çekim: son karelerin tutulduğu tampon ve sınırları
+    buffer = parent.camera_manager.burst.buffer
+    parent.burst_checkbox = QCheckBox(tr.get_text("burst_buffer"))
+    parent.burst_checkbox.setChecked(buffer.enabled)
+    parent.burst_checkbox.setToolTip(tr.get_text("burst_buffer_tooltip"))
+    parent.burst_checkbox.toggled.connect(parent.change_burst_enabled)
+    camera_layout.addWidget(parent.burst_checkbox)
+    
+    burst_layout = QGridLayout()
+    parent.burst_frames_label = QLabel(tr.get_text("burst_frames"))
+    burst_layout.addWidget(parent.burst_frames_label, 0, 0)
+    parent.burst_frames = QSpinBox()
+    parent.burst_frames.setRange(2, 600)
+    parent.burst_frames.setValue(buffer.max_frames)
+    parent.burst_frames.valueChanged.connect(parent.change_burst_frames)
+    burst_layout.addWidget(parent.burst_frames, 0, 1)
+    
+    parent.burst_memory_label = QLabel(tr.get_text("burst_memory"))
+    burst_layout.addWidget(parent.burst_memory_label, 1, 0)
+    parent.burst_memory = QSpinBox()
+    parent.burst_memory.setRange(16, 4096)
+    parent.burst_memory.setSingleStep(16)
+    parent.burst_memory.setSuffix(" MB")
+    parent.burst_memory.setValue(buffer.memory_limit_mb)
+    parent.burst_memory.setToolTip(tr.get_text("burst_memory_tooltip"))
+    parent.burst_memory.valueChanged.connect(parent.change_burst_memory)
+    burst_layout.addWidget(parent.burst_memory, 1, 1)
+    camera_layout.addLayout(burst_layout)
+    
     # Mevcut izin durumunu göster
     permission_status_text = ""
     if parent.camera_permission == "granted":
@@ -1,58 +1,278 @@
-import cv2
 import os
+import threading
+import time
 import numpy as np
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 
+# Önceden çizilmiş etiket görüntülerinin (sprite) en fazla kaç tanesi bellekte tutulur
+LABEL_SPRITE_CACHE_SIZE = 256
+
+# Aşama süreleri için her aşamada tutulan son ölçüm sayısı
+STAGE_TIMER_WINDOW = 120
+
+def default_font_path():
+    """Return the path of a system font that supports UTF-8 (Turkish) characters"""
+    if os.name == 'nt':  # Windows
+        return "C:\\Windows\\Fonts\\arial.ttf"
+    # Linux/Mac
+    return "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+@lru_cache(maxsize=32)
+def load_font(font_path, font_size):
+    """
+    Load a TrueType font once per (path, size) pair
+
+    Args:
+        font_path: Path of the TrueType font file
+        font_size: Font size
+
+    Returns:
+        PIL font object (PIL default font if the file cannot be loaded)
+    """
+    try:
+        if os.path.exists(font_path):
+            return ImageFont.truetype(font_path, font_size)
+    except IOError:
+        pass
+    # Fallback to default
+    return ImageFont.load_default()
+
+class LabelSprite:
+    """
+    Pre-rendered text label, stored as a premultiplied BGR layer and its alpha
+    so it can be blended into any BGR image with a single pass over its ROI.
+    """
+
+    def __init__(self, text, text_color, font_size, stroke_color, stroke_width):
+        font = load_font(default_font_path(), font_size)
+        left, top, right, bottom = font.getbbox(text)
+
+        # Sprite'ın çizim noktasına göre konumu (dış çizgi dahil)
+        self.offset_x = left - stroke_width
+        self.offset_y = top - stroke_width
+        width = max(right - left + 2 * stroke_width, 1)
+        height = max(bottom - top + 2 * stroke_width, 1)
+        origin = (-self.offset_x, -self.offset_y)
+
+        # Dış çizgi maskesi: aynı tuvale dört kez çizmek, kareye sırayla
+        # dört kez çizmekle aynı saydamlığı verir
+        stroke_mask = Image.new("L", (width, height), 0)
+        stroke_draw = ImageDraw.Draw(stroke_mask)
+        if stroke_width > 0:
+            for dx, dy in ((-1, -1), (1, -1), (-1, 1), (1, 1)):
+                stroke_draw.text((origin[0] + dx * stroke_width, origin[1] + dy * stroke_width),
+                                 text, font=font, fill=255)
+
+        text_mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(text_mask).text(origin, text, font=font, fill=255)
+
+        stroke_alpha = np.asarray(stroke_mask, dtype=np.float32)[:, :, None] / 255.0
+        text_alpha = np.asarray(text_mask, dtype=np.float32)[:, :, None] / 255.0
+
+        # Colors are given as RGB tuples, the frame is BGR
+        stroke_bgr = np.array(stroke_color[::-1], dtype=np.float32)
+        text_bgr = np.array(text_color[::-1], dtype=np.float32)
+
+        # Önce dış çizgi, sonra metin: iki "over" işlemini tek katmanda birleştir
+        self.premultiplied = stroke_bgr * stroke_alpha * (1.0 - text_alpha) + text_bgr * text_alpha + 0.5
+        self.inverse_alpha = (1.0 - stroke_alpha) * (1.0 - text_alpha)
+        self.width = width
+        self.height = height
+
+    def blend_into(self, img, position):
+        """
+        Blend the sprite into img in place, clipped to the image borders
+
+        Args:
+            img: OpenCV image (BGR format)
+            position: (x, y) drawing position of the text
+        """
+        x0 = position[0] + self.offset_x
+        y0 = position[1] + self.offset_y
+        img_h, img_w = img.shape[:2]
+
+        # Görüntü dışında kalan kısımları kırp
+        left, top = max(x0, 0), max(y0, 0)
+        right, bottom = min(x0 + self.width, img_w), min(y0 + self.height, img_h)
+        if left >= right or top >= bottom:
+            return
+
+        sx, sy = left - x0, top - y0
+        sw, sh = right - left, bottom - top
+        roi = img[top:bottom, left:right]
+        blended = roi * self.inverse_alpha[sy:sy + sh, sx:sx + sw]
+        blended += self.premultiplied[sy:sy + sh, sx:sx + sw]
+        roi[...] = blended
+
+class LabelSpriteCache:
+    """Bounded LRU cache of LabelSprite objects"""
+
+    def __init__(self, max_size=LABEL_SPRITE_CACHE_SIZE):
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+
+    def get(self, text, text_color, font_size, stroke_color, stroke_width):
+        key = (text, tuple(text_color), font_size, tuple(stroke_color), stroke_width)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = LabelSprite(text, key[1], font_size, key[3], stroke_width)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_size:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self._sprites.clear()
+
+    def __len__(self):
+        return len(self._sprites)
+
+label_sprite_cache = LabelSpriteCache()
+
+class BufferPool:
+    """
+    Reusable numpy buffers keyed by name
+
+    A buffer is reallocated only when the requested shape or dtype changes
+    (e.g. on a resolution change), so steady-state frames allocate nothing.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name, shape, dtype=np.uint8):
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype)
+            self._buffers[name] = buffer
+        return buffer
+
+    def clear(self):
+        self._buffers.clear()
+
+class _TimedStage:
+    """Context manager that records the duration of one stage run"""
+    __slots__ = ('_timer', '_name', '_start')
+
+    def __init__(self, timer, name):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._timer.record(self._name, time.perf_counter() - self._start)
+        return False
+
+# Kapalı zamanlayıcının döndürdüğü, hiçbir şey yapmayan paylaşılan context manager
+_NULL_STAGE = nullcontext()
+
+class StageTimer:
+    """
+    Rolling per-stage timing statistics
+
+    Code wraps each stage in ``with timer.stage('name'):``. While the timer
+    is disabled this returns a shared no-op context manager, so the cost is
+    one attribute check per stage. Samples are kept in a bounded window per
+    stage and can be read from another thread (e.g. the UI).
+    """
+
+    def __init__(self, window=STAGE_TIMER_WINDOW):
+        self.enabled = False
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """
+        Return a context manager that times the enclosed block as stage name
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Context manager (no-op while the timer is disabled)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _TimedStage(self, name)
+
+    def record(self, name, seconds):
+        """Add a duration sample (seconds) for stage name"""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """
+        Statistics of the samples in the window, in first-recorded stage order
+
+        Returns:
+            Dictionary: stage name -> {'count', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms'}
+        """
+        with self._lock:
+            snapshot = [(name, np.array(samples)) for name, samples in self._samples.items()]
+
+        stats = {}
+        for name, samples in snapshot:
+            if samples.size == 0:
+                continue
+            samples = samples * 1000.0
+            stats[name] = {
+                'count': int(samples.size),
+                'mean_ms': float(samples.mean()),
+                'p50_ms': float(np.percentile(samples, 50)),
+                'p95_ms': float(np.percentile(samples, 95)),
+                'max_ms': float(samples.max())
+            }
+        return stats
+
+    def format_summary(self):
+        """Return the summary as a fixed-width text table"""
+        stats = self.summary()
+        if not stats:
+            return ""
+        width = max(len(name) for name in stats)
+        lines = [f"{'stage':<{width}} {'mean':>7} {'p50':>7} {'p95':>7} {'max':>7}  (ms)"]
+        for name, values in stats.items():
+            lines.append(f"{name:<{width}} {values['mean_ms']:>7.2f} {values['p50_ms']:>7.2f} "
+                         f"{values['p95_ms']:>7.2f} {values['max_ms']:>7.2f}")
+        return "\n".join(lines)
+
 # Metin çizimi için UTF-8 destekli fonksiyon
 def draw_text_with_utf8(img, text, position, text_color=(255, 255, 255), font_size=20, stroke_color=(0, 0, 0), stroke_width=2):
     """
     Draw text with UTF-8 support using PIL library
-    
+
+    The label is rendered once into a cached sprite and blended only into
+    the region it covers, so the cost does not depend on the image size.
+
     Args:
-        img: OpenCV image (BGR format)
+        img: OpenCV image (BGR format), modified in place
         text: Text string to draw
         position: (x, y) position
         text_color: Text color as RGB tuple
         font_size: Font size
         stroke_color: Outline color
         stroke_width: Outline width
-        
+
     Returns:
         OpenCV image with text drawn
     """
-    # Convert the image from OpenCV BGR format to RGB for PIL
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    pil_img = Image.fromarray(img_rgb)
-    draw = ImageDraw.Draw(pil_img)
-    
-    # Try to load a font that supports UTF-8
-    try:
-        # Try to find a suitable system font (Arial supports Turkish chars)
-        if os.name == 'nt':  # Windows
-            font_path = "C:\\Windows\\Fonts\\arial.ttf"
-        else:  # Linux/Mac
-            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        
-        if not os.path.exists(font_path):
-            # Fallback to default
-            font = ImageFont.load_default()
-        else:
-            font = ImageFont.truetype(font_path, font_size)
-    except IOError:
-        font = ImageFont.load_default()
-    
-    # Draw text with stroke (outline)
-    x, y = position
-    
-    # Draw stroke (outline)
-    draw.text((x-stroke_width, y-stroke_width), text, font=font, fill=stroke_color)
-    draw.text((x+stroke_width, y-stroke_width), text, font=font, fill=stroke_color)
-    draw.text((x-stroke_width, y+stroke_width), text, font=font, fill=stroke_color)
-    draw.text((x+stroke_width, y+stroke_width), text, font=font, fill=stroke_color)
-    
-    # Draw the main text
-    draw.text(position, text, font=font, fill=text_color)
-    
-    # Convert back to OpenCV format (BGR)
-    img_with_text = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-    return img_with_text
+    sprite = label_sprite_cache.get(text, text_color, font_size, stroke_color, stroke_width)
+    sprite.blend_into(img, (int(position[0]), int(position[1])))
+    return img
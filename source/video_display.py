@@ -0,0 +1,78 @@
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QSize, QRect, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter
+
+class VideoDisplay(QWidget):
+    """
+    Kamera oturumu boyunca kalıcı olan görüntü alanı
+
+    Yeni kareler set_frame ile verilir ve paintEvent içinde en-boy oranı
+    korunarak doğrudan ölçeklenip çizilir. Kare başına widget oluşturulmaz
+    ve düzen (layout) yeniden hesaplanmaz; yalnızca widget yeniden boyanır.
+    
+    Kare kopyalanmaz: QImage, BGR numpy tamponunu Format_BGR888 ile doğrudan
+    sarar ve ölçekleme yalnızca çizim sırasında bir kez yapılır. Bu yüzden
+    tamponun içeriği bir sonraki set_frame çağrısına kadar değişmemelidir
+    (FramePipeline.take_processed bunu garanti eder).
+    """
+
+    # Yeni bir kare ilk kez ekrana çizildi
+    frame_painted = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = None
+        self._frame = None
+        self._new_frame = False
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(160, 120)
+
+    def sizeHint(self):
+        # Boyut karelere göre değil, düzene göre belirlenir
+        return QSize(640, 480)
+
+    def set_frame(self, frame):
+        """
+        Gösterilecek yeni kareyi ayarla ve yeniden boyamayı iste
+
+        Args:
+            frame: OpenCV BGR formatında kare (bir sonraki kareye kadar değiştirilmemeli)
+        """
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        h, w, c = frame.shape
+        
+        # QImage tamponu sahiplenmez; Qt kullandığı sürece diziyi canlı tut
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+        self._new_frame = True
+        self.update()
+
+    def clear(self):
+        """Gösterilen kareyi bırak"""
+        self._image = None
+        self._frame = None
+        self._new_frame = False
+        self.update()
+
+    def image_rect(self):
+        """Karenin widget içinde en-boy oranı korunarak ortalanmış alanı"""
+        if self._image is None:
+            return QRect()
+        size = self._image.size().scaled(self.size(), Qt.KeepAspectRatio)
+        x = (self.width() - size.width()) // 2
+        y = (self.height() - size.height()) // 2
+        return QRect(x, y, size.width(), size.height())
+
+    def paintEvent(self, event):
+        if self._image is None:
+            return
+        # Hızlı (en yakın komşu) ölçekleme, önceki QPixmap.scaled davranışıyla aynı
+        painter = QPainter(self)
+        painter.drawImage(self.image_rect(), self._image)
+        painter.end()
+
+        if self._new_frame:
+            self._new_frame = False
+            self.frame_painted.emit()